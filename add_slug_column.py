@@ -1,12 +1,24 @@
 """
 Add slug column to content table and populate it
 """
+import csv
+import io
 import psycopg2
 import os
 from dotenv import load_dotenv
 
 load_dotenv('.env.local')
 
+# Rows per UPDATE transaction
+BATCH_SIZE = 10_000
+
+
+def build_slug(ticker, fiscal_year, fiscal_quarter, filing_type):
+    """Build slug in the form ticker/year/period/type (e.g. aapl/2025/q3/10q)"""
+    period = f"q{fiscal_quarter}" if fiscal_quarter is not None else "fy"
+    return f"{ticker.lower()}/{fiscal_year}/{period}/{filing_type.replace('-', '').lower()}"
+
+
 # Connect to database
 conn = psycopg2.connect(os.getenv('DATABASE_URL'))
 cursor = conn.cursor()
@@ -18,33 +30,69 @@ cursor.execute("""
 """)
 conn.commit()
 
-print("Creating unique index on slug...")
+print("Generating slugs for existing content...")
 cursor.execute("""
-    CREATE UNIQUE INDEX IF NOT EXISTS content_slug_idx ON content(slug);
+    SELECT c.id, co.ticker, f.fiscal_year, f.fiscal_quarter, f.filing_type
+    FROM content c
+    JOIN filings f ON c.filing_id = f.id
+    JOIN companies co ON f.company_id = co.id
+    WHERE c.slug IS NULL;
 """)
-conn.commit()
 
-print("Generating slugs for existing content...")
+# Build slugs client-side so the triple JOIN runs once, not per UPDATE batch,
+# writing them straight into a CSV buffer for COPY
+content_ids = []
+staging_buffer = io.StringIO()
+writer = csv.writer(staging_buffer)
+for content_id, ticker, fiscal_year, fiscal_quarter, filing_type in cursor:
+    content_ids.append(content_id)
+    writer.writerow((content_id, build_slug(ticker, fiscal_year, fiscal_quarter, filing_type)))
+staging_buffer.seek(0)
+
+# Stage (id, slug) pairs in a temp table, then apply them in small
+# transactions so no single UPDATE locks the whole content table
 cursor.execute("""
-    UPDATE content c
-    SET slug = LOWER(co.ticker) || '/' ||
-               CAST(f.fiscal_year AS TEXT) || '/' ||
-               CASE
-                   WHEN f.fiscal_quarter IS NOT NULL
-                   THEN 'q' || CAST(f.fiscal_quarter AS TEXT)
-                   ELSE 'fy'
-               END || '/' ||
-               LOWER(REPLACE(f.filing_type, '-', ''))
-    FROM filings f
-    JOIN companies co ON f.company_id = co.id
-    WHERE c.filing_id = f.id
-    AND c.slug IS NULL;
+    CREATE TEMP TABLE slug_staging (id UUID PRIMARY KEY, slug TEXT)
+    ON COMMIT PRESERVE ROWS;
 """)
-rows_updated = cursor.rowcount
+# COPY streams every row in one command instead of paged INSERT statements
+cursor.copy_expert(
+    "COPY slug_staging (id, slug) FROM STDIN WITH (FORMAT csv)",
+    staging_buffer
+)
 conn.commit()
 
+rows_updated = 0
+for start in range(0, len(content_ids), BATCH_SIZE):
+    batch_ids = content_ids[start:start + BATCH_SIZE]
+    # Slugs can be regenerated, so skip the fsync wait on each batch commit
+    cursor.execute("SET LOCAL synchronous_commit = off;")
+    cursor.execute("""
+        UPDATE content c
+        SET slug = s.slug
+        FROM slug_staging s
+        WHERE c.id = s.id
+        AND s.id = ANY(%s::uuid[])
+        AND c.slug IS NULL;
+    """, (batch_ids,))
+    rows_updated += cursor.rowcount
+    conn.commit()
+    print(f"  Progress: {min(start + BATCH_SIZE, len(content_ids))}/{len(content_ids)}")
+
 print(f"✓ Updated {rows_updated} rows with slugs")
 
+# Build the index only after the backfill so the UPDATEs above don't have to
+# maintain it. CONCURRENTLY avoids blocking writes but cannot run inside a
+# transaction block, hence autocommit.
+print("Creating unique index on slug...")
+conn.autocommit = True
+cursor.execute("""
+    CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS content_slug_idx
+    ON content(slug)
+    WHERE slug IS NOT NULL;
+""")
+conn.autocommit = False
+
 # Verify
 cursor.execute("SELECT ticker, filing_type, fiscal_year, fiscal_quarter, slug FROM content c JOIN filings f ON c.filing_id = f.id JOIN companies co ON f.company_id = co.id LIMIT 5")
 print("\nSample slugs:")
@@ -10,6 +10,7 @@ Can be run with configurable limits and worker count.
 Usage:
     python3 analyze_backfill.py --limit 100 --workers 5
     python3 analyze_backfill.py --limit 500
+    python3 analyze_backfill.py --batch-inference    # Bulk backfill via Bedrock batch jobs
 """
 
 import sys
@@ -40,6 +41,9 @@ Examples:
 
   # Analyze 50 filings with default settings
   python3 analyze_backfill.py --limit 50
+
+  # Submit all pending filings as one Bedrock batch job and ingest results
+  python3 analyze_backfill.py --batch-inference
         """
     )
 
@@ -57,6 +61,13 @@ Examples:
         help='Number of parallel workers (default: 3)'
     )
 
+    parser.add_argument(
+        '--batch-inference',
+        action='store_true',
+        help='Use a Bedrock batch inference job instead of on-demand calls '
+             '(cheaper, slower; needs BEDROCK_BATCH_ROLE_ARN and at least 100 filings)'
+    )
+
     parser.add_argument(
         '--log-level',
         default='INFO',
@@ -101,64 +112,83 @@ def main():
         print()
 
         # Run analysis
-        print(f"Starting analysis with {args.workers} workers...")
-        print()
+        if not args.batch_inference:
+            print(f"Starting analysis with {args.workers} workers...")
+            print()
 
         total_analyzed = 0
         failed_count = 0
 
-        try:
-            # This uses the analyzer's built-in parallelization
-            results = analyzer.analyze_batch(limit=limit, workers=args.workers)
+        if args.batch_inference:
+            filings = analyzer.get_pending_filings(limit=limit)
+            print(f"Submitting {len(filings)} filings as a Bedrock batch job...")
+            job_arn = analyzer.submit_batch_job([filing['filing_id'] for filing in filings])
+            print(f"✓ Submitted {job_arn}")
+            print("Waiting for the job to complete (this can take several hours)...")
+
+            results = analyzer.poll_and_ingest(job_arn)
+            total_analyzed = results['analyzed']
+            failed_count = results['failed']
+
+            print()
+            print("=" * 80)
+            print(f"ANALYSIS COMPLETE - Finished at {datetime.now().isoformat()}")
+            print("=" * 80)
+            print(f"Filings analyzed: {total_analyzed}")
+            print(f"Failed analyses: {failed_count}")
+        else:
+            try:
+                # This uses the analyzer's built-in parallelization
+                results = analyzer.analyze_batch(limit=limit, workers=args.workers)
             
-            if results:
-                total_analyzed = results.get('analyzed', 0)
-                failed_count = results.get('failed', 0)
+                if results:
+                    total_analyzed = results.get('analyzed', 0)
+                    failed_count = results.get('failed', 0)
                 
+                    print()
+                    print("=" * 80)
+                    print(f"ANALYSIS COMPLETE - Finished at {datetime.now().isoformat()}")
+                    print("=" * 80)
+                    print(f"Filings analyzed: {total_analyzed}")
+                    print(f"Failed analyses: {failed_count}")
+                    print(f"Success rate: {(total_analyzed / (total_analyzed + failed_count) * 100):.1f}%" if (total_analyzed + failed_count) > 0 else "N/A")
+                else:
+                    print("No results returned from analyzer")
+
+            except AttributeError:
+                # Fallback: If analyze_batch doesn't exist, use process_company approach
+                print("Note: Using fallback analysis method")
                 print()
-                print("=" * 80)
-                print(f"ANALYSIS COMPLETE - Finished at {datetime.now().isoformat()}")
-                print("=" * 80)
-                print(f"Filings analyzed: {total_analyzed}")
-                print(f"Failed analyses: {failed_count}")
-                print(f"Success rate: {(total_analyzed / (total_analyzed + failed_count) * 100):.1f}%" if (total_analyzed + failed_count) > 0 else "N/A")
-            else:
-                print("No results returned from analyzer")
-
-        except AttributeError:
-            # Fallback: If analyze_batch doesn't exist, use process_company approach
-            print("Note: Using fallback analysis method")
-            print()
             
-            filings = analyzer.get_pending_filings(limit=limit)
-            print(f"Found {len(filings)} pending filings to analyze")
-            print()
+                filings = analyzer.get_pending_filings(limit=limit)
+                print(f"Found {len(filings)} pending filings to analyze")
+                print()
 
-            for idx, filing in enumerate(filings, 1):
-                filing_id = filing['filing_id']
-                ticker = filing['ticker']
-                filing_type = filing['filing_type']
+                for idx, filing in enumerate(filings, 1):
+                    filing_id = filing['filing_id']
+                    ticker = filing['ticker']
+                    filing_type = filing['filing_type']
                 
-                print(f"[{idx}/{len(filings)}] Analyzing {ticker} ({filing_type})...")
+                    print(f"[{idx}/{len(filings)}] Analyzing {ticker} ({filing_type})...")
                 
-                try:
-                    analyzer.analyze_filing(filing_id)
-                    total_analyzed += 1
-                    print(f"  ✓ Analysis complete")
-                except Exception as e:
-                    error_msg = str(e)[:100]
-                    print(f"  ✗ Error: {error_msg}")
-                    failed_count += 1
+                    try:
+                        analyzer.analyze_filing(filing_id)
+                        total_analyzed += 1
+                        print(f"  ✓ Analysis complete")
+                    except Exception as e:
+                        error_msg = str(e)[:100]
+                        print(f"  ✗ Error: {error_msg}")
+                        failed_count += 1
                 
-                print()
+                    print()
 
-            print("=" * 80)
-            print(f"ANALYSIS COMPLETE - Finished at {datetime.now().isoformat()}")
-            print("=" * 80)
-            print(f"Filings analyzed: {total_analyzed}")
-            print(f"Failed analyses: {failed_count}")
-            if total_analyzed + failed_count > 0:
-                print(f"Success rate: {(total_analyzed / (total_analyzed + failed_count) * 100):.1f}%")
+                print("=" * 80)
+                print(f"ANALYSIS COMPLETE - Finished at {datetime.now().isoformat()}")
+                print("=" * 80)
+                print(f"Filings analyzed: {total_analyzed}")
+                print(f"Failed analyses: {failed_count}")
+                if total_analyzed + failed_count > 0:
+                    print(f"Success rate: {(total_analyzed / (total_analyzed + failed_count) * 100):.1f}%")
 
         # Write summary for GitHub Actions
         print()
@@ -2,8 +2,10 @@
 """
 Parallel filing analyzer - processes multiple filings concurrently
 
-This script uses concurrent.futures to process multiple filings simultaneously
-with Bedrock API, dramatically reducing total execution time.
+This script uses an asyncio event loop to keep multiple Bedrock requests in
+flight at once, dramatically reducing total execution time. Concurrency is
+bounded by an asyncio.Semaphore sized from --workers, and Bedrock calls share a
+BedrockRateLimiter that backs off on throttling and recovers additively.
 
 Usage:
     python3 analyze_parallel.py                    # Analyze with default workers
@@ -12,22 +14,35 @@ Usage:
     python3 analyze_parallel.py --dry-run           # Preview without saving
 """
 import sys
+import asyncio
 import argparse
-from typing import List, Tuple, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import psycopg2
-from datetime import datetime
-
-from pipeline.utils import get_config, PipelineLogger, setup_root_logger
-from pipeline.analyzers import ClaudeAnalyzer, AnalysisType
+import itertools
+import time
+from typing import Iterable, Iterator, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from psycopg2.pool import ThreadedConnectionPool
+
+from pipeline.utils import (
+    get_config,
+    PipelineLogger,
+    setup_root_logger,
+    queued_logger,
+    create_connection_pool,
+    pooled_connection
+)
+from pipeline.analyzers import ClaudeAnalyzer, AnalysisType, BedrockRateLimiter, create_aws_clients
 
 
 def analyze_filing(
     filing_id: str,
     ticker: str,
     filing_type: str,
+    pool: ThreadedConnectionPool,
     config,
-    logger: PipelineLogger
+    logger: PipelineLogger,
+    rate_limiter: BedrockRateLimiter,
+    aws_clients: tuple,
+    summarize_sections: bool = False
 ) -> Tuple[str, bool, str]:
     """
     Analyze a single filing
@@ -36,17 +51,18 @@ def analyze_filing(
         (filing_id, success, message)
     """
     try:
-        # Create a new connection for this thread
-        conn = psycopg2.connect(config.database.url)
-        analyzer = ClaudeAnalyzer(config, conn, logger)
-
-        content_id = analyzer.process_filing(
-            filing_id=filing_id,
-            analysis_type=AnalysisType.DEEP_ANALYSIS,
-            skip_existing=True
-        )
-
-        conn.close()
+        # Borrow a pooled connection for this thread
+        with pooled_connection(pool) as conn:
+            analyzer = ClaudeAnalyzer(
+                config, conn, logger, rate_limiter=rate_limiter, aws_clients=aws_clients,
+                summarize_sections=summarize_sections
+            )
+
+            content_id = analyzer.process_filing(
+                filing_id=filing_id,
+                analysis_type=AnalysisType.DEEP_ANALYSIS,
+                skip_existing=True
+            )
 
         if content_id:
             return (filing_id, True, f"✓ {ticker} {filing_type}")
@@ -57,25 +73,236 @@ def analyze_filing(
         return (filing_id, False, f"✗ {ticker} {filing_type}: {str(e)[:100]}")
 
 
-def get_pending_filings(conn, limit: int = 500) -> List[Tuple[str, str, str, str]]:
-    """Get list of pending filings to analyze"""
-    cursor = conn.cursor()
-    cursor.execute(f"""
-        SELECT f.id, c.ticker, f.filing_type, c.name
-        FROM filings f
-        JOIN companies c ON f.company_id = c.id
-        WHERE f.status = 'pending'
-        AND NOT EXISTS (
-            SELECT 1 FROM content
-            WHERE filing_id = f.id
+async def analyze_filing_async(
+    semaphore: asyncio.Semaphore,
+    filing_id: str,
+    ticker: str,
+    filing_type: str,
+    pool: ThreadedConnectionPool,
+    config,
+    logger: PipelineLogger,
+    rate_limiter: BedrockRateLimiter,
+    aws_clients: tuple,
+    summarize_sections: bool = False
+) -> Tuple[str, bool, str]:
+    """
+    Analyze a single filing without blocking the event loop
+
+    The analyzer's boto3 and psycopg2 calls are blocking, so the work runs
+    on a worker thread. The caller acquires a semaphore slot before
+    scheduling; it is released here once the filing is done.
+    """
+    try:
+        return await asyncio.to_thread(
+            analyze_filing,
+            filing_id,
+            ticker,
+            filing_type,
+            pool,
+            config,
+            logger,
+            rate_limiter,
+            aws_clients,
+            summarize_sections
         )
-        ORDER BY f.filing_date DESC
-        LIMIT {limit}
-    """)
+    finally:
+        semaphore.release()
+
+
+async def run_all(
+    pending_filings: Iterable[Tuple[str, str, str, str]],
+    workers: int,
+    pool: ThreadedConnectionPool,
+    config,
+    logger: PipelineLogger,
+    summarize_sections: bool = False
+) -> Tuple[int, int]:
+    """
+    Analyze all pending filings concurrently
+
+    Rows are pulled from pending_filings only as worker slots free up, so
+    analysis starts on the first page while later pages are still unread.
+
+    Returns:
+        (successful, failed)
+    """
+    # The default executor is sized from CPU count, which would silently cap
+    # concurrency below --workers on small CI runners
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=workers)
+    )
+
+    # Worker threads are capped at --workers; the limiter shrinks in-flight
+    # Bedrock calls below that when the account is being throttled
+    semaphore = asyncio.Semaphore(workers)
+    rate_limiter = BedrockRateLimiter(max_concurrency=workers)
+
+    # boto3 clients are thread-safe; sharing one pair keeps a single warm
+    # HTTP pool per service instead of building clients per filing
+    aws_clients = create_aws_clients(config, max_pool_connections=workers * 2)
+
+    counts = {'successful': 0, 'failed': 0}
+
+    # Progress lines are written by a background thread so the event loop
+    # never waits on stdout between completions
+    with queued_logger('parallel_analyze.progress') as progress:
+
+        # Report tasks as they finish
+        def report(task: asyncio.Task):
+            filing_id, success, message = task.result()
+            counts['successful' if success else 'failed'] += 1
+            completed = counts['successful'] + counts['failed']
+            progress.info(f"[{completed:3d}] {message}")
+
+        tasks = set()
+        for filing_id, ticker, filing_type, _ in pending_filings:
+            await semaphore.acquire()
+            task = asyncio.create_task(
+                analyze_filing_async(
+                    semaphore, filing_id, ticker, filing_type, pool, config, logger, rate_limiter,
+                    aws_clients, summarize_sections
+                )
+            )
+            task.add_done_callback(report)
+            task.add_done_callback(tasks.discard)
+            tasks.add(task)
+
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    return counts['successful'], counts['failed']
+
 
-    filings = cursor.fetchall()
-    cursor.close()
-    return filings
+def get_pending_filings(conn, limit: int = 500) -> Iterator[Tuple[str, str, str, str]]:
+    """
+    Stream pending filings to analyze
+
+    Uses a server-side cursor so rows arrive in pages of 200 and memory
+    stays flat however large --limit is. The connection must stay open
+    (and its transaction uncommitted) until the generator is exhausted.
+    """
+    cursor = conn.cursor(name='pending_filings_cur')
+    cursor.itersize = 200
+    try:
+        cursor.execute("""
+            SELECT f.id, c.ticker, f.filing_type, c.name
+            FROM filings f
+            JOIN companies c ON f.company_id = c.id
+            WHERE f.status = 'pending'
+            AND NOT EXISTS (
+                SELECT 1 FROM content
+                WHERE filing_id = f.id
+            )
+            ORDER BY f.filing_date DESC
+            LIMIT %s
+        """, (limit,))
+
+        for row in cursor:
+            yield row
+    finally:
+        cursor.close()
+
+
+def run_analyze(
+    workers: int = 5,
+    limit: int = 500,
+    dry_run: bool = False,
+    summarize_sections: bool = False
+) -> Tuple[int, int]:
+    """
+    Analyze pending filings concurrently
+
+    Can be called in-process (orchestrate_parallel.py runs it on a thread
+    alongside run_generate) as well as from the command line.
+
+    Args:
+        workers: Number of concurrent analysis workers
+        limit: Maximum filings to process
+        dry_run: Preview without actually analyzing
+        summarize_sections: Condense over-long sections instead of
+            truncating them (one extra Bedrock call per such section)
+
+    Returns:
+        (successful, failed)
+
+    Raises:
+        ConnectionError: If the database is unreachable
+    """
+    # Setup logging
+    root_logger = setup_root_logger()
+    logger = PipelineLogger(root_logger, 'parallel_analyze')
+
+    # Load config
+    config = get_config()
+
+    print("\n" + "=" * 70)
+    print("PARALLEL FILING ANALYZER")
+    print("=" * 70)
+    print(f"Workers: {workers}")
+    print(f"Limit: {limit} filings")
+    print(f"Dry-run: {dry_run}")
+    print(f"Summarize sections: {summarize_sections}")
+    print("=" * 70 + "\n")
+
+    # Open one pool for the whole run
+    try:
+        pool = create_connection_pool(config, min_size=workers, max_size=workers * 2)
+    except Exception as e:
+        raise ConnectionError(f"Failed to connect to database: {e}") from e
+
+    try:
+        # Hold one connection for the pending-filings cursor while the
+        # workers borrow their own
+        with pooled_connection(pool) as conn:
+            pending_filings = get_pending_filings(conn, limit)
+            first = next(pending_filings, None)
+
+            if first is None:
+                print("✓ No pending filings to analyze")
+                return 0, 0
+
+            pending_filings = itertools.chain([first], pending_filings)
+
+            if dry_run:
+                print("DRY-RUN MODE: Showing filings that would be analyzed:")
+                for i, (filing_id, ticker, filing_type, company_name) in enumerate(
+                    itertools.islice(pending_filings, 10), 1
+                ):
+                    print(f"  {i}. {ticker} {filing_type}")
+                remaining = sum(1 for _ in pending_filings)
+                if remaining:
+                    print(f"  ... and {remaining} more")
+                return 0, 0
+
+            print("Streaming pending filings\n")
+
+            # Analyze concurrently
+            start_time = time.monotonic()
+            successful, failed = asyncio.run(
+                run_all(pending_filings, workers, pool, config, logger, summarize_sections)
+            )
+
+        # Summary
+        total = successful + failed
+        duration = time.monotonic() - start_time
+        avg_time = duration / total if total else 0
+
+        print("\n" + "=" * 70)
+        print("ANALYSIS COMPLETE")
+        print("=" * 70)
+        print(f"Successful: {successful}")
+        print(f"Failed: {failed}")
+        print(f"Total: {total}")
+        print(f"Duration: {duration:.1f} seconds")
+        print(f"Avg time per filing: {avg_time:.1f} seconds")
+        print("=" * 70 + "\n")
+
+        if failed > 0:
+            print(f"⚠ {failed} filings failed to analyze")
+
+        return successful, failed
+    finally:
+        pool.closeall()
 
 
 def main():
@@ -100,6 +327,11 @@ def main():
         action='store_true',
         help='Preview without actually analyzing'
     )
+    parser.add_argument(
+        '--summarize-sections',
+        action='store_true',
+        help='Condense sections too long for the prompt instead of truncating them'
+    )
 
     args = parser.parse_args()
 
@@ -108,94 +340,12 @@ def main():
         print("✗ Workers must be between 1 and 15")
         sys.exit(1)
 
-    # Setup logging
-    root_logger = setup_root_logger()
-    logger = PipelineLogger(root_logger, 'parallel_analyze')
-
-    # Load config
-    config = get_config()
-
-    print("\n" + "=" * 70)
-    print("PARALLEL FILING ANALYZER")
-    print("=" * 70)
-    print(f"Workers: {args.workers}")
-    print(f"Limit: {args.limit} filings")
-    print(f"Dry-run: {args.dry_run}")
-    print("=" * 70 + "\n")
-
-    # Connect and get pending filings
     try:
-        conn = psycopg2.connect(config.database.url)
-        pending_filings = get_pending_filings(conn, args.limit)
-        conn.close()
-    except Exception as e:
-        print(f"✗ Failed to connect to database: {e}")
+        run_analyze(args.workers, args.limit, args.dry_run, args.summarize_sections)
+    except ConnectionError as e:
+        print(f"✗ {e}")
         sys.exit(1)
 
-    if not pending_filings:
-        print("✓ No pending filings to analyze")
-        return
-
-    print(f"Found {len(pending_filings)} pending filings\n")
-
-    if args.dry_run:
-        print("DRY-RUN MODE: Showing filings that would be analyzed:")
-        for i, (filing_id, ticker, filing_type, company_name) in enumerate(pending_filings[:10], 1):
-            print(f"  {i}. {ticker} {filing_type}")
-        if len(pending_filings) > 10:
-            print(f"  ... and {len(pending_filings) - 10} more")
-        return
-
-    # Analyze in parallel
-    successful = 0
-    failed = 0
-    start_time = datetime.now()
-
-    with ThreadPoolExecutor(max_workers=args.workers) as executor:
-        # Submit all tasks
-        futures = {
-            executor.submit(
-                analyze_filing,
-                filing_id,
-                ticker,
-                filing_type,
-                config,
-                logger
-            ): (filing_id, ticker, filing_type)
-            for filing_id, ticker, filing_type, _ in pending_filings
-        }
-
-        # Process completed tasks as they finish
-        completed = 0
-        for future in as_completed(futures):
-            completed += 1
-            filing_id, success, message = future.result()
-
-            status = "✓" if success else "✗"
-            print(f"[{completed:3d}/{len(pending_filings)}] {message}")
-
-            if success:
-                successful += 1
-            else:
-                failed += 1
-
-    # Summary
-    duration = (datetime.now() - start_time).total_seconds()
-    avg_time = duration / len(pending_filings) if pending_filings else 0
-
-    print("\n" + "=" * 70)
-    print("ANALYSIS COMPLETE")
-    print("=" * 70)
-    print(f"Successful: {successful}")
-    print(f"Failed: {failed}")
-    print(f"Total: {len(pending_filings)}")
-    print(f"Duration: {duration:.1f} seconds")
-    print(f"Avg time per filing: {avg_time:.1f} seconds")
-    print("=" * 70 + "\n")
-
-    if failed > 0:
-        print(f"⚠ {failed} filings failed to analyze")
-
 
 if __name__ == '__main__':
     main()
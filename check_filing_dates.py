@@ -3,6 +3,7 @@
 Quick script to check the latest filing dates in the database
 """
 import os
+import itertools
 import psycopg2
 from datetime import datetime
 
@@ -30,7 +31,9 @@ SELECT
     f.accession_number
 FROM companies c
 LEFT JOIN LATERAL (
-    SELECT * FROM filings
+    -- Only columns covered by idx_filings_company_date_desc (index-only scan)
+    SELECT filing_type, filing_date, period_end_date, fiscal_year, fiscal_quarter, accession_number
+    FROM filings
     WHERE company_id = c.id
     ORDER BY filing_date DESC
     LIMIT 1
@@ -45,58 +48,62 @@ print("=" * 100)
 print(f"{'Ticker':<8} {'Company':<20} {'Type':<6} {'Filing Date':<12} {'Period End':<12} {'FY':<6} {'Q':<3} {'Accession':<20}")
 print("-" * 100)
 
-cursor.execute(query)
-rows = cursor.fetchall()
+# Stream rows from a server-side cursor instead of materializing them all
+with conn.cursor(name='filings_stream') as stream:
+    stream.itersize = 2000
+    stream.execute(query)
 
-for row in rows:
-    ticker, name, filing_type, filing_date, period_end, fy, fq, accession = row
+    for row in stream:
+        ticker, name, filing_type, filing_date, period_end, fy, fq, accession = row
 
-    # Format values
-    name_short = name[:18] + '..' if name and len(name) > 20 else (name or 'N/A')
-    filing_type_str = filing_type or 'NONE'
-    filing_date_str = filing_date.strftime('%Y-%m-%d') if filing_date else 'N/A'
-    period_end_str = period_end.strftime('%Y-%m-%d') if period_end else 'N/A'
-    fy_str = str(fy) if fy else 'N/A'
-    fq_str = str(fq) if fq else 'N/A'
-    accession_str = accession[:18] + '..' if accession and len(accession) > 20 else (accession or 'N/A')
+        # Format values
+        name_short = name[:18] + '..' if name and len(name) > 20 else (name or 'N/A')
+        filing_type_str = filing_type or 'NONE'
+        filing_date_str = filing_date.isoformat() if filing_date else 'N/A'
+        period_end_str = period_end.isoformat() if period_end else 'N/A'
+        fy_str = str(fy) if fy else 'N/A'
+        fq_str = str(fq) if fq else 'N/A'
+        accession_str = accession[:18] + '..' if accession and len(accession) > 20 else (accession or 'N/A')
 
-    print(f"{ticker:<8} {name_short:<20} {filing_type_str:<6} {filing_date_str:<12} {period_end_str:<12} {fy_str:<6} {fq_str:<3} {accession_str:<20}")
+        print(f"{ticker:<8} {name_short:<20} {filing_type_str:<6} {filing_date_str:<12} {period_end_str:<12} {fy_str:<6} {fq_str:<3} {accession_str:<20}")
 
 print("\n" + "=" * 100)
 print("FILING DATE ANALYSIS")
 print("=" * 100)
 
-# Check if any filings are after November 6, 2024
+# Count filings after November 6, 2024, find the most recent filing date
+# and break down recent filings by date, all from one round trip
 cursor.execute("""
-SELECT COUNT(*)
-FROM filings
-WHERE filing_date > '2024-11-06';
+WITH totals AS (
+    SELECT
+        COUNT(*) FILTER (WHERE filing_date > '2024-11-06') AS count_after_nov6,
+        MAX(filing_date) AS most_recent
+    FROM filings
+)
+SELECT t.count_after_nov6, t.most_recent, d.filing_date, d.count
+FROM totals t
+LEFT JOIN LATERAL (
+    SELECT filing_date, COUNT(*) as count
+    FROM filings
+    WHERE filing_date >= '2024-01-01'
+    GROUP BY filing_date
+    ORDER BY filing_date DESC
+    LIMIT 20
+) d ON true
+ORDER BY d.filing_date DESC;
 """)
-count_after_nov6 = cursor.fetchone()[0]
+first = cursor.fetchone()
+count_after_nov6, most_recent = first[:2]
 print(f"Filings after November 6, 2024: {count_after_nov6}")
+print(f"Most recent filing date in database: {most_recent.isoformat() if most_recent else 'N/A'}")
 
-# Get the most recent filing date overall
-cursor.execute("""
-SELECT MAX(filing_date)
-FROM filings;
-""")
-most_recent = cursor.fetchone()[0]
-print(f"Most recent filing date in database: {most_recent.strftime('%Y-%m-%d') if most_recent else 'N/A'}")
-
-# Get count by filing date
-cursor.execute("""
-SELECT filing_date, COUNT(*) as count
-FROM filings
-WHERE filing_date >= '2024-01-01'
-GROUP BY filing_date
-ORDER BY filing_date DESC
-LIMIT 20;
-""")
 print("\nRecent filing dates and counts:")
 print(f"{'Date':<12} {'Count':<6}")
 print("-" * 20)
-for date, count in cursor.fetchall():
-    print(f"{date.strftime('%Y-%m-%d'):<12} {count:<6}")
+for _, _, date, count in itertools.chain([first], cursor):
+    # The LEFT JOIN yields a single NULL date when there are no recent filings
+    if date is not None:
+        print(f"{date.isoformat():<12} {count:<6}")
 
 cursor.close()
 conn.close()
@@ -2,96 +2,124 @@
 """Debug script to check upcoming filings calculation"""
 
 import os
-from datetime import datetime
 from pipeline.utils.db import get_db_connection
 
 def main():
     conn = get_db_connection()
-    cursor = conn.cursor()
 
-    # Get the query that the API uses
+    # Get the query that the API uses, with the next expected filing
+    # computed server-side. Only the first 10 companies are printed, so
+    # limit server-side and count the full set with a window
     query = """
-        SELECT DISTINCT ON (f.company_id)
-            f.company_id,
-            co.ticker,
-            co.name,
-            f.filing_type,
-            f.filing_date,
-            f.fiscal_year,
-            f.fiscal_quarter,
-            f.period_end_date
-        FROM filings f
-        JOIN companies co ON f.company_id = co.id
-        WHERE co.enabled = true
-            AND f.fiscal_year IS NOT NULL
-            AND f.period_end_date IS NOT NULL
-        ORDER BY f.company_id, f.filing_date DESC
+        SELECT
+            latest.*,
+            nxt.next_type,
+            nxt.next_year,
+            nxt.next_quarter,
+            pe.next_period_end,
+            est.estimated_filing,
+            est.estimated_filing - CURRENT_DATE AS days_until,
+            COUNT(*) OVER () AS total_companies
+        FROM (
+            SELECT DISTINCT ON (f.company_id)
+                f.company_id,
+                co.ticker,
+                co.name,
+                f.filing_type,
+                f.filing_date,
+                f.fiscal_year,
+                f.fiscal_quarter,
+                f.period_end_date
+            FROM filings f
+            JOIN companies co ON f.company_id = co.id
+            WHERE co.enabled = true
+                AND f.fiscal_year IS NOT NULL
+                AND f.period_end_date IS NOT NULL
+            ORDER BY f.company_id, f.filing_date DESC
+        ) latest
+        -- A Q4 10-Q is followed by the 10-K; a 10-K by Q1 of the next year
+        CROSS JOIN LATERAL (
+            SELECT
+                CASE
+                    WHEN latest.filing_type = '10-Q' AND latest.fiscal_quarter = 4 THEN '10-K'
+                    ELSE '10-Q'
+                END AS next_type,
+                CASE
+                    WHEN latest.filing_type = '10-K' THEN latest.fiscal_year + 1
+                    ELSE latest.fiscal_year
+                END AS next_year,
+                CASE
+                    WHEN latest.filing_type = '10-K' THEN 1
+                    WHEN latest.fiscal_quarter = 4 THEN NULL
+                    ELSE COALESCE(latest.fiscal_quarter % 4 + 1, 1)
+                END AS next_quarter
+        ) nxt
+        -- Quarters end on the last day of Mar/Jun/Sep/Dec; Q1 is
+        -- typically 3 months after year end
+        CROSS JOIN LATERAL (
+            SELECT
+                CASE
+                    WHEN latest.filing_type = '10-K' THEN latest.period_end_date + 90
+                    WHEN nxt.next_type = '10-K' THEN latest.period_end_date
+                    ELSE (
+                        make_date(nxt.next_year, nxt.next_quarter * 3, 1)
+                        + INTERVAL '1 month' - INTERVAL '1 day'
+                    )::date
+                END AS next_period_end
+        ) pe
+        CROSS JOIN LATERAL (
+            SELECT
+                pe.next_period_end
+                + CASE WHEN nxt.next_type = '10-K' THEN 67 ELSE 42 END AS estimated_filing
+        ) est
+        ORDER BY latest.company_id
+        LIMIT 10
     """
 
-    cursor.execute(query)
-    results = cursor.fetchall()
+    with conn.cursor(name='filings_stream') as cursor:
+        cursor.itersize = 2000
+        cursor.execute(query)
 
-    print(f"Found {len(results)} companies with fiscal data")
-    print("\nMost recent filing per company:")
-    print("-" * 100)
+        # Print rows as they stream in; only the few shown in detail
+        # below are kept
+        detailed = []
+        printed = 0
+        for row in cursor:
+            if not printed:
+                print(f"Found {row[-1]} companies with fiscal data")
+                print("\nMost recent filing per company:")
+                print("-" * 100)
 
-    for row in results[:10]:
-        company_id, ticker, name, filing_type, filing_date, fiscal_year, fiscal_quarter, period_end_date = row
-        print(f"{ticker:6s} | {filing_type:5s} | Filed: {filing_date} | Period End: {period_end_date} | FY: {fiscal_year} Q: {fiscal_quarter}")
+            company_id, ticker, name, filing_type, filing_date, fiscal_year, fiscal_quarter, period_end_date = row[:8]
+            print(f"{ticker:6s} | {filing_type:5s} | Filed: {filing_date} | Period End: {period_end_date} | FY: {fiscal_year} Q: {fiscal_quarter}")
 
-    # Now let's manually calculate what the next filing should be
+            printed += 1
+            if len(detailed) < 5:
+                detailed.append(row)
+
+        if not printed:
+            print("Found 0 companies with fiscal data")
+
+    # Show the next expected filing the query calculated
     print("\n" + "=" * 100)
     print("Calculating next expected filings...")
     print("=" * 100)
 
-    now = datetime.now()
-    for row in results[:5]:
-        company_id, ticker, name, filing_type, filing_date, fiscal_year, fiscal_quarter, period_end_date = row
+    for row in detailed:
+        (
+            company_id, ticker, name, filing_type, filing_date, fiscal_year, fiscal_quarter, period_end_date,
+            next_type, next_year, next_quarter, next_period_end, estimated_filing, days_until, _
+        ) = row
 
         print(f"\n{ticker} - Last filing: {filing_type} for FY{fiscal_year} Q{fiscal_quarter or 'N/A'}")
         print(f"  Period ended: {period_end_date}")
         print(f"  Filed on: {filing_date}")
 
-        # Calculate next filing
-        if filing_type == '10-Q':
-            if fiscal_quarter == 4:
-                next_type = '10-K'
-                next_quarter = None
-                next_year = fiscal_year
-                # Period end is the same (Q4 = year end)
-                import datetime as dt
-                next_period_end = period_end_date
-                estimated_filing = next_period_end + dt.timedelta(days=67)
-            else:
-                next_type = '10-Q'
-                next_quarter = (fiscal_quarter % 4) + 1 if fiscal_quarter else 1
-                next_year = fiscal_year + 1 if fiscal_quarter == 4 else fiscal_year
-                # Calculate next quarter end
-                import datetime as dt
-                quarter_end_months = [2, 5, 8, 11]  # Mar, Jun, Sep, Dec (0-indexed)
-                quarter_end_days = [31, 30, 30, 31]
-                end_month = quarter_end_months[next_quarter - 1]
-                end_day = quarter_end_days[next_quarter - 1]
-                year_for_quarter = next_year
-                next_period_end = dt.datetime(year_for_quarter, end_month + 1, end_day)
-                estimated_filing = next_period_end + dt.timedelta(days=42)
-        else:  # 10-K
-            next_type = '10-Q'
-            next_quarter = 1
-            next_year = fiscal_year + 1
-            # Q1 end is typically 3 months after year end
-            import datetime as dt
-            next_period_end = period_end_date + dt.timedelta(days=90)
-            estimated_filing = next_period_end + dt.timedelta(days=42)
-
-        days_until = (estimated_filing - now).days
-
         print(f"  → Next: {next_type} FY{next_year} Q{next_quarter or 'N/A'}")
         print(f"     Expected period end: {next_period_end}")
-        print(f"     Estimated filing date: {estimated_filing.date()}")
+        print(f"     Estimated filing date: {estimated_filing}")
         print(f"     Days from now: {days_until}")
 
-    cursor.close()
     conn.close()
 
 if __name__ == "__main__":
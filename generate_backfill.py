@@ -5,7 +5,9 @@ Generate phase runner for cloud-based pipeline execution.
 Generates multi-format content (HTML, email, etc.) from analyzed filings.
 Reads from content table where analysis exists and generates HTML.
 
-Can be run with configurable limits and worker count.
+Can be run with configurable limits and worker count. Generation is
+I/O bound (database round trips dominate; rendering is sub-millisecond),
+so workers are threads, each with its own pooled connection.
 
 Usage:
     python3 generate_backfill.py --limit 100 --workers 3
@@ -14,15 +16,13 @@ Usage:
 
 import sys
 import argparse
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
 
-# Add pipeline to path
-sys.path.insert(0, str(Path(__file__).parent / 'pipeline'))
-
-from utils import get_config, setup_root_logger
-from generators import BlogGenerator, ContentFormat
+from pipeline.utils import get_config, setup_root_logger, create_connection_pool
+from pipeline.generators import BlogGenerator, ContentFormat
 
 
 def parse_args():
@@ -75,6 +75,23 @@ Examples:
     return parser.parse_args()
 
 
+def generate_one(pool: ThreadedConnectionPool, config, filing, content_formats):
+    """
+    Generate and save every requested format for one filing
+
+    Runs on a worker thread, so it borrows its own pooled connection
+    rather than sharing the main connection's transaction.
+    """
+    conn = pool.getconn()
+    try:
+        generator = BlogGenerator(config, db_connection=conn)
+        for content_format in content_formats:
+            generated = generator.generate(filing['content_id'], format=content_format)
+            generator.save_to_database(filing['content_id'], generated)
+    finally:
+        pool.putconn(conn)
+
+
 def main():
     args = parse_args()
     config = get_config()
@@ -116,19 +133,20 @@ def main():
         total_generated = 0
         failed_count = 0
 
-        try:
-            # Map format names to ContentFormat enums
-            format_map = {
-                'blog': ContentFormat.BLOG_POST_HTML,
-                'email': ContentFormat.EMAIL_HTML,
-                'social': ContentFormat.TWITTER_THREAD
-            }
+        # Map format names to ContentFormat enums
+        format_map = {
+            'blog': ContentFormat.BLOG_POST_HTML,
+            'email': ContentFormat.EMAIL_HTML,
+            'social': ContentFormat.TWITTER_THREAD
+        }
+        content_formats = [format_map[fmt] for fmt in args.formats]
 
+        try:
             # This uses the generator's built-in parallelization
             results = generator.generate_batch(
                 limit=limit,
                 workers=args.workers,
-                formats=[format_map[fmt] for fmt in args.formats]
+                formats=content_formats
             )
             
             if results:
@@ -155,23 +173,31 @@ def main():
             print(f"Found {len(filings)} filings needing generation")
             print()
 
-            for idx, filing in enumerate(filings, 1):
-                filing_id = filing['filing_id']
-                ticker = filing['ticker']
-                
-                print(f"[{idx}/{len(filings)}] Generating content for {ticker}...")
-                
+            if filings:
+                # Generate filings concurrently, honouring --workers
+                workers = max(1, min(args.workers, len(filings)))
+                pool = create_connection_pool(config, min_size=1, max_size=workers)
+
                 try:
-                    for fmt in args.formats:
-                        content_format = ContentFormat[fmt.upper()]
-                        generator.generate_filing(filing_id, content_format)
-                    total_generated += 1
-                    print(f"  ✓ Generation complete ({', '.join(args.formats)})")
-                except Exception as e:
-                    error_msg = str(e)[:100]
-                    print(f"  ✗ Error: {error_msg}")
-                    failed_count += 1
-                
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        futures = {
+                            executor.submit(generate_one, pool, config, filing, content_formats): filing
+                            for filing in filings
+                        }
+
+                        for idx, future in enumerate(as_completed(futures), 1):
+                            ticker = futures[future]['ticker']
+                            try:
+                                future.result()
+                                total_generated += 1
+                                print(f"[{idx}/{len(filings)}] ✓ {ticker} ({', '.join(args.formats)})")
+                            except Exception as e:
+                                error_msg = str(e)[:100]
+                                print(f"[{idx}/{len(filings)}] ✗ {ticker}: {error_msg}")
+                                failed_count += 1
+                finally:
+                    pool.closeall()
+
                 print()
 
             print("=" * 80)
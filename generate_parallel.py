@@ -7,77 +7,374 @@ for multiple content items simultaneously, dramatically reducing total execution
 
 Usage:
     python3 generate_parallel.py                    # Generate with default workers
+    GEN_MAX_WORKERS=8 python3 generate_parallel.py  # Override the default worker count
     python3 generate_parallel.py --workers 3        # Use 3 concurrent workers
     python3 generate_parallel.py --limit 200        # Process up to 200 content items
     python3 generate_parallel.py --dry-run           # Preview without saving
+    python3 generate_parallel.py --executor process  # Use worker processes (for A/B runs)
 """
+import os
 import sys
 import argparse
-from typing import List, Tuple, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import psycopg2
-from datetime import datetime
-
-from pipeline.utils import get_config, PipelineLogger, setup_root_logger
+import itertools
+import logging
+import multiprocessing
+import queue
+import resource
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait
+)
+from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
+
+from pipeline.utils import (
+    get_config,
+    PipelineLogger,
+    setup_root_logger,
+    queued_logger,
+    create_connection_pool,
+    pooled_connection
+)
 from pipeline.generators import BlogGenerator, ContentFormat
+from pipeline.generators.blog import CONTENT_COLUMNS
+
+
+MAX_WORKERS = 15
+
+# Workers only render; their inputs arrive with the pending-content stream
+# and their output is saved by a single writer thread, so the default
+# scales past the CPU count to keep both ends busy; GEN_MAX_WORKERS
+# overrides it
+DEFAULT_WORKERS = int(os.getenv('GEN_MAX_WORKERS', min(MAX_WORKERS, (os.cpu_count() or 1) * 5)))
+
+# Threads are the default: each item is a few milliseconds of string
+# building, which overlaps well enough with the streaming read and the
+# batched writes. Worker processes cost an interpreter each and have to
+# ship every rendered page back to this process. --executor process exists
+# to re-measure that trade-off (throughput and peak RSS are printed), not
+# as a recommended mode.
+EXECUTORS = ('thread', 'process')
+
+# Rendered rows saved per UPDATE
+WRITE_BATCH_SIZE = 50
+
+# Per-process state for --executor process, set up by _init_process_worker
+_worker_logger: Optional[PipelineLogger] = None
 
 
 def generate_content(
     content_id: str,
-    filing_id: str,
-    ticker: str,
-    headline: str,
+    content: Dict[str, Any],
     config,
     logger: PipelineLogger
-) -> Tuple[str, bool, str]:
+) -> Tuple[str, bool, str, Optional[Tuple[str, Optional[str], Optional[str]]]]:
     """
-    Generate blog and email HTML for a single content item
+    Render blog and email HTML for a single content item
+
+    content is the prefetched BlogGenerator.fetch_content() dictionary and
+    the HTML is returned for the writer thread to save, so workers make no
+    database round trips.
 
     Returns:
-        (content_id, success, message)
+        (content_id, success, message, (content_id, blog_html, email_html)),
+        with None in place of the row when nothing was rendered
     """
+    ticker = content['ticker']
+    headline = content['tldr_headline'] or content['executive_summary']
     try:
-        # Create a new connection for this thread
-        conn = psycopg2.connect(config.database.url)
-        generator = BlogGenerator(config, conn, logger)
+        generator = BlogGenerator(config, logger=logger)
 
         # Generate both blog post HTML and email HTML formats for publishing
         formats = [ContentFormat.BLOG_POST_HTML, ContentFormat.EMAIL_HTML]
 
         results = generator.process_content(
             content_id=content_id,
-            formats=formats
+            formats=formats,
+            content=content,
+            save=False
         )
 
-        conn.close()
-
         if results:
-            return (content_id, True, f"✓ {ticker} - {headline[:40]}")
+            blog = results.get(ContentFormat.BLOG_POST_HTML)
+            email = results.get(ContentFormat.EMAIL_HTML)
+            row = (content_id, blog and blog.output, email and email.output)
+            return (content_id, True, f"✓ {ticker} - {headline[:40]}", row)
         else:
-            return (content_id, False, f"⊘ {ticker} - {headline[:40]} (no results)")
+            return (content_id, False, f"⊘ {ticker} - {headline[:40]} (no results)", None)
 
     except Exception as e:
-        return (content_id, False, f"✗ {ticker}: {str(e)[:100]}")
+        return (content_id, False, f"✗ {ticker}: {str(e)[:100]}", None)
+
+
+def _init_process_worker():
+    """Give a worker process its own logger"""
+    global _worker_logger
+    _worker_logger = PipelineLogger(setup_root_logger(), 'parallel_generate')
+
+
+def generate_content_in_process(content_id: str, content: Dict[str, Any]):
+    """generate_content() for worker processes"""
+    return generate_content(content_id, content, get_config(), _worker_logger)
+
+
+def save_rendered(conn, rows: List[Tuple[str, Optional[str], Optional[str]]]):
+    """
+    Save a batch of rendered HTML in one UPDATE
+
+    A format that failed to render (None) keeps its current value.
+
+    Args:
+        conn: Database connection
+        rows: (content_id, blog_html, email_html) tuples
+    """
+    with conn.cursor() as cursor:
+        execute_values(cursor, """
+            UPDATE content
+            SET blog_html = COALESCE(data.blog_html, content.blog_html),
+                email_html = COALESCE(data.email_html, content.email_html),
+                updated_at = NOW()
+            FROM (VALUES %s) AS data (id, blog_html, email_html)
+            WHERE content.id = data.id
+        """, rows, template='(%s::uuid, %s::text, %s::text)', page_size=WRITE_BATCH_SIZE)
+    conn.commit()
+
+
+def write_rendered(pool: ThreadedConnectionPool, rows: queue.Queue, counts: Dict[str, int]):
+    """
+    Save rendered rows from a queue until a None sentinel arrives
+
+    Runs on its own thread with one pooled connection. A batch is flushed
+    when it is full or the queue runs dry, so batches grow when workers
+    outpace the database and saves never wait on a slow trickle.
+
+    Args:
+        pool: Connection pool to borrow the writer's connection from
+        rows: Queue of (content_id, blog_html, email_html) tuples
+        counts: Tally updated with 'save_failed'
+    """
+    with pooled_connection(pool) as conn:
+        batch = []
+        while True:
+            row = rows.get()
+            if row is not None:
+                batch.append(row)
+
+            if batch and (row is None or len(batch) >= WRITE_BATCH_SIZE or rows.empty()):
+                try:
+                    save_rendered(conn, batch)
+                except Exception as e:
+                    conn.rollback()
+                    counts['save_failed'] += len(batch)
+                    print(f"✗ Failed to save {len(batch)} content items: {str(e)[:100]}")
+                batch = []
+
+            if row is None:
+                return
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def get_pending_content(conn, limit: int = 500) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Stream content items needing generation, with their inputs
+
+    Uses a server-side cursor so rows arrive in pages of 64 and workers can
+    start on the first page while later ones are still unread. Each row
+    carries everything the generator renders from, so the next page is
+    read while the current one is being generated. The connection must
+    stay open until the generator is exhausted.
+
+    Yields:
+        (content_id, content) where content matches fetch_content()
+    """
+    cursor = conn.cursor(name='pending_content_stream')
+    cursor.itersize = 64
+    try:
+        cursor.execute(f"""
+            SELECT c.id, {CONTENT_COLUMNS}
+            FROM content c
+            JOIN filings f ON c.filing_id = f.id
+            JOIN companies co ON f.company_id = co.id
+            WHERE c.executive_summary IS NOT NULL
+            AND (c.blog_html IS NULL OR c.email_html IS NULL)
+            ORDER BY c.created_at DESC
+            LIMIT %s
+        """, (limit,))
+
+        for row in cursor:
+            yield row[0], BlogGenerator.content_from_row(row[1:])
+    finally:
+        cursor.close()
+
+
+def report(future: Future, counts: Dict[str, int], progress: logging.Logger, rows: queue.Queue):
+    """Tally and log the result of a finished generate_content task and queue its save"""
+    content_id, success, message, row = future.result()
+    if row is not None:
+        rows.put(row)
+    counts['successful' if success else 'failed'] += 1
+    completed = counts['successful'] + counts['failed']
+    progress.info(f"[{completed:3d}] {message}")
+
+
+def run_generate(
+    workers: int = DEFAULT_WORKERS,
+    limit: int = 500,
+    dry_run: bool = False,
+    executor: str = 'thread'
+) -> Tuple[int, int]:
+    """
+    Generate HTML for pending content concurrently
+
+    Can be called in-process (orchestrate_parallel.py runs it on a thread
+    alongside run_analyze) as well as from the command line.
+
+    Args:
+        workers: Number of concurrent generation workers
+        limit: Maximum content items to process
+        dry_run: Preview without actually generating
+        executor: 'thread' (default) or 'process' worker pool
+
+    Returns:
+        (successful, failed)
+
+    Raises:
+        ConnectionError: If the database is unreachable
+    """
+    # Setup logging
+    root_logger = setup_root_logger()
+    logger = PipelineLogger(root_logger, 'parallel_generate')
+
+    # Load config
+    config = get_config()
 
+    print("\n" + "=" * 70)
+    print("PARALLEL CONTENT GENERATOR")
+    print("=" * 70)
+    print(f"Workers: {workers} ({executor}s)")
+    print(f"Limit: {limit} content items")
+    print(f"Dry-run: {dry_run}")
+    print("=" * 70 + "\n")
 
-def get_pending_content(conn, limit: int = 500) -> List[Tuple[str, str, str, str]]:
-    """Get list of content items needing generation"""
-    cursor = conn.cursor()
-    cursor.execute(f"""
-        SELECT c.id, c.filing_id, comp.ticker,
-               COALESCE(c.key_takeaways->>'headline', c.executive_summary)
-        FROM content c
-        JOIN filings f ON c.filing_id = f.id
-        JOIN companies comp ON f.company_id = comp.id
-        WHERE c.executive_summary IS NOT NULL
-        AND (c.blog_html IS NULL OR c.email_html IS NULL)
-        ORDER BY c.created_at DESC
-        LIMIT {limit}
-    """)
+    # One connection streams the pending content and one saves the
+    # rendered HTML; workers need none
+    try:
+        pool = create_connection_pool(config, min_size=2, max_size=2)
+    except Exception as e:
+        raise ConnectionError(f"Failed to connect to database: {e}") from e
 
-    content_items = cursor.fetchall()
-    cursor.close()
-    return content_items
+    try:
+        with pooled_connection(pool) as conn:
+            pending_content = get_pending_content(conn, limit)
+            first = next(pending_content, None)
+
+            if first is None:
+                print("✓ No pending content to generate")
+                return 0, 0
+
+            pending_content = itertools.chain([first], pending_content)
+
+            if dry_run:
+                print("DRY-RUN MODE: Showing content that would be generated:")
+                for i, (content_id, content) in enumerate(
+                    itertools.islice(pending_content, 10), 1
+                ):
+                    headline = content['tldr_headline'] or content['executive_summary']
+                    print(f"  {i}. {content['ticker']} - {headline[:50]}")
+                remaining = sum(1 for _ in pending_content)
+                if remaining:
+                    print(f"  ... and {remaining} more")
+                return 0, 0
+
+            print("Streaming pending content\n")
+
+            # Generate in parallel
+            counts = {'successful': 0, 'failed': 0, 'save_failed': 0}
+            start_time = time.monotonic()
+
+            rss_before = peak_rss_mb()
+            if executor == 'process':
+                # forkserver children start from a clean server process
+                # rather than a copy of this one (open pool sockets included)
+                pool_executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context('forkserver'),
+                    initializer=_init_process_worker
+                )
+                task, task_args = generate_content_in_process, ()
+            else:
+                pool_executor = ThreadPoolExecutor(max_workers=workers)
+                task, task_args = generate_content, (config, logger)
+
+            # Rendered rows are saved in batches by one writer thread
+            rows = queue.Queue()
+            writer = threading.Thread(
+                target=write_rendered, args=(pool, rows, counts), name='generate-writer'
+            )
+            writer.start()
+
+            # Progress lines are written by a background thread so the
+            # completion loop never waits on stdout
+            try:
+                with queued_logger('parallel_generate.progress') as progress, pool_executor:
+                    futures = {}
+                    for content_id, content in pending_content:
+                        # Keep at most two tasks per worker queued, so rows are
+                        # read from the cursor only as fast as they are generated
+                        if len(futures) >= 2 * workers:
+                            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                del futures[future]
+                                report(future, counts, progress, rows)
+
+                        future = pool_executor.submit(task, content_id, content, *task_args)
+                        futures[future] = content_id
+
+                    # Process the remaining tasks as they finish
+                    for future in as_completed(futures):
+                        report(future, counts, progress, rows)
+            finally:
+                # Stop the writer once everything rendered has been queued
+                rows.put(None)
+                writer.join()
+
+        # Summary; items whose save failed count as failed
+        successful = counts['successful'] - counts['save_failed']
+        failed = counts['failed'] + counts['save_failed']
+        total = successful + failed
+        duration = time.monotonic() - start_time
+        avg_time = duration / total if total else 0
+
+        print("\n" + "=" * 70)
+        print("GENERATION COMPLETE")
+        print("=" * 70)
+        print(f"Successful: {successful}")
+        print(f"Failed: {failed}")
+        print(f"Total: {total}")
+        print(f"Duration: {duration:.1f} seconds")
+        print(f"Avg time per item: {avg_time:.1f} seconds")
+        print(f"Peak RSS (this process): {rss_before:.0f} MB before workers, {peak_rss_mb():.0f} MB after")
+        print("=" * 70 + "\n")
+
+        if failed > 0:
+            print(f"⚠ {failed} content items failed to generate")
+
+        return successful, failed
+    finally:
+        pool.closeall()
 
 
 def main():
@@ -88,8 +385,9 @@ def main():
     parser.add_argument(
         '--workers',
         type=int,
-        default=3,
-        help='Number of concurrent generation workers (default: 3, max recommended: 5)'
+        default=DEFAULT_WORKERS,
+        help=f'Number of concurrent generation workers (default: {DEFAULT_WORKERS}, '
+             f'from GEN_MAX_WORKERS or CPU count, max: {MAX_WORKERS})'
     )
     parser.add_argument(
         '--limit',
@@ -102,103 +400,26 @@ def main():
         action='store_true',
         help='Preview without actually generating'
     )
+    parser.add_argument(
+        '--executor',
+        choices=EXECUTORS,
+        default='thread',
+        help='Worker pool type (default: thread; process is for A/B measurement)'
+    )
 
     args = parser.parse_args()
 
     # Validate worker count
-    if args.workers < 1 or args.workers > 15:
-        print("✗ Workers must be between 1 and 15")
+    if args.workers < 1 or args.workers > MAX_WORKERS:
+        print(f"✗ Workers must be between 1 and {MAX_WORKERS}")
         sys.exit(1)
 
-    # Setup logging
-    root_logger = setup_root_logger()
-    logger = PipelineLogger(root_logger, 'parallel_generate')
-
-    # Load config
-    config = get_config()
-
-    print("\n" + "=" * 70)
-    print("PARALLEL CONTENT GENERATOR")
-    print("=" * 70)
-    print(f"Workers: {args.workers}")
-    print(f"Limit: {args.limit} content items")
-    print(f"Dry-run: {args.dry_run}")
-    print("=" * 70 + "\n")
-
-    # Connect and get pending content
     try:
-        conn = psycopg2.connect(config.database.url)
-        pending_content = get_pending_content(conn, args.limit)
-        conn.close()
-    except Exception as e:
-        print(f"✗ Failed to connect to database: {e}")
+        run_generate(args.workers, args.limit, args.dry_run, args.executor)
+    except ConnectionError as e:
+        print(f"✗ {e}")
         sys.exit(1)
 
-    if not pending_content:
-        print("✓ No pending content to generate")
-        return
-
-    print(f"Found {len(pending_content)} content items needing generation\n")
-
-    if args.dry_run:
-        print("DRY-RUN MODE: Showing content that would be generated:")
-        for i, (content_id, filing_id, ticker, headline) in enumerate(pending_content[:10], 1):
-            print(f"  {i}. {ticker} - {headline[:50]}")
-        if len(pending_content) > 10:
-            print(f"  ... and {len(pending_content) - 10} more")
-        return
-
-    # Generate in parallel
-    successful = 0
-    failed = 0
-    start_time = datetime.now()
-
-    with ThreadPoolExecutor(max_workers=args.workers) as executor:
-        # Submit all tasks
-        futures = {
-            executor.submit(
-                generate_content,
-                content_id,
-                filing_id,
-                ticker,
-                headline,
-                config,
-                logger
-            ): (content_id, ticker, headline)
-            for content_id, filing_id, ticker, headline in pending_content
-        }
-
-        # Process completed tasks as they finish
-        completed = 0
-        for future in as_completed(futures):
-            completed += 1
-            content_id, success, message = future.result()
-
-            status = "✓" if success else "✗"
-            print(f"[{completed:3d}/{len(pending_content)}] {message}")
-
-            if success:
-                successful += 1
-            else:
-                failed += 1
-
-    # Summary
-    duration = (datetime.now() - start_time).total_seconds()
-    avg_time = duration / len(pending_content) if pending_content else 0
-
-    print("\n" + "=" * 70)
-    print("GENERATION COMPLETE")
-    print("=" * 70)
-    print(f"Successful: {successful}")
-    print(f"Failed: {failed}")
-    print(f"Total: {len(pending_content)}")
-    print(f"Duration: {duration:.1f} seconds")
-    print(f"Avg time per item: {avg_time:.1f} seconds")
-    print("=" * 70 + "\n")
-
-    if failed > 0:
-        print(f"⚠ {failed} content items failed to generate")
-
 
 if __name__ == '__main__':
     main()
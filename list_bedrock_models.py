@@ -3,15 +3,55 @@
 List available Bedrock models
 
 Shows all foundation models available in your AWS account.
+
+Bedrock's model listings rarely change, so responses are cached under
+~/.cache/10kay for an hour; pass --refresh to query AWS again.
 """
 import os
+import json
+import time
+import argparse
+from pathlib import Path
 from dotenv import load_dotenv
 import boto3
 from botocore.exceptions import ClientError
 
 load_dotenv('.env.local')
 
-def list_models():
+CACHE_DIR = Path.home() / '.cache' / '10kay'
+CACHE_TTL_SECONDS = 3600
+
+
+def _cached(region: str, key: str, fn, refresh: bool = False) -> dict:
+    """
+    Return fn()'s response, reusing a copy cached on disk within the TTL
+
+    Args:
+        region: AWS region (part of the cache key)
+        key: Name of the cached call
+        fn: Zero-argument function making the API call
+        refresh: Ignore any cached copy
+
+    Returns:
+        API response dict (datetimes become strings when cached)
+    """
+    path = CACHE_DIR / f"bedrock-{region}-{key}.json"
+
+    if not refresh and path.exists() and time.time() - path.stat().st_mtime < CACHE_TTL_SECONDS:
+        with open(path) as f:
+            return json.load(f)
+
+    response = fn()
+    response.pop('ResponseMetadata', None)
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(response, f, default=str)
+
+    return response
+
+
+def list_models(refresh: bool = False):
     """List available Bedrock models"""
     print("=" * 80)
     print("Available Bedrock Models")
@@ -32,7 +72,7 @@ def list_models():
         )
 
         # List foundation models
-        response = bedrock_client.list_foundation_models()
+        response = _cached(aws_region, 'foundation-models', bedrock_client.list_foundation_models, refresh)
 
         # Filter for Anthropic models
         anthropic_models = [
@@ -61,7 +101,9 @@ def list_models():
         print()
 
         try:
-            profiles_response = bedrock_client.list_inference_profiles()
+            profiles_response = _cached(
+                aws_region, 'inference-profiles', bedrock_client.list_inference_profiles, refresh
+            )
             profiles = profiles_response.get('inferenceProfileSummaries', [])
 
             # Filter for Anthropic/Claude profiles
@@ -97,4 +139,12 @@ def list_models():
 
 
 if __name__ == '__main__':
-    list_models()
+    parser = argparse.ArgumentParser(description='List available Bedrock models')
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Ignore cached responses and query AWS'
+    )
+    args = parser.parse_args()
+
+    list_models(refresh=args.refresh)
@@ -0,0 +1,18 @@
+-- Migration 010: Covering index for latest-filing-per-company lookups
+-- Purpose: Serve "latest filing per company" queries (LEFT JOIN LATERAL ...
+--          ORDER BY filing_date DESC LIMIT 1, and DISTINCT ON (company_id)
+--          ... ORDER BY company_id, filing_date DESC) with an index-only
+--          scan instead of a per-company sort over filings
+-- Date: 2026-10-16
+-- Run: psql $DATABASE_URL -f migrations/010_filings_company_date_index.sql
+--
+-- CONCURRENTLY avoids blocking filing inserts while the index builds. It
+-- cannot run inside a transaction block, so this file must contain exactly
+-- one statement (run_migrations.py executes it in autocommit mode).
+--
+-- Verify with:
+--   EXPLAIN (ANALYZE, BUFFERS) <latest filings query in check_filing_dates.py>
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_filings_company_date_desc
+  ON filings (company_id, filing_date DESC)
+  INCLUDE (filing_type, period_end_date, fiscal_year, fiscal_quarter, accession_number, status);
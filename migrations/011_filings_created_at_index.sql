@@ -0,0 +1,22 @@
+-- Migration 011: Covering index for "recently added filings" lookups
+-- Purpose: Serve check_when_added.py's queries without scanning filings:
+--          the top-30 by created_at is read in index order (filtering on
+--          filing_date from the INCLUDE columns) and the per-day creation
+--          timeline is an index-only scan over this narrow index
+-- Date: 2026-10-16
+-- Run: psql $DATABASE_URL -f migrations/011_filings_created_at_index.sql
+--
+-- created_at is TIMESTAMPTZ, so an expression index on created_at::date is
+-- not possible (the cast depends on the session time zone); the plain
+-- column index covers the timeline aggregate instead.
+--
+-- CONCURRENTLY cannot run inside a transaction block, so this file must
+-- contain exactly one statement (run_migrations.py executes it in
+-- autocommit mode).
+--
+-- Verify with:
+--   EXPLAIN (ANALYZE, BUFFERS) <queries in check_when_added.py>
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_filings_created_desc
+  ON filings (created_at DESC)
+  INCLUDE (filing_date, company_id, filing_type, accession_number);
@@ -0,0 +1,19 @@
+-- Migration 012: Persistent cache of Bedrock responses
+-- Purpose: Let re-runs and filings that produce an identical prompt reuse an
+--          earlier Claude response instead of invoking Bedrock again
+-- Date: 2026-10-16
+-- Run: psql $DATABASE_URL -f migrations/012_bedrock_cache.sql
+--
+-- prompt_sha is the SHA-256 of the model ID and the full invoke_model
+-- request body (messages, system prompt, max_tokens, temperature), so any
+-- change to the request is a different key. Only responses that parsed
+-- successfully are written.
+
+CREATE TABLE IF NOT EXISTS bedrock_cache (
+    prompt_sha CHAR(64) PRIMARY KEY,
+    model_id VARCHAR(255) NOT NULL,
+    response JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+COMMENT ON TABLE bedrock_cache IS 'Claude responses keyed by SHA-256 of model ID and request body';
@@ -0,0 +1,22 @@
+-- Migration 013: Partial index for content awaiting HTML generation
+-- Purpose: Serve generate_parallel.py's pending-content stream
+--          (executive_summary set, blog_html or email_html missing,
+--          ORDER BY created_at DESC LIMIT n) with an index range scan in
+--          order instead of a scan and sort over all content
+-- Date: 2026-10-16
+-- Run: psql $DATABASE_URL -f migrations/013_content_pending_generation_index.sql
+--
+-- The predicate matches the query's WHERE clause exactly, so the index only
+-- holds rows still waiting for generation and shrinks as they are rendered.
+--
+-- CONCURRENTLY cannot run inside a transaction block, so this file must
+-- contain exactly one statement (run_migrations.py executes it in
+-- autocommit mode).
+--
+-- Verify with:
+--   EXPLAIN (ANALYZE, BUFFERS) <query in generate_parallel.get_pending_content>
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_content_pending_generation
+  ON content (created_at DESC)
+  INCLUDE (id, filing_id)
+  WHERE executive_summary IS NOT NULL AND (blog_html IS NULL OR email_html IS NULL);
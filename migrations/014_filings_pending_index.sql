@@ -0,0 +1,19 @@
+-- Migration 014: Partial index for filings awaiting analysis
+-- Purpose: Serve analyze_parallel.py's pending-filings stream
+--          (status = 'pending', ORDER BY filing_date DESC LIMIT n) in index
+--          order; the NOT EXISTS check against content is an anti-join on
+--          idx_content_filing (migration 003)
+-- Date: 2026-10-16
+-- Run: psql $DATABASE_URL -f migrations/014_filings_pending_index.sql
+--
+-- CONCURRENTLY cannot run inside a transaction block, so this file must
+-- contain exactly one statement (run_migrations.py executes it in
+-- autocommit mode).
+--
+-- Verify with:
+--   EXPLAIN (ANALYZE, BUFFERS) <query in analyze_parallel.get_pending_filings>
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_filings_pending_date
+  ON filings (filing_date DESC)
+  INCLUDE (id, company_id, filing_type)
+  WHERE status = 'pending';
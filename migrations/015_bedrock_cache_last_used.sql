@@ -0,0 +1,17 @@
+-- Migration 015: Track when cached Bedrock responses were last used
+-- Purpose: Let scripts/prune_bedrock_cache.py evict the least recently used
+--          entries from bedrock_cache (migration 012) instead of letting it
+--          grow without bound
+-- Date: 2026-10-16
+-- Run: psql $DATABASE_URL -f migrations/015_bedrock_cache_last_used.sql
+--
+-- Existing rows start as used now, so nothing is evicted before it has had
+-- a chance to be hit.
+
+ALTER TABLE bedrock_cache
+  ADD COLUMN IF NOT EXISTS last_used_at TIMESTAMPTZ NOT NULL DEFAULT NOW();
+
+CREATE INDEX IF NOT EXISTS idx_bedrock_cache_last_used
+  ON bedrock_cache (last_used_at);
+
+COMMENT ON COLUMN bedrock_cache.last_used_at IS 'Last time the response was written or served; drives LRU eviction';
@@ -4,7 +4,8 @@ Pipeline orchestrator with parallel phase execution
 
 This script runs the analysis phase with 5 workers and automatically triggers
 the generate phase once analyze reaches 10% completion. This overlaps the phases
-to reduce total pipeline execution time.
+to reduce total pipeline execution time. Both phases run in this process on
+worker threads, and analyze progress is tracked from the analyzer's NOTIFYs.
 
 Usage:
     python3 orchestrate_parallel.py                              # Run with default limits (200 each)
@@ -18,13 +19,60 @@ Default limits are set to 200 to ensure scheduled runs complete within 2 hours.
 For manual runs or when more time is available, use higher limits.
 """
 import sys
+import asyncio
 import subprocess
 import time
 import argparse
 import psycopg2
 from datetime import datetime
 
-from pipeline.utils import get_config
+try:
+    import uvloop
+except ImportError:  # Optional speedup; not available on Windows
+    uvloop = None
+
+from pipeline.utils import get_config, execute_prepared
+from pipeline.analyzers.base import ANALYZE_PROGRESS_CHANNEL
+
+
+ANALYZE_WORKERS = 5
+
+# Generate starts once this share of filings has been analyzed
+TRIGGER_PERCENT = 10
+
+
+# Enabled companies' filings, each checked once for analyzed content
+# (EXISTS is served by idx_content_filing)
+FILING_PROGRESS_SQL = """
+    SELECT
+        COUNT(*) as total,
+        COUNT(*) FILTER (WHERE has_content) as analyzed,
+        COUNT(*) FILTER (WHERE status = 'pending' AND NOT has_content) as pending
+    FROM (
+        SELECT
+            filings.status,
+            EXISTS (SELECT 1 FROM content WHERE filing_id = filings.id) as has_content
+        FROM filings
+        JOIN companies c ON filings.company_id = c.id
+        WHERE c.enabled = true
+    ) f
+"""
+
+
+# Both phases' counts in one round trip
+PIPELINE_PROGRESS_SQL = f"""
+    SELECT f.total, f.analyzed, f.pending, ct.total_content, ct.with_blog_html
+    FROM ({FILING_PROGRESS_SQL}) f
+    CROSS JOIN (
+        SELECT
+            COUNT(*) as total_content,
+            COUNT(*) FILTER (WHERE blog_html IS NOT NULL) as with_blog_html
+        FROM content
+    ) ct
+"""
+
+def _percent(part: int, total: int) -> float:
+    return round(100.0 * part / total, 1) if total > 0 else 0
 
 
 def get_analyze_progress(conn) -> tuple:
@@ -35,134 +83,95 @@ def get_analyze_progress(conn) -> tuple:
         (total_filings, analyzed, pending, percent_complete)
     """
     try:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT
-                COUNT(*) as total,
-                COUNT(*) FILTER (WHERE EXISTS (SELECT 1 FROM content WHERE filing_id = filings.id)) as analyzed,
-                COUNT(*) FILTER (WHERE filings.status = 'pending' AND NOT EXISTS (SELECT 1 FROM content WHERE filing_id = filings.id)) as pending
-            FROM filings
-            JOIN companies c ON filings.company_id = c.id
-            WHERE c.enabled = true
-        """)
-
-        result = cursor.fetchone()
-        total, analyzed, pending = result[0], result[1], result[2]
-        percent = round(100.0 * analyzed / total, 1) if total > 0 else 0
-
-        cursor.close()
-        return total, analyzed, pending, percent
+        with conn.cursor() as cursor:
+            execute_prepared(cursor, 'analyze_progress', FILING_PROGRESS_SQL)
+            total, analyzed, pending = cursor.fetchone()
+
+        return total, analyzed, pending, _percent(analyzed, total)
     except Exception as e:
         print(f"Error querying progress: {e}")
         return 0, 0, 0, 0
 
 
-def get_generate_progress(conn) -> tuple:
+def get_pipeline_progress(conn) -> tuple:
     """
-    Get current generate progress
+    Get current analyze and generate progress in one round trip
 
     Returns:
-        (total_content, with_blog_html, percent_complete)
+        ((total_filings, analyzed, pending, percent_complete),
+         (total_content, with_blog_html, percent_complete))
     """
     try:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT
-                COUNT(*) as total_content,
-                COUNT(*) FILTER (WHERE blog_html IS NOT NULL) as with_blog_html
-            FROM content
-        """)
-
-        result = cursor.fetchone()
-        total, blog_html = result[0], result[1]
-        percent = round(100.0 * blog_html / total, 1) if total > 0 else 0
-
-        cursor.close()
-        return total, blog_html, percent
+        with conn.cursor() as cursor:
+            execute_prepared(cursor, 'pipeline_progress', PIPELINE_PROGRESS_SQL)
+            total, analyzed, pending, total_content, blog_html = cursor.fetchone()
+
+        return (
+            (total, analyzed, pending, _percent(analyzed, total)),
+            (total_content, blog_html, _percent(blog_html, total_content))
+        )
     except Exception as e:
         print(f"Error querying progress: {e}")
-        return 0, 0, 0
+        return (0, 0, 0, 0), (0, 0, 0)
+
+
+def run_phase(phase_name: str, fn, *args) -> bool:
+    """Run a phase's entry point on a worker thread and report how it went"""
+    try:
+        fn(*args)
+        print(f"✓ {phase_name} completed successfully")
+        return True
+    except Exception as e:
+        print(f"✗ {phase_name} failed: {e}")
+        return False
 
 
-def start_analyze_phase(limit: int = 500):
+def start_analyze_phase(limit: int = 500) -> asyncio.Task:
     """Start the parallel analyze phase"""
+    # Imported here so monitor_orchestrator, which only needs the progress
+    # queries, does not load boto3 and the analyzer stack
+    from analyze_parallel import run_analyze
+
     print(f"\n{'='*70}")
-    print(f"STARTING PHASE 2: PARALLEL ANALYZE (5 workers, limit: {limit})")
+    print(f"STARTING PHASE 2: PARALLEL ANALYZE ({ANALYZE_WORKERS} workers, limit: {limit})")
     print(f"{'='*70}\n")
 
-    try:
-        # Start analyze in background with 5 workers
-        process = subprocess.Popen(
-            ['python3', 'analyze_parallel.py', '--workers', '5', '--limit', str(limit)],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1
-        )
-        return process
-    except Exception as e:
-        print(f"✗ Failed to start analyze phase: {e}")
-        sys.exit(1)
+    # Runs in this process on its own thread (with its own event loop and
+    # connection pool); output goes straight to our stdout
+    return asyncio.create_task(
+        asyncio.to_thread(run_phase, "Analyze Phase", run_analyze, ANALYZE_WORKERS, limit)
+    )
 
 
-def start_generate_phase(limit: int = 500):
+def start_generate_phase(limit: int = 500) -> asyncio.Task:
     """Start the parallel generate phase"""
+    from generate_parallel import run_generate, DEFAULT_WORKERS as GENERATE_WORKERS
+
     print(f"\n{'='*70}")
-    print(f"STARTING PHASE 3: PARALLEL GENERATE (3 workers, limit: {limit})")
+    print(f"STARTING PHASE 3: PARALLEL GENERATE ({GENERATE_WORKERS} workers, limit: {limit})")
     print(f"{'='*70}\n")
 
-    try:
-        # Start generate in background with 3 workers
-        process = subprocess.Popen(
-            ['python3', 'generate_parallel.py', '--workers', '3', '--limit', str(limit)],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1
-        )
-        return process
-    except Exception as e:
-        print(f"✗ Failed to start generate phase: {e}")
-        return None
+    return asyncio.create_task(
+        asyncio.to_thread(run_phase, "Generate Phase", run_generate, GENERATE_WORKERS, limit)
+    )
 
 
-def start_publish_phase():
-    """Start the publish phase"""
+def run_publish_phase():
+    """Run the publish phase"""
     print(f"\n{'='*70}")
     print("STARTING PHASE 4: PUBLISH")
     print(f"{'='*70}\n")
 
     try:
-        # Start publish phase
-        process = subprocess.Popen(
-            ['python3', 'pipeline/main.py', '--phase', 'publish'],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1
-        )
-        return process
-    except Exception as e:
-        print(f"✗ Failed to start publish phase: {e}")
-        return None
-
-
-def wait_for_process(process, phase_name: str):
-    """Wait for a process to complete and stream output"""
-    try:
-        while True:
-            line = process.stdout.readline()
-            if not line:
-                break
-            print(line.rstrip())
-
-        process.wait()
-        if process.returncode == 0:
-            print(f"✓ {phase_name} completed successfully")
+        # pipeline/main.py uses its own import layout, so it stays a
+        # subprocess; it inherits stdout, so there is no pipe to drain
+        result = subprocess.run(['python3', 'pipeline/main.py', '--phase', 'publish'])
+        if result.returncode == 0:
+            print("✓ Publish Phase completed successfully")
         else:
-            print(f"✗ {phase_name} failed with return code {process.returncode}")
+            print(f"✗ Publish Phase failed with return code {result.returncode}")
     except Exception as e:
-        print(f"Error monitoring {phase_name}: {e}")
+        print(f"✗ Failed to run publish phase: {e}")
 
 
 def main():
@@ -206,104 +215,121 @@ def main():
     print("10KAY PARALLEL PIPELINE ORCHESTRATOR")
     print("=" * 70)
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Event loop: {'uvloop' if uvloop else 'asyncio'}")
     print("=" * 70)
 
+    if uvloop:
+        # Lower per-wakeup overhead than the stdlib loop. Setting the
+        # policy also covers the loop analyze_parallel starts on its thread.
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    asyncio.run(orchestrate(args, config))
+
+
+async def orchestrate(args, config):
+    """Run the analyze and generate phases concurrently in this process"""
     # If generate-only, skip analyze
     if args.generate_only:
         print("\nMode: GENERATE PHASE ONLY")
-        process = start_generate_phase(args.generate_limit)
-        wait_for_process(process, "Generate Phase")
+        await start_generate_phase(args.generate_limit)
         return
 
-    # Start analyze phase
     print("\nMode: PARALLEL EXECUTION (Analyze → auto-trigger Generate → optional Publish)")
     print(f"Analyze limit: {args.analyze_limit} filings")
     print(f"Generate limit: {args.generate_limit} content items")
 
-    analyze_process = start_analyze_phase(args.analyze_limit)
-    generate_process = None
-    publish_process = None
-    generate_triggered = False
-
-    # Connect to database for monitoring
+    # Connect to database for monitoring. The analyzer NOTIFYs on every
+    # saved analysis; notifications are only delivered outside a
+    # transaction, hence autocommit
     try:
         db_conn = psycopg2.connect(config.database.url)
+        db_conn.autocommit = True
+        with db_conn.cursor() as cursor:
+            cursor.execute(f"LISTEN {ANALYZE_PROGRESS_CHANNEL}")
     except Exception as e:
         print(f"✗ Failed to connect to database: {e}")
-        analyze_process.terminate()
         sys.exit(1)
 
-    # Monitor analyze phase and trigger generate at 10%
-    print("\nWaiting for analyze to reach 10% before triggering generate...\n")
+    # Count once, then track progress from notifications
+    total, analyzed, pending, percent = get_analyze_progress(db_conn)
+    progress = {'total': total, 'analyzed': analyzed}
+    trigger_reached = asyncio.Event()
 
-    last_status_time = time.time()
-    monitor_interval = 0.1  # Check more frequently
-    status_interval = 30  # Print status every 30 seconds
+    def check_trigger():
+        if _percent(progress['analyzed'], progress['total']) >= TRIGGER_PERCENT:
+            trigger_reached.set()
 
-    while analyze_process.poll() is None:
-        current_time = time.time()
-
-        # CRITICAL: Consume stdout to prevent buffer deadlock
-        # Non-blocking read of stdout
-        try:
-            import select
-            if analyze_process.stdout:
-                ready, _, _ = select.select([analyze_process.stdout], [], [], 0)
-                if ready:
-                    line = analyze_process.stdout.readline()
-                    if line:
-                        print(line.rstrip())
-        except Exception:
-            pass  # Continue monitoring even if stdout read fails
+    def on_notify():
+        db_conn.poll()
+        progress['analyzed'] += len(db_conn.notifies)
+        db_conn.notifies.clear()
+        check_trigger()
 
-        # Check if we should trigger generate
-        if not generate_triggered and not args.analyze_only:
-            total, analyzed, pending, percent = get_analyze_progress(db_conn)
+    loop = asyncio.get_running_loop()
+    loop.add_reader(db_conn.fileno(), on_notify)
+    check_trigger()
+
+    analyze_task = start_analyze_phase(args.analyze_limit)
+    generate_task = None
+    trigger_wait = asyncio.create_task(trigger_reached.wait())
+
+    # Monitor analyze phase and trigger generate at 10%
+    print(f"\nWaiting for analyze to reach {TRIGGER_PERCENT}% before triggering generate...\n")
 
-            if percent >= 10:
-                print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Analyze reached {percent}% - Triggering generate phase...")
-                generate_process = start_generate_phase(args.generate_limit)
-                generate_triggered = True
+    status_interval = 30  # Print status every 30 seconds
+    last_status_time = time.monotonic()
+
+    while not analyze_task.done():
+        # Wake when analyze finishes, the trigger fires, or status is due
+        waiters = {analyze_task}
+        if generate_task is None and not args.analyze_only:
+            waiters.add(trigger_wait)
+        await asyncio.wait(
+            waiters,
+            timeout=status_interval - (time.monotonic() - last_status_time),
+            return_when=asyncio.FIRST_COMPLETED
+        )
 
-        # Print status periodically
-        if current_time - last_status_time >= status_interval:
-            total, analyzed, pending, analyze_percent = get_analyze_progress(db_conn)
-            gen_total, gen_html, gen_percent = get_generate_progress(db_conn)
+        # Check if we should trigger generate
+        if generate_task is None and not args.analyze_only and trigger_reached.is_set():
+            percent = _percent(progress['analyzed'], progress['total'])
+            print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Analyze reached {percent}% - Triggering generate phase...")
+            generate_task = start_generate_phase(args.generate_limit)
+
+        # Print status periodically (this also resyncs the count kept from
+        # notifications)
+        if time.monotonic() - last_status_time >= status_interval:
+            (total, analyzed, pending, analyze_percent), (gen_total, gen_html, gen_percent) = \
+                get_pipeline_progress(db_conn)
+            progress.update(total=total, analyzed=analyzed)
+            check_trigger()
 
             print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Pipeline Status:")
             print(f"  Analyze: {analyzed}/{total} ({analyze_percent}%)")
-            if generate_triggered:
+            if generate_task is not None:
                 print(f"  Generate: {gen_html}/{gen_total} ({gen_percent}%)")
             print()
 
-            last_status_time = current_time
+            last_status_time = time.monotonic()
 
-        time.sleep(monitor_interval)
-
-    # Wait for analyze to finish and drain any remaining output
-    print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Analyze phase completed, draining output...")
-    try:
-        if analyze_process.stdout:
-            for line in analyze_process.stdout:
-                print(line.rstrip())
-    except Exception:
-        pass
+    loop.remove_reader(db_conn.fileno())
+    trigger_wait.cancel()
+    print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Analyze phase completed")
 
     # If generate was triggered, wait for it
-    if generate_triggered and generate_process:
+    if generate_task is not None:
         print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Waiting for generate phase to complete...")
-        wait_for_process(generate_process, "Generate Phase")
+        await generate_task
 
         # Trigger publish if requested
         if args.publish:
             print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Starting publish phase...")
-            publish_process = start_publish_phase()
-            wait_for_process(publish_process, "Publish Phase")
+            await asyncio.to_thread(run_publish_phase)
             print(f"\n[{datetime.now().strftime('%H:%M:%S')}] ✓ PIPELINE COMPLETE")
 
     # Get final status BEFORE closing connection
-    total, analyzed, pending, analyze_percent = get_analyze_progress(db_conn)
-    gen_total, gen_html, gen_percent = get_generate_progress(db_conn)
+    (total, analyzed, pending, analyze_percent), (gen_total, gen_html, gen_percent) = \
+        get_pipeline_progress(db_conn)
 
     # Now close the connection
     db_conn.close()
@@ -315,6 +341,5 @@ def main():
     print(f"Generate: {gen_html}/{gen_total} ({gen_percent}%)")
     print(f"{'='*70}\n")
 
-
 if __name__ == '__main__':
     main()
@@ -1,7 +1,40 @@
 """
 Analyzers module for AI-powered filing analysis
+
+Exports are loaded on first attribute access (PEP 562), so importing the
+package, or a light module such as .base, does not pull in boto3 until an
+analyzer is actually used.
 """
-from .base import BaseAnalyzer, AnalysisResult, AnalysisType
-from .claude import ClaudeAnalyzer
+import importlib
+
+# Export name -> submodule that defines it
+_LAZY = {
+    'BaseAnalyzer': '.base',
+    'AnalysisResult': '.base',
+    'AnalysisType': '.base',
+    'ClaudeAnalyzer': '.claude',
+    'create_aws_clients': '.claude',
+    'BedrockRateLimiter': '.rate_limiter'
+}
+
+__all__ = [
+    'BaseAnalyzer',
+    'AnalysisResult',
+    'AnalysisType',
+    'ClaudeAnalyzer',
+    'BedrockRateLimiter',
+    'create_aws_clients'
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
 
-__all__ = ['BaseAnalyzer', 'AnalysisResult', 'AnalysisType', 'ClaudeAnalyzer']
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,17 +5,22 @@ Provides abstract interface for analyzing SEC filings with Claude.
 """
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set
 from enum import Enum
 
 
+# Postgres NOTIFY channel signalled (with the filing ID) each time an
+# analysis is saved, so monitors can LISTEN instead of polling counts
+ANALYZE_PROGRESS_CHANNEL = 'analyze_progress'
+
+
 class AnalysisType(str, Enum):
     """Types of analysis we perform"""
     QUICK_SUMMARY = 'quick_summary'  # For TLDR (free tier)
     DEEP_ANALYSIS = 'deep_analysis'  # For paid tier
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """
     Result of analyzing a SEC filing
@@ -203,6 +208,29 @@ class BaseAnalyzer(ABC):
 
         return exists
 
+    def check_if_analyzed_bulk(self, filing_ids: List[str]) -> Set[str]:
+        """
+        Check which of several filings have already been analyzed
+
+        Args:
+            filing_ids: Database IDs of filings
+
+        Returns:
+            IDs of the filings that have content
+        """
+        if not self.db_connection or not filing_ids:
+            return set()
+
+        cursor = self.db_connection.cursor()
+        cursor.execute(
+            "SELECT DISTINCT filing_id::text FROM content WHERE filing_id = ANY(%s::uuid[])",
+            (list(filing_ids),)
+        )
+        analyzed = {row[0] for row in cursor.fetchall()}
+        cursor.close()
+
+        return analyzed
+
     def process_filing(
         self,
         filing_id: str,
@@ -3,23 +3,518 @@ Claude AI analyzer implementation
 
 Analyzes SEC filings using Claude Sonnet 4.5 via AWS Bedrock.
 """
+import asyncio
+import bisect
+import codecs
+import hashlib
 import json
+import os
+import random
+import threading
 import time
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Set, Tuple, Union
 from datetime import datetime
 import boto3
-from botocore.exceptions import ClientError
+import orjson
+import psycopg2
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+from psycopg2 import sql
+from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
+import lxml.html
+from lxml import etree
 import re
 import html
 
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
 from .base import (
     BaseAnalyzer,
     AnalysisResult,
     AnalysisType,
     AnalysisError,
     FetchError,
-    DatabaseError
+    DatabaseError,
+    ANALYZE_PROGRESS_CHANNEL
 )
+from .rate_limiter import BedrockRateLimiter, is_retryable_error
+
+try:
+    from ..utils.db import execute_prepared, create_connection_pool, pooled_connection
+except ImportError:
+    # pipeline/main.py and the backfill scripts put pipeline/ on sys.path
+    # and import analyzers and utils as top-level packages
+    from utils.db import execute_prepared, create_connection_pool, pooled_connection
+
+# Responses to identical Bedrock requests, keyed by SHA-256 of the model ID
+# and request body and shared by every analyzer in the process. The
+# bedrock_cache table (migration 012) persists them across runs.
+RESPONSE_CACHE_SIZE = 4096
+_response_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+# bedrock_cache reads and writes borrow autocommit connections from a pool
+# of their own, never the analyzer's db_connection: the caller owns that
+# transaction, and section summaries hit the cache from several threads
+CACHE_POOL_SIZE = 8
+_cache_pools: Dict[str, ThreadedConnectionPool] = {}
+_cache_pools_lock = threading.Lock()
+
+# Extracted sections of recently seen filing content, keyed by a BLAKE2b
+# digest of the content, so analyzing a filing again (another analysis
+# type, or a retry) skips the HTML flattening and section search
+SECTIONS_CACHE_SIZE = 32
+_sections_cache: "OrderedDict[bytes, Dict[str, str]]" = OrderedDict()
+_sections_cache_lock = threading.Lock()
+
+# Filings are first fetched with a ranged GET of this many bytes; the full
+# object is only downloaded if these sections aren't all found in it
+FILING_PREFIX_BYTES = 512 * 1024
+PREFIX_SECTIONS = ('risk_factors', 'md_and_a', 'financial_statements')
+
+# Prompts process_filings_batch builds ahead of the filings in flight
+PREFETCH_DEPTH = 4
+
+# Client pairs for analyzers built without aws_clients, one per set of
+# credentials, so scripts constructing analyzers in a loop reuse them
+_default_aws_clients: Dict[tuple, tuple] = {}
+_default_aws_clients_lock = threading.Lock()
+
+# Characters of each section that go into the analysis prompt
+SECTION_PROMPT_CHARS = 5000
+
+# Completion budget for condensing an over-long section (summarize_sections)
+SECTION_SUMMARY_MAX_TOKENS = 800
+
+# Seconds to wait for a connection to AWS before retrying
+AWS_CONNECT_TIMEOUT = 5
+
+# Attempts per Bedrock request and the cap on the backoff between them
+BEDROCK_MAX_ATTEMPTS = 6
+BEDROCK_MAX_BACKOFF = 60.0  # seconds
+
+# Fetched filing text on local disk, keyed by S3 URL so reruns skip the
+# download. Filing objects are written once per accession number, so a
+# cached copy never needs revalidating against S3. Opened on first use;
+# None until then or if disabled.
+_filing_cache = None
+_filing_cache_lock = threading.Lock()
+
+# Filing parsing patterns, compiled once rather than looked up in re's
+# small pattern cache on every call
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+# Element bodies are matched as "unrolled loops": runs of non-'<' text are
+# consumed in one step and only each '<' is checked for the closing tag,
+# instead of a lazy DOTALL .*? testing for it at every character
+_TABLE_RE = re.compile(r'<table[^>]*>([^<]*(?:<(?!/table>)[^<]*)*)</table>', re.IGNORECASE)
+_ROW_RE = re.compile(r'<tr[^>]*>([^<]*(?:<(?!/tr>)[^<]*)*)</tr>', re.IGNORECASE)
+_CELL_RE = re.compile(r'<(?:td|th)[^>]*>([^<]*(?:<(?!/t[dh]>)[^<]*)*)</t[dh]>', re.IGNORECASE)
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*(\{.*\})\s*```', re.DOTALL)
+_HTML_MARKER_RE = re.compile(r'<(?:table|html)', re.IGNORECASE)
+
+# Filing text is already decoded; an explicit encoding stops lxml honouring
+# (or rejecting) an XML declaration at the top of the document
+_LXML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+# SEC section headers. Every "Item N" heading is located in one pass over
+# the text; each section then starts at the first heading of its start
+# kinds whose title follows within the window, and runs to the next
+# heading of its end kinds. This matches what a single
+# ITEM...TITLE(.*?)ITEM regex per section would find, without each one
+# rescanning the rest of the filing from every false start.
+_ITEM_RE = re.compile(r'ITEM\s+(?=[1-9])', re.IGNORECASE)
+_ITEM_KIND_RES = {
+    kind: re.compile(pattern, re.IGNORECASE)
+    for kind, pattern in (
+        ('1', r'1[^A\d]'), ('1A', r'1A'), ('1B', r'1B'), ('2', r'2'), ('3', r'3'),
+        ('7', r'7'), ('7A', r'7A'), ('8', r'8'), ('9', r'9')
+    )
+}
+
+# name: (start kinds, title within window, end kinds, character limit)
+# Item 1 (Business), Item 1A (Risk Factors), Item 7 or Part I Item 2
+# (MD&A), Item 8 or Part I Item 1 (Financial Statements)
+_SECTION_SPECS = {
+    'business': (
+        ('1',), re.compile(r'.{0,50}?BUSINESS', re.IGNORECASE | re.DOTALL), ('1A', '2'), 10000
+    ),
+    'risk_factors': (
+        ('1A',), re.compile(r'.{0,50}?RISK FACTORS', re.IGNORECASE | re.DOTALL), ('1B', '2'), 15000
+    ),
+    'md_and_a': (
+        ('7', '2'),
+        re.compile(r'.{0,100}?MANAGEMENT.?S DISCUSSION AND ANALYSIS', re.IGNORECASE | re.DOTALL),
+        ('7A', '8', '3'),
+        20000
+    ),
+    'financial_statements': (
+        ('8', '1'), re.compile(r'.{0,100}?FINANCIAL STATEMENTS', re.IGNORECASE | re.DOTALL), ('9', '2'), 15000
+    ),
+}
+
+
+def _index_item_headings(text: str) -> Dict[str, List[Tuple[int, int]]]:
+    """
+    Locate every "Item N" heading in filing text
+
+    Args:
+        text: Whitespace-normalized filing text
+
+    Returns:
+        Heading kind (e.g. '1A') to (heading start, end of item number)
+        pairs, in text order
+    """
+    headings = {kind: [] for kind in _ITEM_KIND_RES}
+    for match in _ITEM_RE.finditer(text):
+        for kind, kind_re in _ITEM_KIND_RES.items():
+            number = kind_re.match(text, match.end())
+            if number:
+                headings[kind].append((match.start(), number.end()))
+    return headings
+
+
+def _find_section(text: str, headings: Dict[str, List[Tuple[int, int]]], name: str) -> Optional[str]:
+    """
+    Slice one section out of filing text using pre-located headings
+
+    Args:
+        text: Whitespace-normalized filing text
+        headings: Output of _index_item_headings for text
+        name: Key of _SECTION_SPECS
+
+    Returns:
+        Section body (after its title, truncated to the section's limit),
+        or None if the section was not found
+    """
+    start_kinds, title_re, end_kinds, limit = _SECTION_SPECS[name]
+    starts = sorted(after for kind in start_kinds for _, after in headings[kind])
+    ends = sorted(start for kind in end_kinds for start, _ in headings[kind])
+
+    for after in starts:
+        title = title_re.match(text, after)
+        if not title:
+            continue
+        i = bisect.bisect_left(ends, title.end())
+        if i < len(ends):
+            return text[title.end():min(ends[i], title.end() + limit)]
+    return None
+
+# The five key points both analysis types ask for, as they appear in the
+# output schemas; _indent_spec nests it at each schema's depth
+_KEY_POINTS_SPEC = """[
+  {
+    "title": "Financial Performance Overview",
+    "description": "Full paragraph (4-6 sentences) with headline insight and specific YoY/QoQ numbers. Explain margin trends and growth drivers with basis point changes. Include segment-level details. Discuss sustainability of metrics and changes from prior periods. End with implications for future trajectory."
+  },
+  {
+    "title": "Strategic Initiatives and Operational Changes",
+    "description": "Full paragraph (4-6 sentences) describing operational or strategic shifts. Explain why management made these changes and competitive implications. Include forward-looking indicators from commentary. Connect strategy to financial performance. Discuss execution risks and timeline."
+  },
+  {
+    "title": "Market Position and Competitive Dynamics",
+    "description": "Full paragraph (4-6 sentences) analyzing market share trends and positioning. Discuss customer concentration and retention metrics. Explain TAM expansion opportunities. Include competitive threats and advantages. Assess how the company is gaining or losing ground."
+  },
+  {
+    "title": "Operational Efficiency and Profitability",
+    "description": "Full paragraph (4-6 sentences) explaining operational leverage and cost structure. Discuss efficiency improvements or headwinds. Analyze gross and operating margin trends. Include productivity metrics if available. Assess sustainability of profitability improvements."
+  },
+  {
+    "title": "Growth Catalysts and Material Risks",
+    "description": "Full paragraph (4-6 sentences) identifying near and medium-term growth drivers. Discuss macro headwinds or tailwinds. Explain key risks material to investment thesis. Assess management's mitigation strategies. Provide forward-looking perspective on key metrics."
+  }
+]"""
+
+
+def _indent_spec(spec: str, depth: int) -> str:
+    """Indent every line of a schema fragment but the first by depth spaces"""
+    return spec.replace('\n', '\n' + ' ' * depth)
+
+
+# Task, output schema and style guide for each analysis type. These are
+# identical across filings and lead the prompt, so Bedrock caches them
+# (cache_control) and later calls are billed at the cached-read rate for
+# everything but the filing itself.
+QUICK_SUMMARY_INSTRUCTIONS = """**Task:**
+Generate a TLDR summary in JSON format with the following structure:
+{
+  "headline": "Attention-grabbing one-line summary (8-12 words)",
+  "summary": "4-6 sentence overview providing substantive context. Start with the headline insight, then explain what changed and why it matters. Include 2-3 specific metrics or examples. End with forward-looking implications.",
+  "key_points": """ + _indent_spec(_KEY_POINTS_SPEC, 2) + """,
+  "sentiment_score": 0.5,  // -1 (very negative) to 1 (very positive)
+  "bull_case": "Concise 15-word maximum summary of the strongest bullish argument from this filing",
+  "bear_case": "Concise 15-word maximum summary of the strongest bearish argument or risk from this filing",
+  "key_metrics": {
+    "revenue": "value with YoY/QoQ context",
+    "net_income": "value with YoY/QoQ context",
+    "rd_spend": "value with YoY/QoQ context and as % of revenue",
+    "growth_rate": "value with trend analysis",
+    "margins": "gross and operating with basis point changes",
+    // 4-6 other critical metrics with context
+  }
+}
+
+**Style Guide:**
+- Tone: Bloomberg Terminal meets The Diff (Byrne Hobart) - direct, analytical, substantive
+- Audience: Tech operators, founders, investors who want actionable insights
+- Focus: What matters for decision-making, strategic implications, second-order effects
+- Include: Specific numbers, comparisons, context, nuance
+- Avoid: Corporate speak, obvious statements, generic analysis, vague descriptions
+
+Respond with only valid JSON, no additional text."""
+
+DEEP_ANALYSIS_INSTRUCTIONS = """**Task:**
+Generate a deep analysis in JSON format:
+{
+  "headline": "Compelling headline (8-15 words)",
+  "tldr": {
+    "summary": "4-6 sentence overview providing substantive context. Start with the headline insight, then explain what changed and why it matters. Include 2-3 specific metrics or examples. End with forward-looking implications.",
+    "key_points": """ + _indent_spec(_KEY_POINTS_SPEC, 4) + """
+  },
+  "intro": "4-6 substantive paragraphs (250-350 words total) setting up the key themes. Start with the headline insight in context. Explain what changed YoY/QoQ with specific numbers. Identify 2-3 major themes. Provide competitive context. End with what this means for the business trajectory.",
+  "sections": [
+    {
+      "title": "Financial Performance Deep Dive",
+      "content": "6-8 paragraphs (400-600 words). Break down revenue by segment with YoY/QoQ trends. Analyze margin expansion/compression with drivers. Discuss cash flow and capital allocation. Compare to peers. Identify inflection points or concerning trends. Include specific numbers, percentages, and basis point changes throughout."
+    },
+    {
+      "title": "Strategic Shifts and Product Evolution",
+      "content": "6-8 paragraphs (400-600 words). Analyze new product launches, R&D investments, strategic pivots. Discuss go-to-market changes. Examine partnerships and M&A. Connect product strategy to financials. Assess competitive positioning. Include forward-looking indicators from management commentary."
+    },
+    {
+      "title": "Market Dynamics and Competitive Position",
+      "content": "5-7 paragraphs (350-500 words). Assess market share trends. Analyze competitive threats and advantages. Discuss regulatory environment. Examine customer concentration and churn. Include macroeconomic factors affecting the business."
+    },
+    {
+      "title": "Risk Factors and Headwinds",
+      "content": "5-7 paragraphs (350-500 words). Deep dive into material risks from filing. Assess likelihood and potential impact. Discuss management's mitigation strategies. Compare to prior periods. Include second-order effects."
+    },
+    {
+      "title": "Growth Opportunities and Catalysts",
+      "content": "5-7 paragraphs (350-500 words). Identify untapped markets and expansion opportunities. Analyze operational leverage potential. Discuss innovation pipeline. Assess M&A potential. Include TAM analysis where relevant."
+    }
+  ],
+  "conclusion": "5-6 paragraphs (300-400 words) synthesizing insights and forward-looking implications. Recap the 2-3 most important themes. Assess whether the business is accelerating or decelerating. Identify key metrics to watch in next quarter. Provide actionable takeaways for operators. End with contrarian or non-obvious insight.",
+  "key_metrics": {
+    "revenue": "$XXX.XB (±X.X% YoY, ±X.X% QoQ) with segment breakdown and trend analysis",
+    "net_income": "$XXB (±X.X% YoY, ±X.X% QoQ) with margin context",
+    "rd_spend": "$XB (±X.X% YoY) and X.X% of revenue with trend analysis",
+    "gross_margin": "XX.X% (±XXbps YoY) with drivers explanation",
+    "operating_margin": "XX.X% (±XXbps YoY) with efficiency analysis",
+    "free_cash_flow": "$XXB (±X% YoY) with conversion rate",
+    "growth_indicators": {
+      "customer_count": "details with growth rate",
+      "arr_or_bookings": "details with trends",
+      "retention_metrics": "details with cohort analysis"
+    },
+    // 8-12 critical metrics total with full context
+  },
+  "sentiment_score": 0.5,
+  "bull_case": "Concise 15-word maximum summary of the strongest bullish argument from this filing",
+  "bear_case": "Concise 15-word maximum summary of the strongest bearish argument or risk from this filing",
+  "risk_factors": [
+    "Specific risk 1 with quantified impact assessment",
+    "Specific risk 2 with likelihood and mitigation strategy",
+    "Specific risk 3 with industry context",
+    "Specific risk 4 if material"
+  ],
+  "opportunities": [
+    "Specific opportunity 1 with TAM/market size context",
+    "Specific opportunity 2 with timeline and barriers to entry",
+    "Specific opportunity 3 with competitive advantage analysis",
+    "Specific opportunity 4 if material"
+  ]
+}
+
+**Analysis Framework:**
+1. **What Changed**: YoY/QoQ comparisons, inflection points, trend reversals
+2. **Why It Matters**: Strategic implications, competitive dynamics, market share shifts
+3. **What's Next**: Forward-looking indicators, management guidance, pipeline visibility
+4. **The Nuance**: What others might miss, second-order effects, non-obvious correlations
+5. **The Contrarian Take**: Challenge conventional wisdom, identify misunderstood aspects
+
+**Style Guide:**
+- Tone: Bloomberg Terminal meets Stratechery - authoritative, insightful, opinionated, substantive
+- Audience: Sophisticated tech operators, founders, investors who want deep understanding
+- Length: Each section should be 350-600 words for a total 5-7 minute read (2000-3000 words)
+- Focus: Strategic narrative woven with numbers, not just data dumps
+- Include: Specific figures, YoY/QoQ comparisons, segment breakdowns, direct quotes, concrete examples
+- Avoid: Hedging language, surface-level observations, obvious points, filler content
+
+**Critical**: This is PAID tier content. Make it substantially deeper and more insightful than a free summary.
+
+Respond with only valid JSON, no additional text."""
+
+
+def create_aws_clients(config, max_pool_connections: int = 10) -> tuple:
+    """
+    Create the Bedrock runtime and S3 clients an analyzer uses
+
+    boto3 clients are thread-safe, so one pair can be built per process and
+    shared by every ClaudeAnalyzer instead of paying client construction
+    (credential chain, endpoint resolution, TLS setup) per filing.
+
+    Args:
+        config: PipelineConfig instance
+        max_pool_connections: HTTP connections each client keeps; size this
+            to the number of threads sharing the clients
+
+    Returns:
+        (bedrock_client, s3_client)
+    """
+    # Keepalive stops idle NAT/load balancer timeouts from dropping a
+    # connection partway through a long streamed analysis. A stalled
+    # connect fails within seconds and is retried, rather than holding a
+    # worker for botocore's 60 second default.
+    client_config = Config(
+        max_pool_connections=max_pool_connections,
+        tcp_keepalive=True,
+        connect_timeout=AWS_CONNECT_TIMEOUT
+    )
+    client_kwargs = {
+        'region_name': config.aws.region,
+        'aws_access_key_id': config.aws.access_key_id,
+        'aws_secret_access_key': config.aws.secret_access_key
+    }
+
+    # _call_bedrock owns Bedrock retries, so throttling reaches the rate
+    # limiter instead of being absorbed by botocore's own retry loop
+    bedrock_config = client_config.merge(Config(retries={'mode': 'standard', 'max_attempts': 1}))
+
+    return (
+        boto3.client('bedrock-runtime', config=bedrock_config, **client_kwargs),
+        boto3.client('s3', config=client_config, **client_kwargs)
+    )
+
+
+def _get_default_aws_clients(config) -> tuple:
+    """
+    Get the process-wide client pair for config's region and credentials
+
+    Args:
+        config: PipelineConfig instance
+
+    Returns:
+        (bedrock_client, s3_client)
+    """
+    key = (config.aws.region, config.aws.access_key_id, config.aws.secret_access_key)
+    with _default_aws_clients_lock:
+        clients = _default_aws_clients.get(key)
+        if clients is None:
+            clients = _default_aws_clients[key] = create_aws_clients(config)
+    return clients
+
+
+def _get_cache_pool(config) -> ThreadedConnectionPool:
+    """
+    Get the process-wide bedrock_cache connection pool for config's database
+
+    Args:
+        config: PipelineConfig instance
+
+    Returns:
+        ThreadedConnectionPool of up to CACHE_POOL_SIZE connections
+    """
+    url = config.database.url
+    with _cache_pools_lock:
+        pool = _cache_pools.get(url)
+        if pool is None:
+            pool = _cache_pools[url] = create_connection_pool(config, min_size=1, max_size=CACHE_POOL_SIZE)
+    return pool
+
+
+def _get_filing_cache(config):
+    """
+    Open the process-wide filing cache
+
+    Args:
+        config: PipelineConfig instance
+
+    Returns:
+        diskcache.Cache, or None if diskcache is not installed or
+        config.cache_dir is unset
+    """
+    global _filing_cache
+    if diskcache is None or not config.cache_dir:
+        return None
+    with _filing_cache_lock:
+        if _filing_cache is None:
+            _filing_cache = diskcache.Cache(
+                os.path.join(config.cache_dir, 'filings'),
+                size_limit=config.cache_size_mb * 1024 * 1024,
+                eviction_policy='least-recently-used'
+            )
+    return _filing_cache
+
+
+def _html_to_text(content: str) -> str:
+    """
+    Flatten filing HTML to whitespace-normalized text
+
+    Script, style and comment content is dropped. Uses selectolax when it
+    is installed and lxml otherwise; both tokenize in C, which is much
+    faster than regex tag stripping on multi-megabyte filings.
+
+    Args:
+        content: Raw filing HTML/text
+
+    Returns:
+        Plain text with runs of whitespace collapsed to single spaces
+    """
+    if HTMLParser is not None:
+        tree = HTMLParser(content)
+        for node in tree.css('script, style'):
+            node.decompose()
+        root = tree.body or tree.root
+        text = root.text(separator=' ') if root is not None else ''
+    else:
+        try:
+            root = lxml.html.fromstring(content.encode('utf-8'), parser=_LXML_PARSER)
+        except etree.ParserError:
+            # Empty or whitespace-only document
+            return ''
+        etree.strip_elements(root, 'script', 'style', etree.Comment, with_tail=False)
+        text = ' '.join(root.itertext())
+
+    # str.split() breaks on the same characters as \s and runs as one C
+    # loop, several times faster than the regex on multi-megabyte text
+    return ' '.join(text.split())
+
+
+def _prompt_excerpt(content: str, limit: int) -> str:
+    """
+    Whitespace-normalize the start of a section and cut it to limit
+
+    Equivalent to _WS_RE.sub(' ', content).strip()[:limit], but only the
+    head of the section that can end up in the prompt is normalized.
+
+    Args:
+        content: Section text
+        limit: Maximum characters to keep
+
+    Returns:
+        Normalized excerpt of at most limit characters
+    """
+    # Normalizing only shrinks text, so twice the limit is nearly always
+    # enough; a head that collapses to the limit or below is redone in full
+    window = limit * 2
+    excerpt = _WS_RE.sub(' ', content[:window]).lstrip()
+    if len(excerpt) <= limit and len(content) > window:
+        excerpt = _WS_RE.sub(' ', content).lstrip()
+    if len(excerpt) > limit:
+        return excerpt[:limit]
+    return excerpt.rstrip()
 
 
 class ClaudeAnalyzer(BaseAnalyzer):
@@ -30,9 +525,32 @@ class ClaudeAnalyzer(BaseAnalyzer):
     Generates both TLDR (free tier) and deep analysis (paid tier).
     """
 
-    def __init__(self, config, db_connection=None, logger=None):
-        """Initialize Claude analyzer with AWS Bedrock client"""
+    def __init__(
+        self,
+        config,
+        db_connection=None,
+        logger=None,
+        rate_limiter: Optional[BedrockRateLimiter] = None,
+        aws_clients: Optional[tuple] = None,
+        summarize_sections: bool = False
+    ):
+        """
+        Initialize Claude analyzer with AWS Bedrock client
+
+        Args:
+            config: PipelineConfig instance
+            db_connection: Database connection (psycopg2)
+            logger: PipelineLogger instance
+            rate_limiter: Optional BedrockRateLimiter shared across analyzers
+            aws_clients: Optional (bedrock_client, s3_client) pair from
+                create_aws_clients(); defaults to a pair shared by every
+                analyzer in the process with the same credentials
+            summarize_sections: Condense sections longer than the prompt
+                allows with a summary call each, instead of truncating them
+        """
         super().__init__(config, db_connection, logger)
+        self.rate_limiter = rate_limiter
+        self.summarize_sections = summarize_sections
 
         # Debug: Log AWS configuration (with redacted credentials)
         print(f"DEBUG: AWS Region: {config.aws.region}")
@@ -41,24 +559,15 @@ class ClaudeAnalyzer(BaseAnalyzer):
         print(f"DEBUG: AWS Secret Access Key: {'***' if config.aws.secret_access_key else 'NOT SET'}")
         print(f"DEBUG: Bedrock Model ID: {config.aws.bedrock_model_id}")
 
-        # Initialize Bedrock client
-        self.bedrock_client = boto3.client(
-            'bedrock-runtime',
-            region_name=config.aws.region,
-            aws_access_key_id=config.aws.access_key_id,
-            aws_secret_access_key=config.aws.secret_access_key
-        )
-
-        # Initialize S3 client for fetching filings
-        self.s3_client = boto3.client(
-            's3',
-            region_name=config.aws.region,
-            aws_access_key_id=config.aws.access_key_id,
-            aws_secret_access_key=config.aws.secret_access_key
-        )
+        # Bedrock client for analysis and S3 client for fetching filings
+        self.bedrock_client, self.s3_client = aws_clients or _get_default_aws_clients(config)
 
         self.model_id = config.aws.bedrock_model_id
 
+        # (prompt, filing_metadata) built ahead of time by a prefetcher,
+        # consumed by _prepare_prompt
+        self._prefetched: Dict[str, Tuple[List[Dict[str, Any]], Dict[str, Any]]] = {}
+
         if self.logger:
             self.logger.info(
                 f"Initialized ClaudeAnalyzer",
@@ -78,24 +587,51 @@ class ClaudeAnalyzer(BaseAnalyzer):
         Raises:
             FetchError: If fetching fails
         """
-        if not self.db_connection:
+        content, _ = self._fetch_filing(filing_id)
+        return content
+
+    def _fetch_filing(
+        self,
+        filing_id: str,
+        max_bytes: Optional[int] = None,
+        s3_url: Optional[str] = None
+    ) -> Tuple[str, bool]:
+        """
+        Fetch filing content, or just its first max_bytes, from S3
+
+        Reads are served from the local filing cache without touching S3.
+
+        Args:
+            filing_id: Database ID of filing
+            max_bytes: Fetch only this many leading bytes (a ranged GET)
+            s3_url: The filing's raw_document_url, if already loaded
+
+        Returns:
+            (content, complete) where complete is False if the object was
+            cut off at max_bytes
+
+        Raises:
+            FetchError: If fetching fails
+        """
+        if not s3_url and not self.db_connection:
             raise FetchError("No database connection available")
 
         try:
-            # Get filing S3 URL from database
-            cursor = self.db_connection.cursor()
-            cursor.execute(
-                "SELECT raw_document_url FROM filings WHERE id = %s",
-                (filing_id,)
-            )
+            if not s3_url:
+                # Get filing S3 URL from database
+                cursor = self.db_connection.cursor()
+                cursor.execute(
+                    "SELECT raw_document_url FROM filings WHERE id = %s",
+                    (filing_id,)
+                )
 
-            row = cursor.fetchone()
-            cursor.close()
+                row = cursor.fetchone()
+                cursor.close()
 
-            if not row:
-                raise FetchError(f"Filing {filing_id} not found")
+                if not row:
+                    raise FetchError(f"Filing {filing_id} not found")
 
-            s3_url = row[0]
+                s3_url = row[0]
 
             if not s3_url:
                 raise FetchError(f"No S3 URL found for filing {filing_id}")
@@ -108,24 +644,51 @@ class ClaudeAnalyzer(BaseAnalyzer):
             bucket = parts[0]
             key = parts[1]
 
+            # A whole copy of the object serves any request; a prefix only
+            # serves a request for the same prefix
+            cache = _get_filing_cache(self.config)
+            if cache is not None:
+                cached = cache.get(f"{s3_url}:full")
+                if cached is None and max_bytes:
+                    cached = cache.get(f"{s3_url}:{max_bytes}")
+                if cached is not None:
+                    return cached
+
             # Download from S3
-            response = self.s3_client.get_object(Bucket=bucket, Key=key)
-            content = response['Body'].read().decode('utf-8')
+            if max_bytes:
+                response = self.s3_client.get_object(
+                    Bucket=bucket, Key=key, Range=f"bytes=0-{max_bytes - 1}"
+                )
+            else:
+                response = self.s3_client.get_object(Bucket=bucket, Key=key)
+            body = response['Body'].read()
+
+            # ContentRange is "bytes 0-524287/<object size>" on a ranged GET
+            content_range = response.get('ContentRange')
+            complete = not content_range or int(content_range.rsplit('/', 1)[1]) <= len(body)
+
+            # A prefix can end partway through a multi-byte character; the
+            # incremental decoder holds that back instead of failing on it
+            content = codecs.getincrementaldecoder('utf-8')().decode(body, final=complete)
+
+            if cache is not None:
+                suffix = 'full' if complete else max_bytes
+                cache.set(f"{s3_url}:{suffix}", (content, complete))
 
             if self.logger:
                 self.logger.debug(
                     f"Fetched {len(content)} chars from S3",
-                    extra={'filing_id': filing_id}
+                    extra={'filing_id': filing_id, 'complete': complete}
                 )
 
-            return content
+            return content, complete
 
         except ClientError as e:
             raise FetchError(f"Failed to fetch from S3: {e}")
         except Exception as e:
             raise FetchError(f"Failed to fetch filing content: {e}")
 
-    def _extract_html_tables(self, content: str) -> str:
+    def _extract_html_tables(self, content: str, max_chars: Optional[int] = None) -> str:
         """
         Extract and convert HTML tables to readable text format
 
@@ -134,24 +697,27 @@ class ClaudeAnalyzer(BaseAnalyzer):
 
         Args:
             content: Raw HTML content
+            max_chars: Stop once this much table text has been produced
 
         Returns:
             Converted table text with financial data
         """
         tables_text = []
+        total_chars = 0
 
-        # Find all table elements
-        table_pattern = r'<table[^>]*>(.*?)</table>'
-        tables = re.findall(table_pattern, content, re.IGNORECASE | re.DOTALL)
+        # Walk table elements lazily; a large filing's tables together can
+        # be most of the document
+        for table_match in _TABLE_RE.finditer(content):
+            if max_chars is not None and total_chars >= max_chars:
+                break
 
-        for table_html in tables:
+            table_html = table_match.group(1)
             # Skip navigation/formatting tables (usually short)
             if len(table_html) < 200:
                 continue
 
             # Extract rows
-            row_pattern = r'<tr[^>]*>(.*?)</tr>'
-            rows = re.findall(row_pattern, table_html, re.IGNORECASE | re.DOTALL)
+            rows = _ROW_RE.findall(table_html)
 
             if not rows:
                 continue
@@ -159,19 +725,18 @@ class ClaudeAnalyzer(BaseAnalyzer):
             table_rows = []
             for row_html in rows:
                 # Extract cells (both td and th)
-                cell_pattern = r'<(?:td|th)[^>]*>(.*?)</(?:td|th)>'
-                cells = re.findall(cell_pattern, row_html, re.IGNORECASE | re.DOTALL)
+                cells = _CELL_RE.findall(row_html)
 
                 if cells:
                     # Clean up cell content
                     cleaned_cells = []
                     for cell in cells:
                         # Remove nested HTML tags
-                        cell_text = re.sub(r'<[^>]+>', ' ', cell)
+                        cell_text = _TAG_RE.sub(' ', cell)
                         # Decode HTML entities
                         cell_text = html.unescape(cell_text)
                         # Remove extra whitespace
-                        cell_text = re.sub(r'\s+', ' ', cell_text).strip()
+                        cell_text = ' '.join(cell_text.split())
                         if cell_text:
                             cleaned_cells.append(cell_text)
 
@@ -179,7 +744,10 @@ class ClaudeAnalyzer(BaseAnalyzer):
                         table_rows.append(' | '.join(cleaned_cells))
 
             if table_rows:
-                tables_text.append('\n'.join(table_rows))
+                table_text = '\n'.join(table_rows)
+                # Count the blank-line separator the join adds
+                total_chars += len(table_text) + (2 if tables_text else 0)
+                tables_text.append(table_text)
 
         return '\n\n'.join(tables_text)
 
@@ -204,70 +772,65 @@ class ClaudeAnalyzer(BaseAnalyzer):
         - Part I, Item 2: MD&A
         - Part II, Item 1A: Risk Factors
         """
+        content_key = hashlib.blake2b(
+            content.encode('utf-8', 'surrogatepass'), digest_size=16
+        ).digest()
+
+        with _sections_cache_lock:
+            cached = _sections_cache.get(content_key)
+            if cached is not None:
+                _sections_cache.move_to_end(content_key)
+                # Callers may modify the dict they get back
+                return dict(cached)
+
+        sections = self._extract_sections(content)
+
+        with _sections_cache_lock:
+            _sections_cache[content_key] = sections
+            if len(_sections_cache) > SECTIONS_CACHE_SIZE:
+                _sections_cache.popitem(last=False)
+
+        return dict(sections)
+
+    def _extract_sections(self, content: str) -> Dict[str, str]:
+        """
+        Extract relevant sections, bypassing the sections cache
+
+        Args:
+            content: Raw filing HTML/text
+
+        Returns:
+            Dictionary of section names to content
+        """
         sections = {}
 
         # Remove HTML tags for cleaner text
-        text = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r'<[^>]+>', ' ', text)
-        text = re.sub(r'\s+', ' ', text).strip()
-
-        # Extract key sections using regex patterns
-        # These patterns match common SEC filing section headers
-
-        # Business section (Item 1)
-        business_match = re.search(
-            r'(?:ITEM\s+1[^A\d]|Item\s+1[^A\d])(.{0,50}?)(?:BUSINESS|Business)(.*?)(?:ITEM\s+1A|Item\s+1A|ITEM\s+2|Item\s+2)',
-            text,
-            re.IGNORECASE | re.DOTALL
-        )
-        if business_match:
-            sections['business'] = business_match.group(2)[:10000]  # Limit to 10k chars
-
-        # Risk Factors (Item 1A)
-        risk_match = re.search(
-            r'(?:ITEM\s+1A|Item\s+1A)(.{0,50}?)(?:RISK FACTORS|Risk Factors)(.*?)(?:ITEM\s+1B|Item\s+1B|ITEM\s+2|Item\s+2)',
-            text,
-            re.IGNORECASE | re.DOTALL
-        )
-        if risk_match:
-            sections['risk_factors'] = risk_match.group(2)[:15000]  # Limit to 15k chars
-
-        # MD&A (Item 7 or Part I Item 2)
-        mda_match = re.search(
-            r'(?:ITEM\s+7|Item\s+7|ITEM\s+2|Item\s+2)(.{0,100}?)(?:MANAGEMENT.?S DISCUSSION AND ANALYSIS|Management.?s Discussion and Analysis)(.*?)(?:ITEM\s+7A|Item\s+7A|ITEM\s+8|Item\s+8|ITEM\s+3|Item\s+3)',
-            text,
-            re.IGNORECASE | re.DOTALL
-        )
-        if mda_match:
-            sections['md_and_a'] = mda_match.group(2)[:20000]  # Limit to 20k chars
+        text = _html_to_text(content)
+
+        # Locate section headings once, then slice each section from them
+        headings = _index_item_headings(text)
+
+        for name in ('business', 'risk_factors', 'md_and_a'):
+            section = _find_section(text, headings, name)
+            if section is not None:
+                sections[name] = section
 
         # Financial Statements (Item 8 or Part I Item 1)
-        is_html = '<table' in content.lower() or '<html' in content.lower()
+        # Searched in place; lowercasing would copy the whole filing twice
+        is_html = _HTML_MARKER_RE.search(content) is not None
 
         if is_html:
             # For HTML/XBRL filings, extract HTML tables for better financial data
-            html_tables = self._extract_html_tables(content)
+            html_tables = self._extract_html_tables(content, max_chars=30000)
             if html_tables:
                 sections['financial_statements'] = html_tables[:30000]  # Increased limit for table data
 
-            # Also try regex extraction as fallback
-            financial_match = re.search(
-                r'(?:ITEM\s+8|Item\s+8|ITEM\s+1[^A\d]|Item\s+1[^A\d])(.{0,100}?)(?:FINANCIAL STATEMENTS|Financial Statements)(.*?)(?:ITEM\s+9|Item\s+9|ITEM\s+2|Item\s+2)',
-                text,
-                re.IGNORECASE | re.DOTALL
-            )
-            if financial_match and 'financial_statements' not in sections:
-                sections['financial_statements'] = financial_match.group(2)[:15000]
-        else:
-            # Plain text filings use standard regex extraction
-            financial_match = re.search(
-                r'(?:ITEM\s+8|Item\s+8|ITEM\s+1[^A\d]|Item\s+1[^A\d])(.{0,100}?)(?:FINANCIAL STATEMENTS|Financial Statements)(.*?)(?:ITEM\s+9|Item\s+9|ITEM\s+2|Item\s+2)',
-                text,
-                re.IGNORECASE | re.DOTALL
-            )
-            if financial_match:
-                sections['financial_statements'] = financial_match.group(2)[:15000]
+        # Plain text filings, and HTML filings without tables, fall back to
+        # the section text
+        if 'financial_statements' not in sections:
+            financial = _find_section(text, headings, 'financial_statements')
+            if financial is not None:
+                sections['financial_statements'] = financial
 
         # If we didn't find specific sections, just take the first large chunk
         if not sections:
@@ -283,8 +846,14 @@ class ClaudeAnalyzer(BaseAnalyzer):
         filing_metadata: Dict[str, Any],
         sections: Dict[str, str],
         analysis_type: AnalysisType
-    ) -> str:
-        """Build prompt for Claude based on analysis type"""
+    ) -> List[Dict[str, Any]]:
+        """
+        Build prompt for Claude based on analysis type
+
+        Returns:
+            Message content blocks: the analysis type's fixed instructions,
+            marked as a prompt cache point, then the filing itself
+        """
 
         company_name = filing_metadata.get('company_name', filing_metadata['ticker'])
         filing_type = filing_metadata['filing_type']
@@ -292,7 +861,8 @@ class ClaudeAnalyzer(BaseAnalyzer):
 
         if analysis_type == AnalysisType.QUICK_SUMMARY:
             # TLDR prompt (free tier)
-            prompt = f"""Analyze this {filing_type} filing for {company_name} ({fiscal_period}) and provide a substantive summary for tech-savvy operators.
+            instructions = QUICK_SUMMARY_INSTRUCTIONS
+            filing_prompt = f"""Analyze this {filing_type} filing for {company_name} ({fiscal_period}) and provide a substantive summary for tech-savvy operators.
 
 **Context:**
 - Company: {company_name} ({filing_metadata['ticker']})
@@ -302,58 +872,12 @@ class ClaudeAnalyzer(BaseAnalyzer):
 **Filing Sections:**
 {self._format_sections_for_prompt(sections)}
 
-**Task:**
-Generate a TLDR summary in JSON format with the following structure:
-{{
-  "headline": "Attention-grabbing one-line summary (8-12 words)",
-  "summary": "4-6 sentence overview providing substantive context. Start with the headline insight, then explain what changed and why it matters. Include 2-3 specific metrics or examples. End with forward-looking implications.",
-  "key_points": [
-    {{
-      "title": "Financial Performance Overview",
-      "description": "Full paragraph (4-6 sentences) with headline insight and specific YoY/QoQ numbers. Explain margin trends and growth drivers with basis point changes. Include segment-level details. Discuss sustainability of metrics and changes from prior periods. End with implications for future trajectory."
-    }},
-    {{
-      "title": "Strategic Initiatives and Operational Changes",
-      "description": "Full paragraph (4-6 sentences) describing operational or strategic shifts. Explain why management made these changes and competitive implications. Include forward-looking indicators from commentary. Connect strategy to financial performance. Discuss execution risks and timeline."
-    }},
-    {{
-      "title": "Market Position and Competitive Dynamics",
-      "description": "Full paragraph (4-6 sentences) analyzing market share trends and positioning. Discuss customer concentration and retention metrics. Explain TAM expansion opportunities. Include competitive threats and advantages. Assess how the company is gaining or losing ground."
-    }},
-    {{
-      "title": "Operational Efficiency and Profitability",
-      "description": "Full paragraph (4-6 sentences) explaining operational leverage and cost structure. Discuss efficiency improvements or headwinds. Analyze gross and operating margin trends. Include productivity metrics if available. Assess sustainability of profitability improvements."
-    }},
-    {{
-      "title": "Growth Catalysts and Material Risks",
-      "description": "Full paragraph (4-6 sentences) identifying near and medium-term growth drivers. Discuss macro headwinds or tailwinds. Explain key risks material to investment thesis. Assess management's mitigation strategies. Provide forward-looking perspective on key metrics."
-    }}
-  ],
-  "sentiment_score": 0.5,  // -1 (very negative) to 1 (very positive)
-  "bull_case": "Concise 15-word maximum summary of the strongest bullish argument from this filing",
-  "bear_case": "Concise 15-word maximum summary of the strongest bearish argument or risk from this filing",
-  "key_metrics": {{
-    "revenue": "value with YoY/QoQ context",
-    "net_income": "value with YoY/QoQ context",
-    "rd_spend": "value with YoY/QoQ context and as % of revenue",
-    "growth_rate": "value with trend analysis",
-    "margins": "gross and operating with basis point changes",
-    // 4-6 other critical metrics with context
-  }}
-}}
-
-**Style Guide:**
-- Tone: Bloomberg Terminal meets The Diff (Byrne Hobart) - direct, analytical, substantive
-- Audience: Tech operators, founders, investors who want actionable insights
-- Focus: What matters for decision-making, strategic implications, second-order effects
-- Include: Specific numbers, comparisons, context, nuance
-- Avoid: Corporate speak, obvious statements, generic analysis, vague descriptions
-
 Respond with only valid JSON, no additional text."""
 
         else:
             # Deep analysis prompt (paid tier)
-            prompt = f"""Perform a comprehensive, substantive analysis of this {filing_type} filing for {company_name} ({fiscal_period}). This should be a 5-7 minute read with deep insights.
+            instructions = DEEP_ANALYSIS_INSTRUCTIONS
+            filing_prompt = f"""Perform a comprehensive, substantive analysis of this {filing_type} filing for {company_name} ({fiscal_period}). This should be a 5-7 minute read with deep insights.
 
 **Context:**
 - Company: {company_name} ({filing_metadata['ticker']})
@@ -363,126 +887,291 @@ Respond with only valid JSON, no additional text."""
 **Filing Sections:**
 {self._format_sections_for_prompt(sections)}
 
-**Task:**
-Generate a deep analysis in JSON format:
-{{
-  "headline": "Compelling headline (8-15 words)",
-  "tldr": {{
-    "summary": "4-6 sentence overview providing substantive context. Start with the headline insight, then explain what changed and why it matters. Include 2-3 specific metrics or examples. End with forward-looking implications.",
-    "key_points": [
-      {{
-        "title": "Financial Performance Overview",
-        "description": "Full paragraph (4-6 sentences) with headline insight and specific YoY/QoQ numbers. Explain margin trends and growth drivers with basis point changes. Include segment-level details. Discuss sustainability of metrics and changes from prior periods. End with implications for future trajectory."
-      }},
-      {{
-        "title": "Strategic Initiatives and Operational Changes",
-        "description": "Full paragraph (4-6 sentences) describing operational or strategic shifts. Explain why management made these changes and competitive implications. Include forward-looking indicators from commentary. Connect strategy to financial performance. Discuss execution risks and timeline."
-      }},
-      {{
-        "title": "Market Position and Competitive Dynamics",
-        "description": "Full paragraph (4-6 sentences) analyzing market share trends and positioning. Discuss customer concentration and retention metrics. Explain TAM expansion opportunities. Include competitive threats and advantages. Assess how the company is gaining or losing ground."
-      }},
-      {{
-        "title": "Operational Efficiency and Profitability",
-        "description": "Full paragraph (4-6 sentences) explaining operational leverage and cost structure. Discuss efficiency improvements or headwinds. Analyze gross and operating margin trends. Include productivity metrics if available. Assess sustainability of profitability improvements."
-      }},
-      {{
-        "title": "Growth Catalysts and Material Risks",
-        "description": "Full paragraph (4-6 sentences) identifying near and medium-term growth drivers. Discuss macro headwinds or tailwinds. Explain key risks material to investment thesis. Assess management's mitigation strategies. Provide forward-looking perspective on key metrics."
-      }}
-    ]
-  }},
-  "intro": "4-6 substantive paragraphs (250-350 words total) setting up the key themes. Start with the headline insight in context. Explain what changed YoY/QoQ with specific numbers. Identify 2-3 major themes. Provide competitive context. End with what this means for the business trajectory.",
-  "sections": [
-    {{
-      "title": "Financial Performance Deep Dive",
-      "content": "6-8 paragraphs (400-600 words). Break down revenue by segment with YoY/QoQ trends. Analyze margin expansion/compression with drivers. Discuss cash flow and capital allocation. Compare to peers. Identify inflection points or concerning trends. Include specific numbers, percentages, and basis point changes throughout."
-    }},
-    {{
-      "title": "Strategic Shifts and Product Evolution",
-      "content": "6-8 paragraphs (400-600 words). Analyze new product launches, R&D investments, strategic pivots. Discuss go-to-market changes. Examine partnerships and M&A. Connect product strategy to financials. Assess competitive positioning. Include forward-looking indicators from management commentary."
-    }},
-    {{
-      "title": "Market Dynamics and Competitive Position",
-      "content": "5-7 paragraphs (350-500 words). Assess market share trends. Analyze competitive threats and advantages. Discuss regulatory environment. Examine customer concentration and churn. Include macroeconomic factors affecting the business."
-    }},
-    {{
-      "title": "Risk Factors and Headwinds",
-      "content": "5-7 paragraphs (350-500 words). Deep dive into material risks from filing. Assess likelihood and potential impact. Discuss management's mitigation strategies. Compare to prior periods. Include second-order effects."
-    }},
-    {{
-      "title": "Growth Opportunities and Catalysts",
-      "content": "5-7 paragraphs (350-500 words). Identify untapped markets and expansion opportunities. Analyze operational leverage potential. Discuss innovation pipeline. Assess M&A potential. Include TAM analysis where relevant."
-    }}
-  ],
-  "conclusion": "5-6 paragraphs (300-400 words) synthesizing insights and forward-looking implications. Recap the 2-3 most important themes. Assess whether the business is accelerating or decelerating. Identify key metrics to watch in next quarter. Provide actionable takeaways for operators. End with contrarian or non-obvious insight.",
-  "key_metrics": {{
-    "revenue": "$XXX.XB (±X.X% YoY, ±X.X% QoQ) with segment breakdown and trend analysis",
-    "net_income": "$XXB (±X.X% YoY, ±X.X% QoQ) with margin context",
-    "rd_spend": "$XB (±X.X% YoY) and X.X% of revenue with trend analysis",
-    "gross_margin": "XX.X% (±XXbps YoY) with drivers explanation",
-    "operating_margin": "XX.X% (±XXbps YoY) with efficiency analysis",
-    "free_cash_flow": "$XXB (±X% YoY) with conversion rate",
-    "growth_indicators": {{
-      "customer_count": "details with growth rate",
-      "arr_or_bookings": "details with trends",
-      "retention_metrics": "details with cohort analysis"
-    }},
-    // 8-12 critical metrics total with full context
-  }},
-  "sentiment_score": 0.5,
-  "bull_case": "Concise 15-word maximum summary of the strongest bullish argument from this filing",
-  "bear_case": "Concise 15-word maximum summary of the strongest bearish argument or risk from this filing",
-  "risk_factors": [
-    "Specific risk 1 with quantified impact assessment",
-    "Specific risk 2 with likelihood and mitigation strategy",
-    "Specific risk 3 with industry context",
-    "Specific risk 4 if material"
-  ],
-  "opportunities": [
-    "Specific opportunity 1 with TAM/market size context",
-    "Specific opportunity 2 with timeline and barriers to entry",
-    "Specific opportunity 3 with competitive advantage analysis",
-    "Specific opportunity 4 if material"
-  ]
-}}
-
-**Analysis Framework:**
-1. **What Changed**: YoY/QoQ comparisons, inflection points, trend reversals
-2. **Why It Matters**: Strategic implications, competitive dynamics, market share shifts
-3. **What's Next**: Forward-looking indicators, management guidance, pipeline visibility
-4. **The Nuance**: What others might miss, second-order effects, non-obvious correlations
-5. **The Contrarian Take**: Challenge conventional wisdom, identify misunderstood aspects
-
-**Style Guide:**
-- Tone: Bloomberg Terminal meets Stratechery - authoritative, insightful, opinionated, substantive
-- Audience: Sophisticated tech operators, founders, investors who want deep understanding
-- Length: Each section should be 350-600 words for a total 5-7 minute read (2000-3000 words)
-- Focus: Strategic narrative woven with numbers, not just data dumps
-- Include: Specific figures, YoY/QoQ comparisons, segment breakdowns, direct quotes, concrete examples
-- Avoid: Hedging language, surface-level observations, obvious points, filler content
-
-**Critical**: This is PAID tier content. Make it substantially deeper and more insightful than a free summary.
-
 Respond with only valid JSON, no additional text."""
 
-        return prompt
+        return [
+            {
+                "type": "text",
+                "text": instructions,
+                "cache_control": {"type": "ephemeral"}
+            },
+            {
+                "type": "text",
+                "text": filing_prompt
+            }
+        ]
 
     def _format_sections_for_prompt(self, sections: Dict[str, str]) -> str:
         """Format extracted sections for inclusion in prompt"""
         formatted = []
         for section_name, content in sections.items():
-            # Clean up whitespace
-            content = re.sub(r'\s+', ' ', content).strip()
-            formatted.append(f"### {section_name.replace('_', ' ').title()}\n{content[:5000]}")  # Limit each section
+            # Clean up whitespace and limit each section
+            excerpt = _prompt_excerpt(content, SECTION_PROMPT_CHARS)
+            formatted.append(f"### {section_name.replace('_', ' ').title()}\n{excerpt}")
         return "\n\n".join(formatted)
 
-    def _call_bedrock(self, prompt: str) -> Dict[str, Any]:
+    def _summarize_section(self, section_name: str, content: str) -> str:
+        """
+        Condense one filing section to fit its share of the analysis prompt
+
+        Args:
+            section_name: Key from extract_relevant_sections()
+            content: Full section text
+
+        Returns:
+            Summary text
+
+        Raises:
+            AnalysisError: If the Bedrock call fails or returns no summary
+        """
+        title = section_name.replace('_', ' ').title()
+        prompt = [{
+            "type": "text",
+            "text": f"""Condense this {title} section of an SEC filing to at most {SECTION_PROMPT_CHARS} characters for an analyst who will not see the original.
+
+Keep every figure, period-over-period comparison, segment detail, named product, customer, risk and management statement of substance. Drop boilerplate, cross-references and legal hedging. Respond with the condensed text only.
+
+{content}"""
+        }]
+
+        response = self._call_bedrock(prompt, max_tokens=SECTION_SUMMARY_MAX_TOKENS)
+        summary = response['text'].strip()
+        if not summary:
+            raise AnalysisError(f"Empty summary for {title} section")
+
+        # Only cache usable summaries, so a bad one is retried fresh
+        if not response['cached']:
+            self._store_cached_response(response)
+        return summary
+
+    def _condense_sections(self, sections: Dict[str, str]) -> Dict[str, str]:
+        """
+        Replace over-long sections with summaries, summarizing in parallel
+
+        A section whose summary call fails keeps its full text, which
+        _format_sections_for_prompt then truncates as usual.
+
+        Args:
+            sections: Output of extract_relevant_sections()
+
+        Returns:
+            Sections with each one longer than SECTION_PROMPT_CHARS condensed
+        """
+        long_sections = [
+            name for name, content in sections.items()
+            if len(content) > SECTION_PROMPT_CHARS
+        ]
+        if not long_sections:
+            return sections
+
+        condensed = dict(sections)
+        with ThreadPoolExecutor(max_workers=len(long_sections)) as executor:
+            futures = {
+                name: executor.submit(self._summarize_section, name, sections[name])
+                for name in long_sections
+            }
+            for name, future in futures.items():
+                try:
+                    condensed[name] = future.result()
+                except AnalysisError as e:
+                    if self.logger:
+                        self.logger.warning(
+                            "Section summary failed, truncating instead",
+                            extra={'section': name, 'error': str(e)}
+                        )
+
+        return condensed
+
+    def _invoke_model(self, request_body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a single streaming request to Bedrock and assemble the reply
+
+        Streaming keeps bytes moving on the connection for the whole
+        generation, so long deep analyses don't hit the client read timeout.
+        Errors raised mid-stream surface while the events are read.
+
+        Args:
+            request_body: Body from _build_request_body()
+
+        Returns:
+            Message in invoke_model's response body shape, with content,
+            usage and stop_reason
+
+        Raises:
+            AnalysisError: If a stream event is not valid JSON
+        """
+        response = self.bedrock_client.invoke_model_with_response_stream(
+            modelId=self.model_id,
+            body=orjson.dumps(request_body),
+            contentType='application/json',
+            accept='application/json'
+        )
+
+        text_parts = []
+        usage = {}
+        stop_reason = None
+        for event in response['body']:
+            chunk = event.get('chunk')
+            if chunk is None:
+                continue
+            try:
+                data = orjson.loads(chunk['bytes'])
+            except orjson.JSONDecodeError as e:
+                raise AnalysisError(f"Malformed Bedrock stream event: {e}")
+
+            event_type = data.get('type')
+            if event_type == 'content_block_delta':
+                delta = data.get('delta', {})
+                if delta.get('type') == 'text_delta':
+                    text_parts.append(delta['text'])
+            elif event_type == 'message_start':
+                # Input and prompt cache token counts
+                usage.update(data.get('message', {}).get('usage', {}))
+            elif event_type == 'message_delta':
+                # Final output token count
+                usage.update(data.get('usage', {}))
+                stop_reason = data.get('delta', {}).get('stop_reason')
+
+        return {
+            'content': [{'type': 'text', 'text': ''.join(text_parts)}] if text_parts else [],
+            'usage': usage,
+            'stop_reason': stop_reason
+        }
+
+    def _request_cache_key(self, request_body: Dict[str, Any]) -> str:
+        """Hash everything that determines a Bedrock response"""
+        # Stays on the stdlib encoder: its exact output defines the keys
+        # already stored in bedrock_cache
+        payload = json.dumps({'modelId': self.model_id, 'body': request_body}, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _get_cached_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response, in process first and then in bedrock_cache
+
+        Args:
+            cache_key: Key from _request_cache_key()
+
+        Returns:
+            Cached response fields, or None on a miss
+        """
+        with _response_cache_lock:
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                _response_cache.move_to_end(cache_key)
+                return cached
+
+        if not self.db_connection:
+            return None
+
+        try:
+            with pooled_connection(_get_cache_pool(self.config)) as conn:
+                conn.autocommit = True
+                # Touch the entry on the way out so LRU pruning keeps it
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        UPDATE bedrock_cache SET last_used_at = NOW()
+                        WHERE prompt_sha = %s
+                        RETURNING response
+                    """, (cache_key,))
+                    row = cursor.fetchone()
+        except Exception as e:
+            # A missing table or column (migrations 012, 015 not applied),
+            # or every cache connection in use, just means no cache
+            if self.logger:
+                self.logger.warning("Bedrock cache lookup failed", extra={'error': str(e)})
+            return None
+
+        if not row:
+            return None
+
+        with _response_cache_lock:
+            _response_cache[cache_key] = row[0]
+            if len(_response_cache) > RESPONSE_CACHE_SIZE:
+                _response_cache.popitem(last=False)
+        return row[0]
+
+    def _store_cached_response(self, response: Dict[str, Any]):
+        """
+        Write a Bedrock response through to both caches
+
+        Args:
+            response: Result of _call_bedrock()
+        """
+        cache_key = response['cache_key']
+        entry = {
+            'text': response['text'],
+            'prompt_tokens': response['prompt_tokens'],
+            'completion_tokens': response['completion_tokens']
+        }
+
+        with _response_cache_lock:
+            _response_cache[cache_key] = entry
+            if len(_response_cache) > RESPONSE_CACHE_SIZE:
+                _response_cache.popitem(last=False)
+
+        if not self.db_connection:
+            return
+
+        try:
+            with pooled_connection(_get_cache_pool(self.config)) as conn:
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        INSERT INTO bedrock_cache (prompt_sha, model_id, response)
+                        VALUES (%s, %s, %s)
+                        ON CONFLICT (prompt_sha) DO NOTHING
+                    """, (cache_key, self.model_id, orjson.dumps(entry).decode('utf-8')))
+        except Exception as e:
+            if self.logger:
+                self.logger.warning("Bedrock cache write failed", extra={'error': str(e)})
+
+    @staticmethod
+    def _build_request_body(
+        prompt: List[Dict[str, Any]],
+        cache_prompt: bool = True,
+        max_tokens: int = 4096
+    ) -> Dict[str, Any]:
+        """
+        Build the invoke_model request body for Claude Sonnet 4.5
+
+        Args:
+            prompt: Content blocks from _build_analysis_prompt()
+            cache_prompt: Keep the prompt cache point; batch inference
+                records are sent without one
+            max_tokens: Completion budget
+
+        Returns:
+            Request body
+        """
+        if not cache_prompt:
+            prompt = [
+                {key: value for key, value in block.items() if key != 'cache_control'}
+                for block in prompt
+            ]
+        return {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": max_tokens,
+            "temperature": 0.7,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ]
+        }
+
+    def _call_bedrock(self, prompt: List[Dict[str, Any]], max_tokens: int = 4096) -> Dict[str, Any]:
         """
         Call AWS Bedrock with Claude model
 
+        Identical requests are answered from the response cache; the result
+        carries its cache_key and a cached flag so callers can write
+        fresh responses through with _store_cached_response().
+
         Args:
-            prompt: Prompt text
+            prompt: Content blocks from _build_analysis_prompt()
+            max_tokens: Completion budget
 
         Returns:
             Response from Claude
@@ -490,124 +1179,381 @@ Respond with only valid JSON, no additional text."""
         Raises:
             AnalysisError: If API call fails
         """
-        start_time = time.time()
+        start_time = time.monotonic()
 
-        try:
-            # Build request body for Claude Sonnet 4.5
-            request_body = {
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": 4096,
-                "temperature": 0.7,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
+        request_body = self._build_request_body(prompt, max_tokens=max_tokens)
+
+        cache_key = self._request_cache_key(request_body)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            if self.logger:
+                self.logger.info("Bedrock response served from cache", extra={'cache_key': cache_key})
+            return {
+                **cached,
+                'duration': time.monotonic() - start_time,
+                'cache_key': cache_key,
+                'cached': True
             }
 
-            # Call Bedrock with retry logic
-            max_retries = 3
-            retry_delay = 1  # seconds
-            last_exception = None
+        # Call Bedrock with retry logic
+        max_retries = BEDROCK_MAX_ATTEMPTS
+        last_exception = None
 
-            for attempt in range(max_retries):
-                try:
-                    response = self.bedrock_client.invoke_model(
-                        modelId=self.model_id,
-                        body=json.dumps(request_body),
-                        contentType='application/json',
-                        accept='application/json'
-                    )
-                    break  # Success - exit retry loop
+        # Rough token estimate (~4 chars per token) plus the completion budget
+        prompt_chars = sum(len(block['text']) for block in prompt)
+        estimated_tokens = prompt_chars // 4 + request_body['max_tokens']
 
-                except Exception as e:
-                    last_exception = e
-                    if attempt < max_retries - 1:
-                        # Exponential backoff with jitter
-                        wait_time = retry_delay * (2 ** attempt) + (time.time() % 1)
-                        if self.logger:
-                            self.logger.warning(
-                                f"Bedrock API call failed (attempt {attempt + 1}/{max_retries}), retrying in {wait_time:.1f}s",
-                                extra={'error': str(e)}
-                            )
-                        time.sleep(wait_time)
-                    else:
-                        # Final attempt failed
-                        raise AnalysisError(f"Bedrock API failed after {max_retries} attempts: {str(e)}")
+        for attempt in range(max_retries):
+            try:
+                if self.rate_limiter:
+                    with self.rate_limiter.acquire(estimated_tokens) as permit:
+                        response_body = self._invoke_model(request_body)
+                        permit.record_usage(response_body['usage'])
+                else:
+                    response_body = self._invoke_model(request_body)
+                break  # Success - exit retry loop
+
+            except (BotoCoreError, ClientError) as e:
+                last_exception = e
+                if not is_retryable_error(e):
+                    # Validation, access and similar errors won't clear up
+                    raise AnalysisError(f"Bedrock API error: {str(e)}")
+                if attempt < max_retries - 1:
+                    # Exponential backoff with full jitter, so workers
+                    # throttled together don't retry together
+                    wait_time = random.uniform(0, min(BEDROCK_MAX_BACKOFF, 2 ** attempt))
+                    if self.logger:
+                        self.logger.warning(
+                            f"Bedrock API call failed (attempt {attempt + 1}/{max_retries}), retrying in {wait_time:.1f}s",
+                            extra={'error': str(e)}
+                        )
+                    time.sleep(wait_time)
+                else:
+                    # Final attempt failed
+                    raise AnalysisError(f"Bedrock API failed after {max_retries} attempts: {str(e)}")
+
+        duration = time.monotonic() - start_time
 
-            # Parse response
-            response_body = json.loads(response['body'].read())
+        # Debug: Print full response to stderr
+        import sys
+        print(f"\n=== DEBUG: Full Bedrock Response ===", file=sys.stderr)
+        print(f"Response keys: {list(response_body.keys())}", file=sys.stderr)
+        print(f"Full response: {response_body}", file=sys.stderr)
+        print(f"=== END DEBUG ===\n", file=sys.stderr)
 
-            duration = time.time() - start_time
+        # Debug: Log full response structure
+        if self.logger:
+            self.logger.info(
+                f"Full Bedrock response structure",
+                extra={
+                    'response_keys': list(response_body.keys()),
+                    'response_body_sample': str(response_body)[:500]
+                }
+            )
+
+        # Extract usage stats; input_tokens excludes the tokens read from
+        # or written to the prompt cache, so add them back for the total
+        usage = response_body.get('usage', {})
+        cache_read_tokens = usage.get('cache_read_input_tokens', 0)
+        cache_write_tokens = usage.get('cache_creation_input_tokens', 0)
+        prompt_tokens = usage.get('input_tokens', 0) + cache_read_tokens + cache_write_tokens
+        completion_tokens = usage.get('output_tokens', 0)
+
+        if self.logger:
+            self.logger.info(
+                f"Bedrock API call completed",
+                extra={
+                    'duration_seconds': round(duration, 2),
+                    'prompt_tokens': prompt_tokens,
+                    'cache_read_tokens': cache_read_tokens,
+                    'cache_write_tokens': cache_write_tokens,
+                    'completion_tokens': completion_tokens,
+                    'total_tokens': prompt_tokens + completion_tokens
+                }
+            )
+
+        # Extract text from response
+        content_blocks = response_body.get('content', [])
+        if not content_blocks:
+            if self.logger:
+                self.logger.error(
+                    f"No content blocks in response",
+                    extra={'response_body': response_body}
+                )
+            raise AnalysisError("No content in Bedrock response")
 
-            # Debug: Print full response to stderr
-            import sys
-            print(f"\n=== DEBUG: Full Bedrock Response ===", file=sys.stderr)
-            print(f"Response keys: {list(response_body.keys())}", file=sys.stderr)
-            print(f"Full response: {response_body}", file=sys.stderr)
-            print(f"=== END DEBUG ===\n", file=sys.stderr)
+        text = content_blocks[0].get('text', '')
 
-            # Debug: Log full response structure
+        if not text:
             if self.logger:
-                self.logger.info(
-                    f"Full Bedrock response structure",
+                self.logger.error(
+                    f"Empty text in content block",
                     extra={
-                        'response_keys': list(response_body.keys()),
-                        'response_body_sample': str(response_body)[:500]
+                        'content_blocks': content_blocks,
+                        'first_block': content_blocks[0] if content_blocks else None
                     }
                 )
+            raise AnalysisError("Empty text response from Claude")
+
+        return {
+            'text': text,
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': completion_tokens,
+            'duration': duration,
+            'cache_key': cache_key,
+            'cached': False
+        }
+
+    # Filing fields the analysis prompt is built from
+    FILING_METADATA_QUERY = """
+        SELECT f.id::text, c.ticker, f.filing_type, f.fiscal_year, f.fiscal_quarter,
+               f.filing_date, c.name as company_name, f.raw_document_url
+        FROM filings f
+        JOIN companies c ON f.company_id = c.id
+        WHERE f.id = ANY($1)
+    """
+
+    @staticmethod
+    def _metadata_from_row(row: tuple) -> Dict[str, Any]:
+        """Build filing metadata from a FILING_METADATA_QUERY row"""
+        # Convert fiscal_quarter back to fiscal_period format
+        fiscal_quarter = row[4]
+        fiscal_period = f'Q{fiscal_quarter}' if fiscal_quarter else 'FY'
+
+        return {
+            'ticker': row[1],
+            'filing_type': row[2],
+            'fiscal_year': row[3],
+            'fiscal_period': fiscal_period,
+            'filing_date': row[5].isoformat(),
+            'company_name': row[6],
+            'raw_document_url': row[7]
+        }
+
+    def fetch_metadata_bulk(self, filing_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Load prompt metadata for several filings in one query
+
+        Args:
+            filing_ids: Database IDs of filings
+
+        Returns:
+            Filing ID to metadata (as from _get_filing_metadata); filings
+            that don't exist are absent
+        """
+        if not filing_ids:
+            return {}
+
+        cursor = self.db_connection.cursor()
+        execute_prepared(
+            cursor, 'analyzer_filing_metadata', self.FILING_METADATA_QUERY,
+            (list(filing_ids),), ('uuid[]',)
+        )
+        rows = cursor.fetchall()
+        cursor.close()
+
+        return {row[0]: self._metadata_from_row(row) for row in rows}
 
-            # Extract usage stats
-            usage = response_body.get('usage', {})
-            prompt_tokens = usage.get('input_tokens', 0)
-            completion_tokens = usage.get('output_tokens', 0)
+    def _get_filing_metadata(self, filing_id: str) -> Dict[str, Any]:
+        """
+        Load the filing fields the analysis prompt is built from
 
+        Args:
+            filing_id: Database ID of filing
+
+        Returns:
+            Dictionary with ticker, filing_type, fiscal_year, fiscal_period,
+            filing_date, company_name and raw_document_url
+
+        Raises:
+            AnalysisError: If the filing does not exist
+        """
+        filing_metadata = self.fetch_metadata_bulk([filing_id]).get(str(filing_id))
+
+        if not filing_metadata:
+            raise AnalysisError(f"Filing {filing_id} not found")
+
+        return filing_metadata
+
+    def _parse_analysis_json(
+        self,
+        filing_id: str,
+        text: str,
+        filing_metadata: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Parse Claude's JSON answer, unwrapping a markdown code block if needed
+
+        Raises:
+            AnalysisError: If the text holds no valid JSON
+        """
+        # Parse JSON response; a fenced answer can't parse, so skip straight
+        # to the code block search
+        if text.lstrip()[:1] == '{':
+            try:
+                return orjson.loads(text)
+            except orjson.JSONDecodeError:
+                pass
+
+        # Try to extract JSON from markdown code blocks
+        json_match = _JSON_BLOCK_RE.search(text)
+        if not json_match:
+            # Log the actual response for debugging data quality issues
             if self.logger:
-                self.logger.info(
-                    f"Bedrock API call completed",
+                self.logger.error(
+                    f"Claude returned non-JSON response (possible invalid filing)",
                     extra={
-                        'duration_seconds': round(duration, 2),
-                        'prompt_tokens': prompt_tokens,
-                        'completion_tokens': completion_tokens,
-                        'total_tokens': prompt_tokens + completion_tokens
+                        'filing_id': filing_id,
+                        'company': filing_metadata.get('ticker'),
+                        'filing_type': filing_metadata.get('filing_type'),
+                        'response': text[:1000]
                     }
                 )
+            raise AnalysisError(f"Failed to parse JSON response from Claude: {text[:200]}")
 
-            # Extract text from response
-            content_blocks = response_body.get('content', [])
-            if not content_blocks:
-                if self.logger:
-                    self.logger.error(
-                        f"No content blocks in response",
-                        extra={'response_body': response_body}
-                    )
-                raise AnalysisError("No content in Bedrock response")
+        try:
+            analysis_data = orjson.loads(json_match.group(1))
+        except orjson.JSONDecodeError as e:
+            if self.logger:
+                self.logger.error(
+                    f"Failed to parse JSON from markdown code block",
+                    extra={
+                        'filing_id': filing_id,
+                        'response_preview': text[:500],
+                        'error': str(e)
+                    }
+                )
+            raise AnalysisError(f"Failed to parse JSON response from Claude: {e}")
 
-            text = content_blocks[0].get('text', '')
+        return analysis_data
 
-            if not text:
-                if self.logger:
-                    self.logger.error(
-                        f"Empty text in content block",
-                        extra={
-                            'content_blocks': content_blocks,
-                            'first_block': content_blocks[0] if content_blocks else None
-                        }
-                    )
-                raise AnalysisError("Empty text response from Claude")
+    def _build_result(
+        self,
+        filing_id: str,
+        analysis_type: AnalysisType,
+        analysis_data: Dict[str, Any],
+        response: Dict[str, Any]
+    ) -> AnalysisResult:
+        """
+        Map parsed analysis JSON and response usage onto an AnalysisResult
 
-            return {
-                'text': text,
-                'prompt_tokens': prompt_tokens,
-                'completion_tokens': completion_tokens,
-                'duration': duration
-            }
+        Raises:
+            AnalysisError: If the JSON lacks a required field or has the
+                wrong shape
+        """
+        try:
+            return self._result_from_data(filing_id, analysis_type, analysis_data, response)
+        except (KeyError, TypeError, AttributeError) as e:
+            # Malformed model output, e.g. a missing "sections" key or a
+            # top-level array
+            raise AnalysisError(
+                f"Claude response is missing or has malformed fields: {type(e).__name__}: {e}"
+            )
 
-        except ClientError as e:
-            raise AnalysisError(f"Bedrock API error: {e}")
-        except Exception as e:
-            raise AnalysisError(f"Failed to call Bedrock: {e}")
+    def _result_from_data(
+        self,
+        filing_id: str,
+        analysis_type: AnalysisType,
+        analysis_data: Dict[str, Any],
+        response: Dict[str, Any]
+    ) -> AnalysisResult:
+        """Build the AnalysisResult; errors on malformed JSON are left to _build_result"""
+        # Build AnalysisResult
+        if analysis_type == AnalysisType.QUICK_SUMMARY:
+            result = AnalysisResult(
+                filing_id=filing_id,
+                tldr_headline=analysis_data['headline'],
+                tldr_summary=analysis_data['summary'],
+                tldr_key_points=analysis_data['key_points'],
+                key_metrics=analysis_data.get('key_metrics'),
+                sentiment_score=analysis_data.get('sentiment_score'),
+                bull_case=analysis_data.get('bull_case'),
+                bear_case=analysis_data.get('bear_case'),
+                model_version=self.model_id,
+                prompt_tokens=response['prompt_tokens'],
+                completion_tokens=response['completion_tokens'],
+                analysis_duration_seconds=response['duration']
+            )
+        else:
+            # Sections are rendered into the content row at save time, so
+            # check their shape here rather than partway through the insert
+            for section in analysis_data['sections']:
+                if not isinstance(section, dict) or 'title' not in section or 'content' not in section:
+                    raise AnalysisError(f"Claude returned a malformed section: {str(section)[:200]}")
+
+            # Deep analysis includes both TLDR and deep content
+            tldr = analysis_data.get('tldr', {})
+            result = AnalysisResult(
+                filing_id=filing_id,
+                # TLDR (for free tier users) - now from dedicated tldr section
+                tldr_headline=analysis_data['headline'],
+                tldr_summary=tldr.get('summary', analysis_data['intro'][:500]),  # Fallback to intro if no tldr
+                tldr_key_points=tldr.get('key_points', [s['title'] for s in analysis_data['sections'][:3]]),  # Fallback to sections
+                # Deep analysis (for paid tier)
+                deep_headline=analysis_data['headline'],
+                deep_intro=analysis_data['intro'],
+                deep_sections=analysis_data['sections'],
+                deep_conclusion=analysis_data['conclusion'],
+                key_metrics=analysis_data.get('key_metrics'),
+                sentiment_score=analysis_data.get('sentiment_score'),
+                bull_case=analysis_data.get('bull_case'),
+                bear_case=analysis_data.get('bear_case'),
+                risk_factors=analysis_data.get('risk_factors'),
+                opportunities=analysis_data.get('opportunities'),
+                model_version=self.model_id,
+                prompt_tokens=response['prompt_tokens'],
+                completion_tokens=response['completion_tokens'],
+                analysis_duration_seconds=response['duration']
+            )
+
+        return result
+
+    def _prepare_prompt(
+        self,
+        filing_id: str,
+        analysis_type: AnalysisType,
+        filing_metadata: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Build the analysis prompt for a filing
+
+        Args:
+            filing_id: Database ID of filing
+            analysis_type: Type of analysis to perform
+            filing_metadata: The filing's metadata, if already loaded
+
+        Returns:
+            (prompt, filing_metadata)
+        """
+        prefetched = self._prefetched.pop(filing_id, None)
+        if prefetched is not None:
+            return prefetched
+
+        if filing_metadata is None:
+            filing_metadata = self._get_filing_metadata(filing_id)
+
+        # Fetch the head of the filing; most carry their section headings
+        # well inside it. The metadata query already loaded the S3 URL.
+        s3_url = filing_metadata.get('raw_document_url')
+        content, complete = self._fetch_filing(filing_id, FILING_PREFIX_BYTES, s3_url)
+
+        # Extract relevant sections
+        sections = self.extract_relevant_sections(content)
+
+        # Fall back to the whole filing if any section lies past the prefix
+        if not complete and not all(name in sections for name in PREFIX_SECTIONS):
+            # Let the prefix go before the whole filing is downloaded
+            del content
+            content, _ = self._fetch_filing(filing_id, s3_url=s3_url)
+            sections = self.extract_relevant_sections(content)
+
+        if self.summarize_sections:
+            sections = self._condense_sections(sections)
+
+        # Build prompt
+        prompt = self._build_analysis_prompt(filing_metadata, sections, analysis_type)
+
+        return prompt, filing_metadata
 
     def analyze_filing(
         self,
@@ -634,122 +1580,19 @@ Respond with only valid JSON, no additional text."""
             )
 
         try:
-            # Get filing metadata
-            cursor = self.db_connection.cursor()
-            cursor.execute("""
-                SELECT c.ticker, f.filing_type, f.fiscal_year, f.fiscal_quarter,
-                       f.filing_date, c.name as company_name
-                FROM filings f
-                JOIN companies c ON f.company_id = c.id
-                WHERE f.id = %s
-            """, (filing_id,))
-
-            row = cursor.fetchone()
-            cursor.close()
-
-            if not row:
-                raise AnalysisError(f"Filing {filing_id} not found")
-
-            # Convert fiscal_quarter back to fiscal_period format
-            fiscal_quarter = row[3]
-            fiscal_period = f'Q{fiscal_quarter}' if fiscal_quarter else 'FY'
-
-            filing_metadata = {
-                'ticker': row[0],
-                'filing_type': row[1],
-                'fiscal_year': row[2],
-                'fiscal_period': fiscal_period,
-                'filing_date': row[4].isoformat(),
-                'company_name': row[5]
-            }
-
-            # Fetch filing content
-            content = self.fetch_filing_content(filing_id)
-
-            # Extract relevant sections
-            sections = self.extract_relevant_sections(content)
-
-            # Build prompt
-            prompt = self._build_analysis_prompt(filing_metadata, sections, analysis_type)
+            prompt, filing_metadata = self._prepare_prompt(filing_id, analysis_type)
 
             # Call Claude
             response = self._call_bedrock(prompt)
 
-            # Parse JSON response
-            try:
-                analysis_data = json.loads(response['text'])
-            except json.JSONDecodeError:
-                # Try to extract JSON from markdown code blocks
-                json_match = re.search(r'```(?:json)?\s*(\{.*\})\s*```', response['text'], re.DOTALL)
-                if json_match:
-                    try:
-                        analysis_data = json.loads(json_match.group(1))
-                    except json.JSONDecodeError as e:
-                        if self.logger:
-                            self.logger.error(
-                                f"Failed to parse JSON from markdown code block",
-                                extra={
-                                    'filing_id': filing_id,
-                                    'response_preview': response['text'][:500],
-                                    'error': str(e)
-                                }
-                            )
-                        raise AnalysisError(f"Failed to parse JSON response from Claude: {e}")
-                else:
-                    # Log the actual response for debugging data quality issues
-                    if self.logger:
-                        self.logger.error(
-                            f"Claude returned non-JSON response (possible invalid filing)",
-                            extra={
-                                'filing_id': filing_id,
-                                'company': filing_metadata.get('ticker'),
-                                'filing_type': filing_metadata.get('filing_type'),
-                                'response': response['text'][:1000]
-                            }
-                        )
-                    raise AnalysisError(f"Failed to parse JSON response from Claude: {response['text'][:200]}")
-
-            # Build AnalysisResult
-            if analysis_type == AnalysisType.QUICK_SUMMARY:
-                result = AnalysisResult(
-                    filing_id=filing_id,
-                    tldr_headline=analysis_data['headline'],
-                    tldr_summary=analysis_data['summary'],
-                    tldr_key_points=analysis_data['key_points'],
-                    key_metrics=analysis_data.get('key_metrics'),
-                    sentiment_score=analysis_data.get('sentiment_score'),
-                    bull_case=analysis_data.get('bull_case'),
-                    bear_case=analysis_data.get('bear_case'),
-                    model_version=self.model_id,
-                    prompt_tokens=response['prompt_tokens'],
-                    completion_tokens=response['completion_tokens'],
-                    analysis_duration_seconds=response['duration']
-                )
-            else:
-                # Deep analysis includes both TLDR and deep content
-                tldr = analysis_data.get('tldr', {})
-                result = AnalysisResult(
-                    filing_id=filing_id,
-                    # TLDR (for free tier users) - now from dedicated tldr section
-                    tldr_headline=analysis_data['headline'],
-                    tldr_summary=tldr.get('summary', analysis_data['intro'][:500]),  # Fallback to intro if no tldr
-                    tldr_key_points=tldr.get('key_points', [s['title'] for s in analysis_data['sections'][:3]]),  # Fallback to sections
-                    # Deep analysis (for paid tier)
-                    deep_headline=analysis_data['headline'],
-                    deep_intro=analysis_data['intro'],
-                    deep_sections=analysis_data['sections'],
-                    deep_conclusion=analysis_data['conclusion'],
-                    key_metrics=analysis_data.get('key_metrics'),
-                    sentiment_score=analysis_data.get('sentiment_score'),
-                    bull_case=analysis_data.get('bull_case'),
-                    bear_case=analysis_data.get('bear_case'),
-                    risk_factors=analysis_data.get('risk_factors'),
-                    opportunities=analysis_data.get('opportunities'),
-                    model_version=self.model_id,
-                    prompt_tokens=response['prompt_tokens'],
-                    completion_tokens=response['completion_tokens'],
-                    analysis_duration_seconds=response['duration']
-                )
+            analysis_data = self._parse_analysis_json(filing_id, response['text'], filing_metadata)
+
+            result = self._build_result(filing_id, analysis_type, analysis_data, response)
+
+            # Only cache responses that parsed into a result, so a bad one
+            # is retried fresh
+            if not response['cached']:
+                self._store_cached_response(response)
 
             if self.logger:
                 self.logger.info(
@@ -762,7 +1605,11 @@ Respond with only valid JSON, no additional text."""
 
             return result
 
-        except Exception as e:
+        except AnalysisError as e:
+            if self.logger:
+                self.logger.error(f"Analysis failed", exception=e, extra={'filing_id': filing_id})
+            raise
+        except (FetchError, psycopg2.Error) as e:
             if self.logger:
                 self.logger.error(f"Analysis failed", exception=e, extra={'filing_id': filing_id})
             raise AnalysisError(f"Failed to analyze filing: {e}")
@@ -781,6 +1628,61 @@ Respond with only valid JSON, no additional text."""
 
         return f"{ticker_lower}/{fiscal_year}/{period}/{filing_type_lower}"
 
+    # Filing fields save_to_database needs for the content row
+    FILING_SAVE_QUERY = """
+        SELECT f.id::text, f.company_id, c.ticker, f.filing_type, f.fiscal_year, f.fiscal_quarter
+        FROM filings f
+        JOIN companies c ON f.company_id = c.id
+        WHERE f.id = ANY($1)
+    """
+
+    def _content_row(self, result: AnalysisResult, filing_row: tuple) -> tuple:
+        """
+        Map an AnalysisResult onto the content table's insert columns
+
+        Args:
+            result: AnalysisResult to save
+            filing_row: The filing's FILING_SAVE_QUERY row
+
+        Returns:
+            Values for (filing_id, company_id, slug, executive_summary,
+            key_takeaways, deep_dive_opportunities, deep_dive_risks,
+            deep_dive_strategy, implications)
+        """
+        _, company_id, ticker, filing_type, fiscal_year, fiscal_quarter = filing_row
+
+        # Generate slug
+        slug = self._generate_slug(ticker, filing_type, fiscal_year, fiscal_quarter)
+
+        # Map AnalysisResult to existing content table schema
+        # Combine deep analysis sections into text blocks
+        deep_dive_strategy = ""
+        if result.deep_sections:
+            for section in result.deep_sections:
+                deep_dive_strategy += f"## {section['title']}\n\n{section['content']}\n\n"
+
+        return (
+            result.filing_id,
+            company_id,
+            slug,
+            result.tldr_summary or result.deep_intro,
+            orjson.dumps({
+                'headline': result.tldr_headline,
+                'points': result.tldr_key_points,
+                'metrics': result.key_metrics,
+                'sentiment': result.sentiment_score,
+                'bull_case': result.bull_case,
+                'bear_case': result.bear_case,
+                'model': result.model_version,
+                'tokens': (result.prompt_tokens or 0) + (result.completion_tokens or 0),
+                'duration': result.analysis_duration_seconds
+            }).decode('utf-8'),
+            '\n\n'.join(result.opportunities) if result.opportunities else None,
+            '\n\n'.join(result.risk_factors) if result.risk_factors else None,
+            deep_dive_strategy if deep_dive_strategy else (result.deep_intro or ''),
+            result.deep_conclusion
+        )
+
     def save_to_database(
         self,
         result: AnalysisResult,
@@ -806,95 +1708,150 @@ Respond with only valid JSON, no additional text."""
             cursor = self.db_connection.cursor()
 
             # Get company_id and filing metadata from filing_id
-            cursor.execute(
-                "SELECT company_id, ticker FROM filings f JOIN companies c ON f.company_id = c.id WHERE f.id = %s",
-                (result.filing_id,)
-            )
-            row = cursor.fetchone()
-            if not row:
-                raise DatabaseError(f"Filing {result.filing_id} not found")
-            company_id, ticker = row
-
-            # Get additional filing info for slug generation
-            cursor.execute(
-                "SELECT filing_type, fiscal_year, fiscal_quarter FROM filings WHERE id = %s",
-                (result.filing_id,)
+            execute_prepared(
+                cursor, 'analyzer_filing_save', self.FILING_SAVE_QUERY,
+                ([result.filing_id],), ('uuid[]',)
             )
             filing_row = cursor.fetchone()
             if not filing_row:
-                raise DatabaseError(f"Filing metadata not found for {result.filing_id}")
-            filing_type, fiscal_year, fiscal_quarter = filing_row
-
-            # Generate slug
-            slug = self._generate_slug(ticker, filing_type, fiscal_year, fiscal_quarter)
+                self.db_connection.rollback()
+                raise DatabaseError(f"Filing {result.filing_id} not found")
 
-            # Map AnalysisResult to existing content table schema
-            # Combine deep analysis sections into text blocks
-            deep_dive_strategy = ""
-            if result.deep_sections:
-                for section in result.deep_sections:
-                    deep_dive_strategy += f"## {section['title']}\n\n{section['content']}\n\n"
+            row = self._content_row(result, filing_row)
 
-            # Insert content record with slug
+            # Insert content record with slug, mark the filing analyzed and
+            # queue a progress notification (sent on commit) in a single
+            # round trip
             cursor.execute("""
-                INSERT INTO content (
-                    filing_id,
-                    company_id,
-                    slug,
-                    executive_summary,
-                    key_takeaways,
-                    deep_dive_opportunities,
-                    deep_dive_risks,
-                    deep_dive_strategy,
-                    implications
+                WITH inserted AS (
+                    INSERT INTO content (
+                        filing_id,
+                        company_id,
+                        slug,
+                        executive_summary,
+                        key_takeaways,
+                        deep_dive_opportunities,
+                        deep_dive_risks,
+                        deep_dive_strategy,
+                        implications
+                    )
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    RETURNING id, filing_id
+                ),
+                updated AS (
+                    UPDATE filings SET status = 'analyzed'
+                    WHERE id = (SELECT filing_id FROM inserted)
                 )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                RETURNING id
-            """, (
-                result.filing_id,
-                company_id,
-                slug,
-                result.tldr_summary or result.deep_intro,
-                json.dumps({
-                    'headline': result.tldr_headline,
-                    'points': result.tldr_key_points,
-                    'metrics': result.key_metrics,
-                    'sentiment': result.sentiment_score,
-                    'bull_case': result.bull_case,
-                    'bear_case': result.bear_case,
-                    'model': result.model_version,
-                    'tokens': (result.prompt_tokens or 0) + (result.completion_tokens or 0),
-                    'duration': result.analysis_duration_seconds
-                }),
-                '\n\n'.join(result.opportunities) if result.opportunities else None,
-                '\n\n'.join(result.risk_factors) if result.risk_factors else None,
-                deep_dive_strategy if deep_dive_strategy else (result.deep_intro or ''),
-                result.deep_conclusion
-            ))
+                SELECT id, pg_notify(%s, filing_id::text) FROM inserted
+            """, (*row, ANALYZE_PROGRESS_CHANNEL))
 
             content_id = cursor.fetchone()[0]
 
-            # Update filing status
-            cursor.execute(
-                "UPDATE filings SET status = 'analyzed' WHERE id = %s",
-                (result.filing_id,)
-            )
-
             self.db_connection.commit()
             cursor.close()
 
             if self.logger:
                 self.logger.info(
                     f"Saved analysis to database",
-                    extra={'content_id': content_id, 'filing_id': result.filing_id, 'slug': slug}
+                    extra={'content_id': content_id, 'filing_id': result.filing_id, 'slug': row[2]}
                 )
 
             return content_id
 
-        except Exception as e:
+        except psycopg2.Error as e:
             self.db_connection.rollback()
             raise DatabaseError(f"Failed to save analysis to database: {e}")
 
+    def save_to_database_bulk(
+        self,
+        results: List[AnalysisResult],
+        status: str = 'published'
+    ) -> List[str]:
+        """
+        Save several analysis results in one transaction
+
+        Content rows are inserted with execute_values, the filings marked
+        analyzed and a progress notification queued per filing, all in one
+        statement per 500 results and a single commit.
+
+        Args:
+            results: AnalysisResults to save
+            status: Content status
+
+        Returns:
+            Database IDs of the created content records, in results order
+
+        Raises:
+            DatabaseError: If any result fails to save (none are saved)
+        """
+        if not self.db_connection:
+            raise DatabaseError("No database connection available")
+
+        if not results:
+            return []
+
+        try:
+            cursor = self.db_connection.cursor()
+
+            execute_prepared(
+                cursor, 'analyzer_filing_save', self.FILING_SAVE_QUERY,
+                ([result.filing_id for result in results],), ('uuid[]',)
+            )
+            filing_rows = {row[0]: row for row in cursor.fetchall()}
+
+            rows = []
+            for result in results:
+                filing_row = filing_rows.get(str(result.filing_id))
+                if not filing_row:
+                    self.db_connection.rollback()
+                    raise DatabaseError(f"Filing {result.filing_id} not found")
+                rows.append(self._content_row(result, filing_row))
+
+            inserted = execute_values(cursor, sql.SQL("""
+                WITH inserted AS (
+                    INSERT INTO content (
+                        filing_id,
+                        company_id,
+                        slug,
+                        executive_summary,
+                        key_takeaways,
+                        deep_dive_opportunities,
+                        deep_dive_risks,
+                        deep_dive_strategy,
+                        implications
+                    )
+                    VALUES %s
+                    RETURNING id, filing_id
+                ),
+                updated AS (
+                    UPDATE filings SET status = 'analyzed'
+                    WHERE id IN (SELECT filing_id FROM inserted)
+                )
+                SELECT filing_id::text, id, pg_notify({channel}, filing_id::text) FROM inserted
+            """).format(channel=sql.Literal(ANALYZE_PROGRESS_CHANNEL)), rows,
+                template="(%s::uuid, %s, %s, %s, %s, %s, %s, %s, %s)",
+                page_size=500,
+                fetch=True
+            )
+
+            self.db_connection.commit()
+            cursor.close()
+
+            # RETURNING order isn't guaranteed to follow VALUES order
+            content_ids = {filing_id: content_id for filing_id, content_id, _ in inserted}
+
+            if self.logger:
+                self.logger.info(
+                    f"Saved {len(results)} analyses to database",
+                    extra={'count': len(results)}
+                )
+
+            return [content_ids[str(result.filing_id)] for result in results]
+
+        except psycopg2.Error as e:
+            self.db_connection.rollback()
+            raise DatabaseError(f"Failed to save analyses to database: {e}")
+
     def count_pending_filings(self) -> int:
         """
         Count the number of filings pending analysis
@@ -942,12 +1899,11 @@ Respond with only valid JSON, no additional text."""
                 JOIN companies c ON f.company_id = c.id
                 WHERE f.status = 'pending'
                 ORDER BY f.id DESC
+                LIMIT %s
             """
 
-            if limit:
-                query += f" LIMIT {limit}"
-
-            cursor.execute(query)
+            # LIMIT NULL returns all rows
+            cursor.execute(query, (limit or None,))
             columns = ['filing_id', 'ticker', 'filing_type']
             filings = [dict(zip(columns, row)) for row in cursor.fetchall()]
             cursor.close()
@@ -956,13 +1912,269 @@ Respond with only valid JSON, no additional text."""
         except Exception as e:
             raise DatabaseError(f"Failed to get pending filings: {e}")
 
-    def analyze_batch(self, limit: Optional[int] = None, workers: int = 3) -> Dict[str, int]:
+    def _process_filing_pooled(
+        self,
+        filing_id: str,
+        pool: ThreadedConnectionPool,
+        analysis_type: AnalysisType,
+        skip_existing: bool,
+        prefetched: Optional[Tuple[List[Dict[str, Any]], Dict[str, Any]]] = None
+    ) -> Optional[str]:
+        """
+        Run process_filing on a pooled connection (called on a worker thread)
+
+        A connection carries one transaction at a time, so each filing gets
+        its own connection and an analyzer that shares this one's Bedrock
+        clients and rate limiter. prefetched, if given, is the filing's
+        already-built (prompt, filing_metadata).
+        """
+        conn = pool.getconn()
+        try:
+            analyzer = ClaudeAnalyzer(
+                self.config,
+                conn,
+                self.logger,
+                rate_limiter=self.rate_limiter,
+                aws_clients=(self.bedrock_client, self.s3_client),
+                summarize_sections=self.summarize_sections
+            )
+            if prefetched is not None:
+                analyzer._prefetched[filing_id] = prefetched
+            return analyzer.process_filing(filing_id, analysis_type, skip_existing)
+        finally:
+            # putconn() rolls back any transaction left open
+            pool.putconn(conn)
+
+    def _analyze_filing_pooled(
+        self,
+        filing_id: str,
+        pool: ThreadedConnectionPool,
+        analysis_type: AnalysisType
+    ) -> AnalysisResult:
+        """
+        Run analyze_filing on a pooled connection (called on a worker thread)
+
+        Like _process_filing_pooled, but nothing is saved.
+        """
+        conn = pool.getconn()
+        try:
+            analyzer = ClaudeAnalyzer(
+                self.config,
+                conn,
+                self.logger,
+                rate_limiter=self.rate_limiter,
+                aws_clients=(self.bedrock_client, self.s3_client),
+                summarize_sections=self.summarize_sections
+            )
+            return analyzer.analyze_filing(filing_id, analysis_type)
+        finally:
+            # putconn() rolls back any transaction left open
+            pool.putconn(conn)
+
+    def _lookup_batch_pooled(
+        self,
+        filing_ids: List[str],
+        pool: ThreadedConnectionPool,
+        skip_existing: bool
+    ) -> Tuple[Dict[str, Dict[str, Any]], Set[str]]:
+        """
+        Load metadata and analyzed status for a batch in two queries
+
+        Returns:
+            (filing ID to metadata, IDs of filings already analyzed; empty
+            unless skip_existing)
+        """
+        conn = pool.getconn()
+        try:
+            analyzer = ClaudeAnalyzer(
+                self.config,
+                conn,
+                self.logger,
+                rate_limiter=self.rate_limiter,
+                aws_clients=(self.bedrock_client, self.s3_client),
+                summarize_sections=self.summarize_sections
+            )
+            metadata = analyzer.fetch_metadata_bulk(filing_ids)
+            analyzed = analyzer.check_if_analyzed_bulk(filing_ids) if skip_existing else set()
+            return metadata, analyzed
+        finally:
+            pool.putconn(conn)
+
+    def _prefetch_pooled(
+        self,
+        filing_id: str,
+        pool: ThreadedConnectionPool,
+        analysis_type: AnalysisType,
+        filing_metadata: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Fetch a filing and build its prompt on a pooled connection
+
+        Returns:
+            (prompt, filing_metadata)
+        """
+        conn = pool.getconn()
+        try:
+            analyzer = ClaudeAnalyzer(
+                self.config,
+                conn,
+                self.logger,
+                rate_limiter=self.rate_limiter,
+                aws_clients=(self.bedrock_client, self.s3_client),
+                summarize_sections=self.summarize_sections
+            )
+            return analyzer._prepare_prompt(filing_id, analysis_type, filing_metadata)
+        finally:
+            pool.putconn(conn)
+
+    async def process_filing_async(
+        self,
+        filing_id: str,
+        pool: ThreadedConnectionPool,
+        executor: Optional[Executor] = None,
+        analysis_type: AnalysisType = AnalysisType.DEEP_ANALYSIS,
+        skip_existing: bool = True
+    ) -> Optional[str]:
+        """
+        Analyze and save a filing without blocking the event loop
+
+        boto3 and psycopg2 are blocking, so the work runs on executor (the
+        loop's default executor if None).
+
+        Args:
+            filing_id: Database ID of filing
+            pool: Connection pool to borrow the filing's connection from
+            executor: Executor to run on
+            analysis_type: Type of analysis to perform
+            skip_existing: Skip if content already exists
+
+        Returns:
+            Database ID of created content, or None if skipped
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor,
+            self._process_filing_pooled,
+            filing_id,
+            pool,
+            analysis_type,
+            skip_existing
+        )
+
+    async def process_filings_batch(
+        self,
+        filing_ids: List[str],
+        pool: ThreadedConnectionPool,
+        workers: int = 3,
+        analysis_type: AnalysisType = AnalysisType.DEEP_ANALYSIS,
+        skip_existing: bool = True,
+        prefetch_depth: int = PREFETCH_DEPTH
+    ) -> List[Union[Optional[str], BaseException]]:
+        """
+        Analyze and save several filings concurrently
+
+        Metadata and analyzed status for the whole batch are loaded up
+        front in two queries. A prefetch thread then fetches each filing
+        from S3 and builds its prompt up to prefetch_depth filings ahead of
+        the workers, so S3 reads and section extraction overlap Bedrock
+        calls instead of preceding them.
+
+        Args:
+            filing_ids: Database IDs of filings
+            pool: Connection pool with at least `workers + 1` connections
+            workers: Filings in flight at once
+            analysis_type: Type of analysis to perform
+            skip_existing: Skip filings that already have content
+            prefetch_depth: Prompts to build ahead of the workers
+
+        Returns:
+            One entry per filing, in order: content ID, None if skipped, or
+            the exception that filing raised
+        """
+        loop = asyncio.get_running_loop()
+        results: List[Union[Optional[str], BaseException]] = [None] * len(filing_ids)
+        prepared_queue: asyncio.Queue = asyncio.Queue(maxsize=prefetch_depth)
+
+        async def prefetch(executor: Executor):
+            try:
+                metadata, analyzed = await loop.run_in_executor(
+                    executor, self._lookup_batch_pooled, filing_ids, pool, skip_existing
+                )
+            except Exception as e:
+                metadata, analyzed = e, set()
+
+            for idx, filing_id in enumerate(filing_ids):
+                if str(filing_id) in analyzed:
+                    prepared = None
+                elif isinstance(metadata, Exception):
+                    prepared = metadata
+                elif str(filing_id) not in metadata:
+                    prepared = AnalysisError(f"Filing {filing_id} not found")
+                else:
+                    try:
+                        prepared = await loop.run_in_executor(
+                            executor,
+                            self._prefetch_pooled,
+                            filing_id,
+                            pool,
+                            analysis_type,
+                            metadata[str(filing_id)]
+                        )
+                    except Exception as e:
+                        prepared = e
+                await prepared_queue.put((idx, filing_id, prepared))
+
+            # One stop sentinel per worker
+            for _ in range(workers):
+                await prepared_queue.put(None)
+
+        async def analyze(executor: Executor):
+            while (item := await prepared_queue.get()) is not None:
+                idx, filing_id, prepared = item
+                if prepared is None or isinstance(prepared, Exception):
+                    # Skipped, or failed before reaching Bedrock
+                    results[idx] = prepared
+                    continue
+                # Already checked against the batch-wide analyzed set
+                try:
+                    results[idx] = await loop.run_in_executor(
+                        executor,
+                        self._process_filing_pooled,
+                        filing_id,
+                        pool,
+                        analysis_type,
+                        False,
+                        prepared
+                    )
+                except Exception as e:
+                    results[idx] = e
+
+        with ThreadPoolExecutor(max_workers=1) as prefetch_executor, \
+                ThreadPoolExecutor(max_workers=workers) as executor:
+            await asyncio.gather(
+                prefetch(prefetch_executor),
+                *(analyze(executor) for _ in range(workers))
+            )
+
+        return results
+
+    def analyze_batch(
+        self,
+        limit: Optional[int] = None,
+        workers: int = 3,
+        save: bool = False
+    ) -> Dict[str, int]:
         """
         Analyze a batch of pending filings
 
+        Filings are analyzed concurrently, `workers` at a time, each on its
+        own pooled connection.
+
         Args:
             limit: Maximum number of filings to analyze (None = all pending)
-            workers: Number of parallel workers (currently not used, for future parallelization)
+            workers: Number of filings analyzed in parallel
+            save: Also save each analysis to the database (as
+                process_filing does); by default results are discarded
 
         Returns:
             Dictionary with keys 'analyzed' and 'failed'
@@ -974,19 +2186,245 @@ Respond with only valid JSON, no additional text."""
             raise DatabaseError("No database connection available")
 
         filings = self.get_pending_filings(limit=limit)
-        analyzed_count = 0
-        failed_count = 0
+        if not filings:
+            return {'analyzed': 0, 'failed': 0}
+
+        # Keep concurrent Bedrock calls inside the account's quotas
+        if not self.rate_limiter:
+            self.rate_limiter = BedrockRateLimiter(max_concurrency=workers)
+
+        try:
+            pool = create_connection_pool(self.config, min_size=1, max_size=workers)
+        except Exception as e:
+            raise DatabaseError(f"Failed to create connection pool: {e}")
+
+        counts = {'analyzed': 0, 'failed': 0}
+
+        async def analyze(filing, executor):
+            try:
+                if save:
+                    await self.process_filing_async(filing['filing_id'], pool, executor)
+                else:
+                    await asyncio.get_running_loop().run_in_executor(
+                        executor,
+                        self._analyze_filing_pooled,
+                        filing['filing_id'],
+                        pool,
+                        AnalysisType.DEEP_ANALYSIS
+                    )
+                return filing, None
+            except Exception as e:
+                return filing, e
+
+        async def run():
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Report filings as they finish
+                pending = [analyze(filing, executor) for filing in filings]
+                for idx, next_done in enumerate(asyncio.as_completed(pending), 1):
+                    filing, error = await next_done
+                    if error is None:
+                        counts['analyzed'] += 1
+                        print(f"  [{idx}/{len(filings)}] ✓ {filing['ticker']} ({filing['filing_type']}) analyzed successfully")
+                    else:
+                        counts['failed'] += 1
+                        error_msg = str(error)[:200]  # Truncate long errors
+                        print(f"  [{idx}/{len(filings)}] ✗ {filing['ticker']} ({filing['filing_type']}) - {error_msg}")
+                        if self.logger:
+                            self.logger.error(f"Failed to analyze {filing['ticker']}: {error}")
+
+        try:
+            asyncio.run(run())
+        finally:
+            pool.closeall()
+
+        return counts
+
+    def _bedrock_control_client(self):
+        """Bedrock control-plane client (batch jobs are not on bedrock-runtime)"""
+        return boto3.client(
+            'bedrock',
+            region_name=self.config.aws.region,
+            aws_access_key_id=self.config.aws.access_key_id,
+            aws_secret_access_key=self.config.aws.secret_access_key
+        )
+
+    def submit_batch_job(
+        self,
+        filing_ids: List[str],
+        analysis_type: AnalysisType = AnalysisType.DEEP_ANALYSIS
+    ) -> str:
+        """
+        Submit filings to Bedrock batch inference
+
+        Batch jobs are billed below on-demand invocations and do not count
+        against the account's on-demand quotas, at the cost of latency (jobs
+        can take up to a day). Suited to bulk backfills; see poll_and_ingest().
+        Bedrock requires a minimum number of records per job (100 by
+        default).
+
+        Args:
+            filing_ids: Database IDs of filings to analyze
+            analysis_type: Type of analysis to perform
+
+        Returns:
+            ARN of the model invocation job
+
+        Raises:
+            AnalysisError: If no prompt could be built or the job is rejected
+        """
+        if not self.config.aws.bedrock_batch_role_arn:
+            raise AnalysisError("BEDROCK_BATCH_ROLE_ARN is required for batch inference")
+
+        lines = []
+        for filing_id in filing_ids:
+            try:
+                prompt, _ = self._prepare_prompt(filing_id, analysis_type)
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(
+                        f"Skipping filing in batch job",
+                        extra={'filing_id': filing_id, 'error': str(e)}
+                    )
+                continue
+            lines.append(orjson.dumps({
+                'recordId': str(filing_id),
+                'modelInput': self._build_request_body(prompt, cache_prompt=False)
+            }))
+
+        if not lines:
+            raise AnalysisError("No filings could be prepared for the batch job")
+
+        job_name = f"10kay-analysis-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        bucket = self.config.aws.bedrock_batch_bucket
+
+        try:
+            self.s3_client.put_object(
+                Bucket=bucket,
+                Key=f"batch-inference/input/{job_name}.jsonl",
+                Body=b'\n'.join(lines)
+            )
+
+            response = self._bedrock_control_client().create_model_invocation_job(
+                jobName=job_name,
+                roleArn=self.config.aws.bedrock_batch_role_arn,
+                modelId=self.model_id,
+                inputDataConfig={
+                    's3InputDataConfig': {
+                        's3InputFormat': 'JSONL',
+                        's3Uri': f"s3://{bucket}/batch-inference/input/{job_name}.jsonl"
+                    }
+                },
+                outputDataConfig={
+                    's3OutputDataConfig': {
+                        's3Uri': f"s3://{bucket}/batch-inference/output/"
+                    }
+                }
+            )
+        except ClientError as e:
+            raise AnalysisError(f"Failed to submit batch job: {e}")
+
+        if self.logger:
+            self.logger.info(
+                f"Submitted batch job {job_name}",
+                extra={'job_arn': response['jobArn'], 'records': len(lines)}
+            )
+
+        return response['jobArn']
+
+    def poll_and_ingest(
+        self,
+        job_arn: str,
+        analysis_type: AnalysisType = AnalysisType.DEEP_ANALYSIS,
+        poll_interval: float = 60.0
+    ) -> Dict[str, int]:
+        """
+        Wait for a batch job to finish and save its analyses
+
+        Args:
+            job_arn: ARN returned by submit_batch_job()
+            analysis_type: Type of analysis the job was submitted with
+            poll_interval: Seconds between job status checks
+
+        Returns:
+            Dictionary with keys 'analyzed' and 'failed'
+
+        Raises:
+            AnalysisError: If the job fails or its output cannot be read
+        """
+        control = self._bedrock_control_client()
+
+        while True:
+            job = control.get_model_invocation_job(jobIdentifier=job_arn)
+            status = job['status']
+            if status in ('Completed', 'PartiallyCompleted'):
+                break
+            if status in ('Failed', 'Stopped', 'Expired'):
+                raise AnalysisError(f"Batch job {job_arn} ended with status {status}: {job.get('message', '')}")
+            time.sleep(poll_interval)
+
+        # Output lands at <output prefix>/<job id>/<input file name>.out
+        bucket, prefix = job['outputDataConfig']['s3OutputDataConfig']['s3Uri'][5:].split('/', 1)
+        input_name = job['inputDataConfig']['s3InputDataConfig']['s3Uri'].rsplit('/', 1)[1]
+        key = f"{prefix.rstrip('/')}/{job_arn.rsplit('/', 1)[1]}/{input_name}.out"
+
+        try:
+            body = self.s3_client.get_object(Bucket=bucket, Key=key)['Body']
+        except ClientError as e:
+            raise AnalysisError(f"Failed to read batch output s3://{bucket}/{key}: {e}")
+
+        counts = {'analyzed': 0, 'failed': 0}
+        results = []
+
+        for line in body.iter_lines():
+            if not line:
+                continue
+            record = orjson.loads(line)
+            filing_id = record['recordId']
 
-        for idx, filing in enumerate(filings, 1):
             try:
-                self.analyze_filing(filing['filing_id'])
-                analyzed_count += 1
-                print(f"  [{idx}/{len(filings)}] ✓ {filing['ticker']} ({filing['filing_type']}) analyzed successfully")
+                if 'modelOutput' not in record:
+                    raise AnalysisError(f"Batch record failed: {record.get('error')}")
+
+                output = record['modelOutput']
+                usage = output.get('usage', {})
+                response = {
+                    'text': output['content'][0]['text'],
+                    'prompt_tokens': usage.get('input_tokens', 0),
+                    'completion_tokens': usage.get('output_tokens', 0),
+                    'duration': 0.0
+                }
+
+                analysis_data = self._parse_analysis_json(filing_id, response['text'], {})
+                results.append(self._build_result(filing_id, analysis_type, analysis_data, response))
+
             except Exception as e:
-                failed_count += 1
-                error_msg = str(e)[:200]  # Truncate long errors
-                print(f"  [{idx}/{len(filings)}] ✗ {filing['ticker']} ({filing['filing_type']}) - {error_msg}")
+                counts['failed'] += 1
                 if self.logger:
-                    self.logger.error(f"Failed to analyze {filing['ticker']}: {e}")
+                    self.logger.error(
+                        f"Failed to ingest batch result",
+                        exception=e,
+                        extra={'filing_id': filing_id}
+                    )
+
+        # Save the whole job at once; if that fails, save one by one so a
+        # single bad row doesn't cost the rest
+        try:
+            self.save_to_database_bulk(results)
+            counts['analyzed'] += len(results)
+        except DatabaseError as e:
+            if self.logger:
+                self.logger.warning("Bulk save failed, saving individually", extra={'error': str(e)})
+            for result in results:
+                try:
+                    self.save_to_database(result)
+                    counts['analyzed'] += 1
+                except DatabaseError as e:
+                    counts['failed'] += 1
+                    if self.logger:
+                        self.logger.error(
+                            f"Failed to ingest batch result",
+                            exception=e,
+                            extra={'filing_id': result.filing_id}
+                        )
 
-        return {'analyzed': analyzed_count, 'failed': failed_count}
+        return counts
@@ -0,0 +1,242 @@
+"""
+Adaptive rate limiting for AWS Bedrock calls
+
+Keeps Bedrock traffic inside the account's request and token quotas while
+adjusting in-flight concurrency with an AIMD (additive increase,
+multiplicative decrease) controller.
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Optional, Tuple
+
+from botocore.exceptions import ClientError, ConnectionError, HTTPClientError
+
+
+# Error codes Bedrock returns when the account is over quota; errors raised
+# mid-stream by invoke_model_with_response_stream use camelCase names
+THROTTLING_ERROR_CODES = {'ThrottlingException', 'TooManyRequestsException', 'throttlingException'}
+
+# Transient service-side errors that are worth retrying
+RETRYABLE_ERROR_CODES = THROTTLING_ERROR_CODES | {
+    'ServiceUnavailableException',
+    'InternalServerException',
+    'ModelNotReadyException',
+    'ModelTimeoutException',
+    'serviceUnavailableException',
+    'internalServerException',
+    'modelTimeoutException',
+    'modelStreamErrorException'
+}
+
+
+def is_throttling_error(error: Exception) -> bool:
+    """Return True if error is a Bedrock throttling response"""
+    if not isinstance(error, ClientError):
+        return False
+
+    code = error.response.get('Error', {}).get('Code')
+    status = error.response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+    return code in THROTTLING_ERROR_CODES or status == 429
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """
+    Return True if a failed Bedrock call may succeed when retried
+
+    Throttling, transient service errors and dropped connections are
+    retryable; validation, access and other client errors are not.
+    """
+    if isinstance(error, (ConnectionError, HTTPClientError)):
+        return True
+    if not isinstance(error, ClientError):
+        return False
+
+    code = error.response.get('Error', {}).get('Code')
+    status = error.response.get('ResponseMetadata', {}).get('HTTPStatusCode') or 0
+    return code in RETRYABLE_ERROR_CODES or status == 429 or status >= 500
+
+
+class BedrockPermit:
+    """
+    Handle for a single admitted Bedrock request
+
+    Callers report actual token usage once the response headers (or, for
+    streamed responses, the usage events) are available so the TPM window
+    reflects real consumption.
+    """
+
+    def __init__(self, estimated_tokens: int):
+        self.estimated_tokens = estimated_tokens
+        self.tokens: Optional[int] = None
+
+    def record_response(self, response: dict):
+        """Read token counts from Bedrock response headers"""
+        headers = response.get('ResponseMetadata', {}).get('HTTPHeaders', {})
+        input_tokens = headers.get('x-amzn-bedrock-input-token-count')
+        output_tokens = headers.get('x-amzn-bedrock-output-token-count')
+        if input_tokens is not None and output_tokens is not None:
+            self.tokens = int(input_tokens) + int(output_tokens)
+
+    def record_usage(self, usage: dict):
+        """Read token counts from a Claude message's usage block"""
+        input_tokens = usage.get('input_tokens')
+        output_tokens = usage.get('output_tokens')
+        if input_tokens is not None and output_tokens is not None:
+            self.tokens = int(input_tokens) + int(output_tokens)
+
+
+class BedrockRateLimiter:
+    """
+    Thread-safe AIMD rate limiter for Bedrock invoke_model calls
+
+    Admission requires a free concurrency slot, room in the sliding
+    one-minute request window (RPM) and room in the token window (TPM),
+    where in-flight requests count by their estimated tokens.
+    On throttling the concurrency limit is halved; after a run of fast
+    successes it grows by one, up to the starting ceiling.
+
+    Usage:
+        limiter = BedrockRateLimiter(max_concurrency=5)
+        with limiter.acquire(estimated_tokens=12000) as permit:
+            response = client.invoke_model(...)
+            permit.record_response(response)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 5,
+        requests_per_minute: int = 50,
+        tokens_per_minute: int = 80_000,
+        latency_target_seconds: float = 90.0,
+        increase_after: int = 5
+    ):
+        """
+        Initialize rate limiter
+
+        Args:
+            max_concurrency: Starting and maximum number of in-flight requests
+            requests_per_minute: Request quota (RPM)
+            tokens_per_minute: Token quota (TPM), input plus output
+            latency_target_seconds: Successes slower than this do not grow concurrency
+            increase_after: Consecutive fast successes needed before adding a slot
+        """
+        self.max_concurrency_ceiling = max_concurrency
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.latency_target_seconds = latency_target_seconds
+        self.increase_after = increase_after
+
+        self._window_seconds = 60.0
+        self._in_flight = 0
+        self._consecutive_successes = 0
+        self._request_times: Deque[float] = deque()
+        self._token_usage: Deque[Tuple[float, int]] = deque()
+        self._token_total = 0
+        # Estimated tokens of in-flight requests, not yet in the window
+        self._reserved_tokens = 0
+        self._condition = threading.Condition()
+
+    def _prune(self, now: float):
+        """Drop window entries older than one minute"""
+        cutoff = now - self._window_seconds
+        while self._request_times and self._request_times[0] <= cutoff:
+            self._request_times.popleft()
+        while self._token_usage and self._token_usage[0][0] <= cutoff:
+            _, tokens = self._token_usage.popleft()
+            self._token_total -= tokens
+
+    def _seconds_until_window_frees(self, now: float) -> Optional[float]:
+        """Time until the oldest window entry expires (None if windows are empty)"""
+        oldest = []
+        if self._request_times:
+            oldest.append(self._request_times[0])
+        if self._token_usage:
+            oldest.append(self._token_usage[0][0])
+        if not oldest:
+            return None
+        return max(0.0, min(oldest) + self._window_seconds - now)
+
+    def _can_admit(self, estimated_tokens: int) -> bool:
+        """Check concurrency, RPM and TPM budgets (caller holds the lock)"""
+        if self._in_flight >= self.max_concurrency:
+            return False
+        if len(self._request_times) >= self.requests_per_minute:
+            return False
+        # In-flight requests count against TPM by their estimate. Always admit
+        # when nothing is counted so oversized prompts cannot block forever
+        committed = self._token_total + self._reserved_tokens
+        if committed and committed + estimated_tokens > self.tokens_per_minute:
+            return False
+        return True
+
+    @contextmanager
+    def acquire(self, estimated_tokens: int = 0):
+        """
+        Block until a request may be sent, then yield a BedrockPermit
+
+        Throttling errors raised inside the block shrink concurrency; other
+        exceptions release the slot without affecting the controller.
+        """
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._prune(now)
+                if self._can_admit(estimated_tokens):
+                    break
+
+                # Concurrency-bound waits are woken by release(); window-bound
+                # waits also need a timeout for entries to age out
+                self._condition.wait(self._seconds_until_window_frees(now))
+
+            self._in_flight += 1
+            self._request_times.append(now)
+            self._reserved_tokens += estimated_tokens
+
+        permit = BedrockPermit(estimated_tokens)
+        start_time = time.monotonic()
+
+        try:
+            yield permit
+        except Exception as e:
+            if is_throttling_error(e):
+                self._on_throttle()
+            raise
+        else:
+            self._on_success(time.monotonic() - start_time)
+        finally:
+            self._release(permit)
+
+    def _release(self, permit: BedrockPermit):
+        """Free the concurrency slot and replace its reservation with actual usage"""
+        tokens = permit.tokens if permit.tokens is not None else permit.estimated_tokens
+        with self._condition:
+            self._in_flight -= 1
+            self._reserved_tokens -= permit.estimated_tokens
+            self._token_usage.append((time.monotonic(), tokens))
+            self._token_total += tokens
+            self._condition.notify_all()
+
+    def _on_throttle(self):
+        """Multiplicative decrease"""
+        with self._condition:
+            self.max_concurrency = max(1, int(self.max_concurrency * 0.5))
+            self._consecutive_successes = 0
+
+    def _on_success(self, latency_seconds: float):
+        """Additive increase after enough fast successes"""
+        with self._condition:
+            if latency_seconds >= self.latency_target_seconds:
+                self._consecutive_successes = 0
+                return
+
+            self._consecutive_successes += 1
+            if (
+                self._consecutive_successes >= self.increase_after
+                and self.max_concurrency < self.max_concurrency_ceiling
+            ):
+                self.max_concurrency += 1
+                self._consecutive_successes = 0
+                self._condition.notify_all()
@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+"""
+Backfill multiple SEC filings per company
+
+Supports three ticker sources:
+1. all-enabled: Fetch from all enabled companies in database
+2. predefined-50: Fetch from hardcoded list of 50 tech companies
+3. custom-list: Fetch from user-specified ticker list
+
+Can be configured for any number of 10-Q and 10-K filings per company.
+backfill_filings.py and fetch_multiple_filings.py are thin wrappers
+around this module.
+
+Usage:
+    python3 -m pipeline.backfill --source all-enabled --num-10q 3 --num-10k 1
+    python3 -m pipeline.backfill --source predefined-50 --num-10q 4 --num-10k 2
+    python3 -m pipeline.backfill --source custom-list --tickers AAPL,GOOGL,MSFT --num-10q 3 --num-10k 1
+"""
+import sys
+import os
+import asyncio
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Set, TextIO, Tuple
+
+from .utils import get_config, setup_root_logger, create_connection_pool, pooled_connection
+from .fetchers import EdgarFetcher, FilingType
+
+
+# Predefined list of 50 tech companies for default backfill
+PREDEFINED_TICKERS = [
+    'NXPI', 'MCHP', 'AMAT', 'SNPS', 'NET', 'DDOG', 'FTNT', 'S', 'ENTG', 'ON',
+    'MPWR', 'ARM', 'SWKS', 'QRVO', 'SLAB', 'CFLT', 'PATH', 'DOCN', 'HUBS', 'BILL',
+    'AFRM', 'SOFI', 'COIN', 'HOOD', 'RBLX', 'TWLO', 'ESTC', 'DT', 'MNDY', 'ZUO',
+    'GTLB', 'RPD', 'TENB', 'CYBR', 'VEEV', 'APPF', 'PAYC', 'PCTY', 'ALKT', 'QLYS',
+    'FFIV', 'CHKP', 'GEN', 'CVLT', 'PSTG', 'NTAP', 'WIX', 'BIGC', 'LITE', 'COHR'
+]
+
+SOURCES = ['all-enabled', 'predefined-50', 'custom-list']
+
+# Summary file picked up by the GitHub Actions workflow. Progress is written
+# to SUMMARY_FILE + '.tmp' as each company finishes and renamed into place
+# when the run completes, so a preempted run still leaves partial results.
+SUMMARY_FILE = 'backfill_summary.txt'
+
+
+def write_durable(f: TextIO, text: str):
+    """Write text and fsync so it survives the process being killed"""
+    f.write(text)
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def append_step_summary(text: str):
+    """Append markdown to the GitHub Actions job summary, if running in Actions"""
+    step_summary = os.environ.get('GITHUB_STEP_SUMMARY')
+    if step_summary:
+        with open(step_summary, 'a') as f:
+            f.write(text)
+
+
+def get_enabled_companies_from_db(conn) -> List[str]:
+    """Fetch list of enabled companies from database"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            SELECT ticker
+            FROM companies
+            WHERE enabled = true
+            ORDER BY ticker
+        """)
+        tickers = [row[0] for row in cursor.fetchall()]
+        return tickers
+    finally:
+        cursor.close()
+
+
+def get_existing_accessions_from_db(conn, tickers: List[str]) -> Set[str]:
+    """Fetch accession numbers of filings already stored for the given tickers"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            SELECT f.accession_number
+            FROM filings f
+            JOIN companies c ON f.company_id = c.id
+            WHERE c.ticker = ANY(%s)
+        """, (tickers,))
+        return {row[0] for row in cursor}
+    finally:
+        cursor.close()
+
+
+@dataclass
+class BackfillStats:
+    """Totals for a backfill run"""
+    total_10q: int = 0
+    total_10k: int = 0
+    total_skipped: int = 0
+    failed_tickers: List[str] = field(default_factory=list)
+
+
+class Backfiller:
+    """
+    Fetch, store and record SEC filings for many companies concurrently
+
+    Holds the database connection pool shared by every worker; each
+    worker's EdgarFetcher picks up the process-wide SEC HTTP session and
+    rate limiter itself.
+
+    Usage:
+        backfiller = Backfiller(config, workers=8)
+        try:
+            backfiller.run(source='predefined-50', num_10q=3, num_10k=1)
+        finally:
+            backfiller.close()
+    """
+
+    def __init__(self, config, workers: int = 8, summary_file: str = SUMMARY_FILE):
+        """
+        Initialize backfiller
+
+        Args:
+            config: PipelineConfig instance
+            workers: Number of companies to backfill concurrently
+            summary_file: Markdown summary written for GitHub Actions
+        """
+        self.config = config
+        self.workers = workers
+        self.summary_file = summary_file
+
+        self.pool = create_connection_pool(config, min_size=1, max_size=workers)
+        self.existing_accessions: Set[str] = set()
+
+    def close(self):
+        """Close all pooled database connections"""
+        self.pool.closeall()
+
+    def get_tickers(self, source: str, tickers: Optional[List[str]] = None) -> List[str]:
+        """Get list of tickers based on source parameter"""
+        if source == 'all-enabled':
+            with pooled_connection(self.pool) as conn:
+                return get_enabled_companies_from_db(conn)
+        elif source == 'predefined-50':
+            return PREDEFINED_TICKERS
+        elif source == 'custom-list':
+            return [t.strip().upper() for t in tickers or []]
+        else:
+            raise ValueError(f"Unknown source: {source}")
+
+    def backfill_company(self, ticker: str, num_10q: int, num_10k: int) -> Tuple[int, int]:
+        """
+        Fetch 10-Q and 10-K filings for a single company
+
+        Runs on a worker thread, so it borrows its own pooled connection and
+        builds its own EdgarFetcher rather than sharing one across threads.
+        Existing filings are skipped using the set preloaded by run().
+
+        Returns:
+            (count_10q, count_10k)
+        """
+        with pooled_connection(self.pool) as conn:
+            fetcher = EdgarFetcher(self.config, conn, logger=None)
+
+            # One EDGAR listing request covers both form types
+            filings = fetcher.fetch_latest_filings_by_type(
+                ticker,
+                [(FilingType.FORM_10Q, num_10q), (FilingType.FORM_10K, num_10k)]
+            )
+
+            # Process each type separately to report per-type counts
+            count_10q = 0
+            if num_10q > 0:
+                count_10q = fetcher.process_filings(
+                    ticker,
+                    [f for f in filings if f.filing_type == FilingType.FORM_10Q],
+                    skip_existing=True,
+                    existing_accessions=self.existing_accessions
+                )
+
+            count_10k = 0
+            if num_10k > 0:
+                count_10k = fetcher.process_filings(
+                    ticker,
+                    [f for f in filings if f.filing_type == FilingType.FORM_10K],
+                    skip_existing=True,
+                    existing_accessions=self.existing_accessions
+                )
+
+        return count_10q, count_10k
+
+    async def backfill_all(
+        self,
+        tickers: List[str],
+        num_10q: int,
+        num_10k: int
+    ) -> AsyncIterator[Tuple[str, Optional[Tuple[int, int]], Optional[Exception]]]:
+        """
+        Backfill companies concurrently, yielding results as each one finishes
+
+        The fetcher's requests/boto3/psycopg2 calls are blocking, so each company
+        runs on a worker thread while a semaphore caps how many are in flight.
+        SEC traffic is further bounded by the shared EDGAR rate limiter.
+
+        Yields:
+            (ticker, (count_10q, count_10k), None) on success
+            (ticker, None, exception) on failure
+        """
+        # The default executor is sized from CPU count, which would silently cap
+        # concurrency below --workers on small CI runners
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=self.workers)
+        )
+        semaphore = asyncio.Semaphore(self.workers)
+
+        async def process_ticker(ticker: str):
+            async with semaphore:
+                try:
+                    counts = await asyncio.to_thread(
+                        self.backfill_company, ticker, num_10q, num_10k
+                    )
+                    return ticker, counts, None
+                except Exception as e:
+                    return ticker, None, e
+
+        for next_done in asyncio.as_completed([process_ticker(ticker) for ticker in tickers]):
+            yield await next_done
+
+    async def _run_all(
+        self,
+        tickers: List[str],
+        num_10q: int,
+        num_10k: int,
+        progress: TextIO
+    ) -> BackfillStats:
+        """Backfill all companies, reporting progress as each one finishes"""
+        stats = BackfillStats()
+
+        # Process tickers concurrently; each company is independent I/O
+        idx = 0
+        async for ticker, counts, error in self.backfill_all(tickers, num_10q, num_10k):
+            idx += 1
+            print(f"[{idx}/{len(tickers)}] {ticker}")
+
+            if error is not None:
+                error_msg = str(error)[:120]
+                print(f"  ✗ Error: {error_msg}")
+                stats.failed_tickers.append(ticker)
+                write_durable(progress, f"- {ticker}: ✗ failed ({error_msg})\n")
+                append_step_summary(f"| {ticker} | - | - | ✗ failed |\n")
+                print()
+                continue
+
+            count_10q, count_10k = counts
+            stats.total_10q += count_10q
+            stats.total_10k += count_10k
+
+            if num_10q > 0:
+                print(f"  ✓ 10-Q: {count_10q}/{num_10q} filings")
+            else:
+                print(f"  ⊘ 10-Q: skipped")
+
+            if num_10k > 0:
+                print(f"  ✓ 10-K: {count_10k}/{num_10k} filings")
+            else:
+                print(f"  ⊘ 10-K: skipped")
+
+            total = count_10q + count_10k
+            requested = num_10q + num_10k
+            skipped = requested - total
+            if skipped > 0:
+                stats.total_skipped += skipped
+                print(f"  → Total: {total}/{requested} filings ({skipped} already existed)")
+            else:
+                print(f"  → Total: {total}/{requested} filings")
+            print()
+
+            write_durable(
+                progress,
+                f"- {ticker}: 10-Q {count_10q}/{num_10q}, "
+                f"10-K {count_10k}/{num_10k}\n"
+            )
+            append_step_summary(
+                f"| {ticker} | {count_10q}/{num_10q} | "
+                f"{count_10k}/{num_10k} | ✓ |\n"
+            )
+
+        return stats
+
+    def run(
+        self,
+        source: str,
+        num_10q: int,
+        num_10k: int,
+        tickers: Optional[List[str]] = None
+    ) -> BackfillStats:
+        """
+        Backfill filings for every company from source
+
+        Args:
+            source: One of SOURCES
+            num_10q: Number of 10-Q filings to fetch per company
+            num_10k: Number of 10-K filings to fetch per company
+            tickers: Ticker list (required if source=custom-list)
+
+        Returns:
+            BackfillStats totals for the run
+        """
+        tickers = self.get_tickers(source, tickers)
+        print(f"Companies to process: {len(tickers)}")
+        print(f"Total filings to fetch: {len(tickers) * (num_10q + num_10k)}")
+        print()
+
+        # One query for every company's stored filings instead of one per
+        # process_company() call; workers only read the set
+        with pooled_connection(self.pool) as conn:
+            self.existing_accessions = get_existing_accessions_from_db(conn, tickers)
+
+        summary_tmp = self.summary_file + '.tmp'
+        with open(summary_tmp, 'w') as progress:
+            write_durable(progress, f"**Backfill Progress** ({source})\n\n")
+            append_step_summary(
+                "### Backfill progress\n\n"
+                "| Ticker | 10-Q | 10-K | Status |\n"
+                "|---|---|---|---|\n"
+            )
+
+            stats = asyncio.run(self._run_all(tickers, num_10q, num_10k, progress))
+
+        # Summary
+        print("=" * 80)
+        print(f"BACKFILL COMPLETE - Finished at {datetime.now().isoformat()}")
+        print("=" * 80)
+        print(f"Total 10-Q filings fetched: {stats.total_10q}")
+        print(f"Total 10-K filings fetched: {stats.total_10k}")
+        print(f"Total filings: {stats.total_10q + stats.total_10k}")
+        print(f"Already existing (skipped): {stats.total_skipped}")
+        print(f"Failed tickers: {len(stats.failed_tickers)}")
+
+        if stats.failed_tickers:
+            print(f"\nFailed companies: {', '.join(stats.failed_tickers)}")
+
+        print()
+        print("Next steps:")
+        print("  1. Analyze filings: python3 pipeline/main.py --phase analyze")
+        print("  2. Generate content: python3 pipeline/main.py --phase generate")
+        print("  3. Publish content: python3 pipeline/main.py --phase publish")
+
+        # Replace the progress log with the final summary, then atomically
+        # move it into place for GitHub Actions
+        with open(summary_tmp, 'w') as f:
+            lines = [
+                f"**Backfill Summary**\n\n",
+                f"- **Source**: {source}\n",
+                f"- **Companies processed**: {len(tickers) - len(stats.failed_tickers)}/{len(tickers)}\n",
+                f"- **10-Q filings fetched**: {stats.total_10q}\n",
+                f"- **10-K filings fetched**: {stats.total_10k}\n",
+                f"- **Total filings**: {stats.total_10q + stats.total_10k}\n",
+                f"- **Skipped (existing)**: {stats.total_skipped}\n",
+            ]
+            if stats.failed_tickers:
+                lines.append(
+                    f"- **Failed**: {len(stats.failed_tickers)} ({', '.join(stats.failed_tickers)})\n"
+                )
+            write_durable(f, ''.join(lines))
+        os.replace(summary_tmp, self.summary_file)
+        print(f"\n✓ Summary written to {self.summary_file}")
+
+        return stats
+
+
+def run_backfill(
+    source: str,
+    num_10q: int,
+    num_10k: int,
+    workers: int = 8,
+    tickers: Optional[List[str]] = None,
+    log_level: str = 'INFO'
+) -> BackfillStats:
+    """
+    Run a complete backfill with banner output, exiting on fatal errors
+
+    Shared entry point for the backfill CLIs.
+    """
+    config = get_config()
+
+    # Setup logging
+    setup_root_logger(level=log_level)
+
+    print("=" * 80)
+    print(f"SEC Filings Backfill - Started at {datetime.now().isoformat()}")
+    print("=" * 80)
+    print(f"Source: {source}")
+    print(f"10-Q per company: {num_10q}")
+    print(f"10-K per company: {num_10k}")
+    print(f"Workers: {workers}")
+    print()
+
+    try:
+        backfiller = Backfiller(config, workers=workers)
+        print("✓ Connected to database")
+
+        try:
+            return backfiller.run(source, num_10q, num_10k, tickers)
+        finally:
+            backfiller.close()
+
+    except Exception as e:
+        print(f"✗ Fatal error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+def parse_args(argv: Optional[List[str]] = None, prog: Optional[str] = None):
+    """Parse command line arguments"""
+    prog = prog or 'python3 -m pipeline.backfill'
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description='Backfill multiple SEC filings per company',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+Examples:
+  # Fetch from all enabled companies
+  {prog} --source all-enabled --num-10q 3 --num-10k 1
+
+  # Fetch from predefined tech company list
+  {prog} --source predefined-50 --num-10q 4 --num-10k 2
+
+  # Fetch from custom ticker list
+  {prog} --source custom-list --tickers AAPL,GOOGL,MSFT --num-10q 3 --num-10k 1
+        """
+    )
+
+    parser.add_argument(
+        '--source',
+        required=True,
+        choices=SOURCES,
+        help='Source of companies to process'
+    )
+
+    parser.add_argument(
+        '--tickers',
+        type=str,
+        help='Comma-separated ticker list (required if source=custom-list)'
+    )
+
+    parser.add_argument(
+        '--num-10q',
+        type=int,
+        default=3,
+        help='Number of 10-Q filings to fetch per company (default: 3)'
+    )
+
+    parser.add_argument(
+        '--num-10k',
+        type=int,
+        default=1,
+        help='Number of 10-K filings to fetch per company (default: 1)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=8,
+        help='Number of companies to backfill concurrently (default: 8)'
+    )
+
+    parser.add_argument(
+        '--log-level',
+        default='INFO',
+        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+        help='Logging level (default: INFO)'
+    )
+
+    args = parser.parse_args(argv)
+
+    # Validate arguments
+    if args.source == 'custom-list' and not args.tickers:
+        parser.error('--tickers is required when using --source custom-list')
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+
+    return args
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None):
+    args = parse_args(argv, prog)
+    run_backfill(
+        source=args.source,
+        num_10q=args.num_10q,
+        num_10k=args.num_10k,
+        workers=args.workers,
+        tickers=args.tickers.split(',') if args.tickers else None,
+        log_level=args.log_level
+    )
+
+
+if __name__ == '__main__':
+    main()
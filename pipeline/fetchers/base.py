@@ -6,7 +6,7 @@ Provides abstract interface for fetching and storing SEC filings.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Set, Tuple
 from enum import Enum
 
 
@@ -96,6 +96,33 @@ class BaseFetcher(ABC):
         """
         pass
 
+    def fetch_latest_filings_by_type(
+        self,
+        ticker: str,
+        limits: List[Tuple[FilingType, int]]
+    ) -> List[FilingMetadata]:
+        """
+        Fetch latest filings of several types for a company
+
+        Args:
+            ticker: Company ticker symbol
+            limits: (filing_type, limit) pairs
+
+        Returns:
+            List of FilingMetadata objects, at most limit of each type
+
+        Raises:
+            FetchError: If fetching fails
+
+        Default implementation calls fetch_latest_filings() once per type;
+        override where one listing request can serve every type.
+        """
+        filings = []
+        for filing_type, limit in limits:
+            if limit > 0:
+                filings.extend(self.fetch_latest_filings(ticker, filing_type, limit))
+        return filings
+
     @abstractmethod
     def download_filing(self, filing: FilingMetadata) -> bytes:
         """
@@ -129,6 +156,26 @@ class BaseFetcher(ABC):
         """
         pass
 
+    def download_and_upload(self, filing: FilingMetadata) -> str:
+        """
+        Download filing and store it in S3
+
+        Args:
+            filing: FilingMetadata with document_url
+
+        Returns:
+            S3 URL where filing was stored
+
+        Raises:
+            DownloadError: If download fails
+            UploadError: If upload fails
+
+        Default implementation buffers the whole document in memory;
+        override to stream the download straight into S3.
+        """
+        content = self.download_filing(filing)
+        return self.upload_to_s3(filing, content)
+
     @abstractmethod
     def save_to_database(
         self,
@@ -152,6 +199,27 @@ class BaseFetcher(ABC):
         """
         pass
 
+    def save_batch_to_database(
+        self,
+        filings: List[Tuple[FilingMetadata, str]]
+    ) -> List[str]:
+        """
+        Save several filings to database
+
+        Args:
+            filings: List of (FilingMetadata, s3_url) pairs
+
+        Returns:
+            Database IDs of created filing records
+
+        Raises:
+            DatabaseError: If save fails
+
+        Default implementation saves one row at a time; override with a
+        multi-row INSERT where the backend supports it.
+        """
+        return [self.save_to_database(filing, s3_url) for filing, s3_url in filings]
+
     def check_if_exists(self, accession_number: str) -> bool:
         """
         Check if filing already exists in database
@@ -175,12 +243,38 @@ class BaseFetcher(ABC):
 
         return exists
 
+    def get_existing_accessions(self, accession_numbers: List[str]) -> Set[str]:
+        """
+        Find which of the given filings already exist in database
+
+        Args:
+            accession_numbers: SEC accession numbers to check
+
+        Returns:
+            Subset of accession_numbers already stored
+
+        Uses a single query instead of one check_if_exists() call per filing.
+        """
+        if not self.db_connection or not accession_numbers:
+            return set()
+
+        cursor = self.db_connection.cursor()
+        cursor.execute(
+            "SELECT accession_number FROM filings WHERE accession_number = ANY(%s)",
+            (list(accession_numbers),)
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+        cursor.close()
+
+        return existing
+
     def process_company(
         self,
         ticker: str,
         filing_type: Optional[FilingType] = None,
         limit: int = 1,
-        skip_existing: bool = True
+        skip_existing: bool = True,
+        existing_accessions: Optional[Set[str]] = None
     ) -> int:
         """
         Complete workflow: fetch, download, upload, and save filings for a company
@@ -190,6 +284,8 @@ class BaseFetcher(ABC):
             filing_type: Optional filter by filing type
             limit: Maximum number of filings to process
             skip_existing: Skip filings that already exist in database
+            existing_accessions: Accession numbers already stored, preloaded
+                by the caller; skips the per-call database lookup
 
         Returns:
             Number of filings processed
@@ -205,11 +301,43 @@ class BaseFetcher(ABC):
         if self.logger:
             self.logger.info(f"Found {len(filings)} filings for {ticker}")
 
-        processed = 0
+        return self.process_filings(ticker, filings, skip_existing, existing_accessions)
+
+    def process_filings(
+        self,
+        ticker: str,
+        filings: List[FilingMetadata],
+        skip_existing: bool = True,
+        existing_accessions: Optional[Set[str]] = None
+    ) -> int:
+        """
+        Download, upload, and save already-fetched filings for a company
+
+        Args:
+            ticker: Company ticker symbol
+            filings: Filings returned by a fetch_latest_filings* call
+            skip_existing: Skip filings that already exist in database
+            existing_accessions: Accession numbers already stored, preloaded
+                by the caller; skips the database lookup
+
+        Returns:
+            Number of filings processed
+        """
+        # Look up all existing filings in one round trip, unless the caller
+        # has already loaded them
+        existing = set()
+        if skip_existing and existing_accessions is not None:
+            existing = existing_accessions
+        elif skip_existing:
+            existing = self.get_existing_accessions(
+                [filing.accession_number for filing in filings]
+            )
+
+        uploaded = []
 
         for filing in filings:
             # Skip if already exists
-            if skip_existing and self.check_if_exists(filing.accession_number):
+            if filing.accession_number in existing:
                 if self.logger:
                     self.logger.debug(
                         f"Skipping existing filing {filing.accession_number}"
@@ -217,22 +345,10 @@ class BaseFetcher(ABC):
                 continue
 
             try:
-                # Download filing
-                content = self.download_filing(filing)
-
-                # Upload to S3
-                s3_url = self.upload_to_s3(filing, content)
-
-                # Save to database
-                filing_id = self.save_to_database(filing, s3_url)
+                # Download filing and upload to S3
+                s3_url = self.download_and_upload(filing)
 
-                if self.logger:
-                    self.logger.info(
-                        f"Successfully processed filing {filing.accession_number}",
-                        extra={'filing_id': filing_id}
-                    )
-
-                processed += 1
+                uploaded.append((filing, s3_url))
 
             except Exception as e:
                 if self.logger:
@@ -243,7 +359,38 @@ class BaseFetcher(ABC):
                 # Continue with next filing
                 continue
 
-        return processed
+        if not uploaded:
+            return 0
+
+        # Save all uploaded filings in one batch
+        try:
+            filing_ids = self.save_batch_to_database(uploaded)
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(
+                    f"Batch save of {len(uploaded)} filings for {ticker} failed, "
+                    f"saving one at a time: {e}"
+                )
+            # The batch was rolled back; save row by row so one bad filing
+            # doesn't drop the rest (and leave their S3 objects orphaned)
+            filing_ids = []
+            for filing, s3_url in uploaded:
+                try:
+                    filing_ids.append(self.save_to_database(filing, s3_url))
+                except Exception as row_error:
+                    if self.logger:
+                        self.logger.error(
+                            f"Failed to save filing {filing.accession_number}",
+                            exception=row_error
+                        )
+
+        if self.logger:
+            self.logger.info(
+                f"Successfully processed {len(filing_ids)} filings for {ticker}",
+                extra={'filing_ids': filing_ids}
+            )
+
+        return len(filing_ids)
 
 
 class FetchError(Exception):
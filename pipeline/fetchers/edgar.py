@@ -3,15 +3,21 @@ SEC EDGAR fetcher implementation
 
 Fetches 10-K and 10-Q filings from SEC EDGAR API and stores them in S3.
 """
+import io
 import re
+import threading
 import time
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import boto3
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
+from psycopg2.extras import execute_values
 
 from .base import (
     BaseFetcher,
@@ -22,6 +28,120 @@ from .base import (
     UploadError,
     DatabaseError
 )
+from .ratelimit import TokenBucket
+
+
+# Complete submission .txt files smaller than this are error pages
+MIN_TEXT_FILING_BYTES = 10000
+
+# Transient failures and throttling (SEC answers excess traffic with 403)
+# are retried in _make_request so every attempt goes through the rate limiter
+SEC_MAX_RETRIES = 5
+SEC_RETRY_BACKOFF = 0.5
+SEC_RETRY_STATUSES = frozenset({403, 429, 500, 502, 503, 504})
+
+# Filings above 8 MB are uploaded as multipart, four parts at a time
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True
+)
+
+# SEC's request limit is per IP, so every fetcher in the process shares one
+# bucket (built lazily from the first config seen)
+_sec_rate_limiter: Optional[TokenBucket] = None
+_sec_rate_limiter_lock = threading.Lock()
+
+
+def get_sec_rate_limiter(config) -> TokenBucket:
+    """Get the process-wide SEC EDGAR rate limiter (singleton)"""
+    global _sec_rate_limiter
+    with _sec_rate_limiter_lock:
+        if _sec_rate_limiter is None:
+            # Run slightly under the published limit to absorb clock jitter
+            requests_per_period = config.sec.rate_limit_requests
+            _sec_rate_limiter = TokenBucket(
+                rate=0.9 * requests_per_period / config.sec.rate_limit_period,
+                burst=requests_per_period
+            )
+        return _sec_rate_limiter
+
+
+# One HTTP session per process so every fetcher (and worker thread) reuses
+# the same keep-alive connections to www.sec.gov
+_sec_session: Optional[requests.Session] = None
+_sec_session_lock = threading.Lock()
+
+
+def get_sec_session(config) -> requests.Session:
+    """Get the process-wide SEC EDGAR HTTP session (singleton)"""
+    global _sec_session
+    with _sec_session_lock:
+        if _sec_session is None:
+            # All traffic goes to one host, so a single host pool sized to
+            # the SEC request limit covers every concurrent worker. Retries
+            # are left to EdgarFetcher._make_request so they are rate limited
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=config.sec.rate_limit_requests
+            )
+
+            session = requests.Session()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update({
+                'User-Agent': config.sec.user_agent,
+                'Accept-Encoding': 'gzip, deflate',
+                'Host': 'www.sec.gov'
+            })
+            _sec_session = session
+        return _sec_session
+
+
+# Ticker -> 10-digit CIK, loaded once per process from SEC's
+# company_tickers.json (the same mapping is needed for every company)
+_ticker_to_cik: Dict[str, str] = {}
+_ticker_to_cik_lock = threading.Lock()
+
+
+class _ResponseStream(io.RawIOBase):
+    """
+    Read-only file object over a streamed requests response
+
+    Reads the decoded body (requests undoes SEC's gzip transfer encoding),
+    so the bytes stored in S3 match what download_filing() returns.
+    """
+
+    def __init__(self, response: requests.Response, chunk_size: int = 64 * 1024):
+        self._chunks = response.iter_content(chunk_size=chunk_size)
+        self._buffer = b''
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def peek(self, size: int) -> bytes:
+        """Return up to size bytes without consuming them"""
+        while len(self._buffer) < size:
+            chunk = next(self._chunks, b'')
+            if not chunk:
+                break
+            self._buffer += chunk
+        return self._buffer[:size]
+
+    def readinto(self, buffer) -> int:
+        while not self._buffer:
+            self._buffer = next(self._chunks, None)
+            if self._buffer is None:
+                self._buffer = b''
+                return 0
+
+        n = min(len(buffer), len(self._buffer))
+        buffer[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        self.bytes_read += n
+        return n
 
 
 class EdgarFetcher(BaseFetcher):
@@ -51,9 +171,10 @@ class EdgarFetcher(BaseFetcher):
         self.base_url = config.sec.base_url
         self.user_agent = config.sec.user_agent
 
-        # Rate limiting
-        self.last_request_time = 0
-        self.min_request_interval = 1.0 / config.sec.rate_limit_requests
+        # Rate limiting and HTTP connections (shared across threads and
+        # fetcher instances)
+        self.rate_limiter = get_sec_rate_limiter(config)
+        self.session = get_sec_session(config)
 
         if self.logger:
             self.logger.info(
@@ -62,19 +183,16 @@ class EdgarFetcher(BaseFetcher):
             )
 
     def _rate_limit(self):
-        """Enforce SEC rate limit (10 requests/second)"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            sleep_time = self.min_request_interval - elapsed
-            time.sleep(sleep_time)
-        self.last_request_time = time.time()
-
-    def _make_request(self, url: str) -> requests.Response:
+        """Enforce SEC rate limit (10 requests/second) across all workers"""
+        self.rate_limiter.acquire()
+
+    def _make_request(self, url: str, stream: bool = False) -> requests.Response:
         """
         Make HTTP request to SEC with proper headers and rate limiting
 
         Args:
             url: URL to request
+            stream: Defer downloading the body (caller must close the response)
 
         Returns:
             Response object
@@ -82,20 +200,47 @@ class EdgarFetcher(BaseFetcher):
         Raises:
             FetchError: If request fails
         """
-        self._rate_limit()
+        for attempt in range(SEC_MAX_RETRIES + 1):
+            # Every attempt, retries included, takes a token
+            self._rate_limit()
 
-        headers = {
-            'User-Agent': self.user_agent,
-            'Accept-Encoding': 'gzip, deflate',
-            'Host': 'www.sec.gov'
-        }
+            try:
+                # User-Agent and encoding headers are set on the shared session
+                response = self.session.get(url, timeout=30, stream=stream)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt == SEC_MAX_RETRIES:
+                    raise FetchError(f"Failed to fetch {url}: {e}")
+                self._retry_sleep(attempt, url, str(e))
+                continue
+            except requests.exceptions.RequestException as e:
+                raise FetchError(f"Failed to fetch {url}: {e}")
+
+            if response.status_code in SEC_RETRY_STATUSES and attempt < SEC_MAX_RETRIES:
+                retry_after = response.headers.get('Retry-After')
+                response.close()
+                self._retry_sleep(attempt, url, f"HTTP {response.status_code}", retry_after)
+                continue
 
-        try:
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
+            try:
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                response.close()
+                raise FetchError(f"Failed to fetch {url}: {e}")
             return response
-        except requests.exceptions.RequestException as e:
-            raise FetchError(f"Failed to fetch {url}: {e}")
+
+    def _retry_sleep(self, attempt: int, url: str, reason: str,
+                     retry_after: Optional[str] = None):
+        """Back off before retrying a SEC request, honouring Retry-After"""
+        delay = SEC_RETRY_BACKOFF * (2 ** attempt)
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, float(retry_after))
+
+        if self.logger:
+            self.logger.warning(
+                f"Retrying SEC request in {delay:.1f}s ({reason})",
+                extra={'url': url, 'attempt': attempt + 1}
+            )
+        time.sleep(delay)
 
     def _get_cik_from_ticker(self, ticker: str) -> str:
         """
@@ -110,26 +255,32 @@ class EdgarFetcher(BaseFetcher):
         Raises:
             FetchError: If ticker not found
         """
-        # SEC maintains a company tickers JSON file
-        url = f"{self.base_url}/files/company_tickers.json"
-
-        try:
-            response = self._make_request(url)
-            data = response.json()
-
-            # Find ticker in the data
-            for entry in data.values():
-                if entry['ticker'].upper() == ticker.upper():
+        # SEC maintains a company tickers JSON file. It covers every
+        # registrant, so it is downloaded once and shared across fetchers;
+        # the lock stops concurrent workers from each fetching it
+        with _ticker_to_cik_lock:
+            if not _ticker_to_cik:
+                url = f"{self.base_url}/files/company_tickers.json"
+
+                try:
+                    response = self._make_request(url)
+                    data = response.json()
+                except Exception as e:
+                    raise FetchError(f"Failed to lookup CIK for {ticker}: {e}")
+
+                for entry in data.values():
                     # CIK needs to be 10 digits with leading zeros
-                    cik = str(entry['cik_str']).zfill(10)
-                    if self.logger:
-                        self.logger.debug(f"Found CIK {cik} for ticker {ticker}")
-                    return cik
+                    _ticker_to_cik.setdefault(
+                        entry['ticker'].upper(), str(entry['cik_str']).zfill(10)
+                    )
 
+        cik = _ticker_to_cik.get(ticker.upper())
+        if cik is None:
             raise FetchError(f"Ticker {ticker} not found in SEC database")
 
-        except Exception as e:
-            raise FetchError(f"Failed to lookup CIK for {ticker}: {e}")
+        if self.logger:
+            self.logger.debug(f"Found CIK {cik} for ticker {ticker}")
+        return cik
 
     def fetch_latest_filings(
         self,
@@ -155,83 +306,64 @@ class EdgarFetcher(BaseFetcher):
             self.logger.info(f"Fetching filings for {ticker}")
 
         try:
-            # Get CIK for ticker
-            cik = self._get_cik_from_ticker(ticker)
+            filings = []
 
-            # Fetch company filings page
-            # The submissions endpoint provides comprehensive filing data
-            url = f"{self.base_url}/cgi-bin/browse-edgar?action=getcompany&CIK={cik}&type=&dateb=&owner=exclude&count={limit * 2}"
+            for metadata in self._iter_filings(ticker, count=limit * 2):
+                # Filter by filing type if specified
+                if filing_type and metadata.filing_type != filing_type:
+                    continue
 
-            response = self._make_request(url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+                filings.append(metadata)
 
-            # Parse filing table
-            filings = []
-            table = soup.find('table', {'class': 'tableFile2'})
+                if len(filings) >= limit:
+                    break
 
-            if not table:
-                if self.logger:
-                    self.logger.warning(f"No filings table found for {ticker}")
-                return []
+            if self.logger:
+                self.logger.info(f"Found {len(filings)} filings for {ticker}")
 
-            rows = table.find_all('tr')[1:]  # Skip header
+            return filings
 
-            for row in rows:
-                cols = row.find_all('td')
-                if len(cols) < 5:
-                    continue
+        except Exception as e:
+            raise FetchError(f"Failed to fetch filings for {ticker}: {e}")
 
-                # Extract filing type
-                form_type = cols[0].text.strip()
+    def fetch_latest_filings_by_type(
+        self,
+        ticker: str,
+        limits: List[Tuple[FilingType, int]]
+    ) -> List[FilingMetadata]:
+        """
+        Fetch latest filings of several types from one EDGAR listing request
 
-                # Filter by filing type if specified
-                if filing_type:
-                    if form_type != filing_type.value:
-                        continue
-                elif form_type not in ['10-K', '10-Q']:
-                    # Only fetch 10-K and 10-Q if no filter specified
-                    continue
+        Args:
+            ticker: Company ticker symbol
+            limits: (filing_type, limit) pairs
 
-                # Extract metadata
-                filing_date_str = cols[3].text.strip()
-                filing_date = datetime.strptime(filing_date_str, '%Y-%m-%d')
+        Returns:
+            List of FilingMetadata objects, at most limit of each type
 
-                # Get accession number from description column
-                # Format: "Annual report [...]Acc-no: 0000320193-25-000079 (34 Act)"
-                description = cols[2].text.strip()
-                acc_match = re.search(r'Acc-no:\s*([\d-]+)', description)
-                if not acc_match:
-                    continue
-                accession_number = acc_match.group(1)
+        Raises:
+            FetchError: If fetching fails
+        """
+        if self.logger:
+            self.logger.info(f"Fetching filings for {ticker}")
+
+        remaining = {filing_type: limit for filing_type, limit in limits if limit > 0}
+        if not remaining:
+            return []
 
-                # Get document link
-                doc_link = cols[1].find('a')
-                if not doc_link:
+        try:
+            filings = []
+
+            # The listing covers every form type, so one page sized for all
+            # requested types replaces a request per type
+            for metadata in self._iter_filings(ticker, count=sum(remaining.values()) * 2):
+                if remaining.get(metadata.filing_type, 0) <= 0:
                     continue
-                doc_href = doc_link['href']
-
-                # Build document URL
-                document_url = f"{self.base_url}{doc_href}"
-
-                # Determine fiscal period from filing
-                fiscal_period = self._determine_fiscal_period(form_type, filing_date)
-
-                # Create metadata object
-                metadata = FilingMetadata(
-                    ticker=ticker.upper(),
-                    filing_type=FilingType.FORM_10K if form_type == '10-K' else FilingType.FORM_10Q,
-                    filing_date=filing_date,
-                    fiscal_year=filing_date.year,
-                    fiscal_period=fiscal_period,
-                    accession_number=accession_number,
-                    document_url=document_url,
-                    cik=cik,
-                    form_type=form_type
-                )
 
                 filings.append(metadata)
+                remaining[metadata.filing_type] -= 1
 
-                if len(filings) >= limit:
+                if not any(remaining.values()):
                     break
 
             if self.logger:
@@ -242,6 +374,84 @@ class EdgarFetcher(BaseFetcher):
         except Exception as e:
             raise FetchError(f"Failed to fetch filings for {ticker}: {e}")
 
+    def _iter_filings(self, ticker: str, count: int) -> Iterator[FilingMetadata]:
+        """
+        Parse 10-K and 10-Q filings from a company's EDGAR filing listing
+
+        Args:
+            ticker: Company ticker symbol
+            count: Number of listing rows (of any form type) to request
+
+        Yields:
+            FilingMetadata objects, newest first
+        """
+        # Get CIK for ticker
+        cik = self._get_cik_from_ticker(ticker)
+
+        # Fetch company filings page
+        # The submissions endpoint provides comprehensive filing data
+        url = f"{self.base_url}/cgi-bin/browse-edgar?action=getcompany&CIK={cik}&type=&dateb=&owner=exclude&count={count}"
+
+        response = self._make_request(url)
+        soup = BeautifulSoup(response.content, 'html.parser')
+
+        # Parse filing table
+        table = soup.find('table', {'class': 'tableFile2'})
+
+        if not table:
+            if self.logger:
+                self.logger.warning(f"No filings table found for {ticker}")
+            return
+
+        rows = table.find_all('tr')[1:]  # Skip header
+
+        for row in rows:
+            cols = row.find_all('td')
+            if len(cols) < 5:
+                continue
+
+            # Extract filing type; only 10-K and 10-Q are tracked
+            form_type = cols[0].text.strip()
+            if form_type not in ['10-K', '10-Q']:
+                continue
+
+            # Extract metadata
+            filing_date_str = cols[3].text.strip()
+            filing_date = datetime.strptime(filing_date_str, '%Y-%m-%d')
+
+            # Get accession number from description column
+            # Format: "Annual report [...]Acc-no: 0000320193-25-000079 (34 Act)"
+            description = cols[2].text.strip()
+            acc_match = re.search(r'Acc-no:\s*([\d-]+)', description)
+            if not acc_match:
+                continue
+            accession_number = acc_match.group(1)
+
+            # Get document link
+            doc_link = cols[1].find('a')
+            if not doc_link:
+                continue
+            doc_href = doc_link['href']
+
+            # Build document URL
+            document_url = f"{self.base_url}{doc_href}"
+
+            # Determine fiscal period from filing
+            fiscal_period = self._determine_fiscal_period(form_type, filing_date)
+
+            # Create metadata object
+            yield FilingMetadata(
+                ticker=ticker.upper(),
+                filing_type=FilingType.FORM_10K if form_type == '10-K' else FilingType.FORM_10Q,
+                filing_date=filing_date,
+                fiscal_year=filing_date.year,
+                fiscal_period=fiscal_period,
+                accession_number=accession_number,
+                document_url=document_url,
+                cik=cik,
+                form_type=form_type
+            )
+
     def _determine_fiscal_period(self, form_type: str, filing_date: datetime) -> str:
         """
         Determine fiscal period from form type and date
@@ -274,6 +484,62 @@ class EdgarFetcher(BaseFetcher):
         else:
             return 'Q4'
 
+    def _get_txt_url(self, filing: FilingMetadata) -> str:
+        """
+        Build URL of the complete submission text file for a filing
+
+        SEC filing URL pattern:
+        https://www.sec.gov/Archives/edgar/data/{CIK}/{accession_no_dashes}/{accession_no}.txt
+        Example: https://www.sec.gov/Archives/edgar/data/320193/000032019325000079/0000320193-25-000079.txt
+
+        Raises:
+            DownloadError: If filing metadata has no CIK
+        """
+        # Use CIK from FilingMetadata (already available)
+        cik = filing.cik
+        if not cik:
+            raise DownloadError("No CIK available in filing metadata")
+
+        accession_no_dashes = filing.accession_number.replace('-', '')
+        return f"{self.base_url}/Archives/edgar/data/{cik}/{accession_no_dashes}/{filing.accession_number}.txt"
+
+    def _find_document_url(self, filing: FilingMetadata) -> str:
+        """
+        Navigate to the filing index page and find the main HTML document
+
+        Raises:
+            DownloadError: If no suitable document is listed
+        """
+        try:
+            response = self._make_request(filing.document_url)
+        except FetchError as e:
+            raise DownloadError(f"Failed to fetch filing index: {e}")
+
+        soup = BeautifulSoup(response.content, 'html.parser')
+
+        # Find the link to the actual filing document (avoid iXBRL viewer)
+        doc_table = soup.find('table', {'class': 'tableFile'})
+        if not doc_table:
+            raise DownloadError("Could not find document table")
+
+        # Look for the main filing document (Type column = filing type)
+        # Prefer non-iXBRL files
+        for row in doc_table.find_all('tr')[1:]:
+            cols = row.find_all('td')
+            if len(cols) < 4:
+                continue
+
+            doc_type = cols[3].text.strip()
+            if doc_type in ['10-K', '10-Q']:
+                doc_link = cols[2].find('a')
+                if doc_link:
+                    doc_href = doc_link['href']
+                    # Skip iXBRL files (they're just viewers with JavaScript)
+                    if 'ixv' not in doc_href.lower() and 'viewer' not in doc_href.lower():
+                        return f"{self.base_url}{doc_href}"
+
+        raise DownloadError("Could not find suitable filing document")
+
     def download_filing(self, filing: FilingMetadata) -> bytes:
         """
         Download the actual filing document
@@ -294,19 +560,8 @@ class EdgarFetcher(BaseFetcher):
             self.logger.debug(f"Downloading filing {filing.accession_number}")
 
         try:
-            # SEC filing URL pattern:
-            # https://www.sec.gov/Archives/edgar/data/{CIK}/{accession_no_dashes}/{accession_no}.txt
-            # Example: https://www.sec.gov/Archives/edgar/data/320193/000032019325000079/0000320193-25-000079.txt
-
-            # Use CIK from FilingMetadata (already available)
-            cik = filing.cik
-            if not cik:
-                raise DownloadError("No CIK available in filing metadata")
-
-            accession_no_dashes = filing.accession_number.replace('-', '')
-
             # Try to download complete submission text file first
-            txt_url = f"{self.base_url}/Archives/edgar/data/{cik}/{accession_no_dashes}/{filing.accession_number}.txt"
+            txt_url = self._get_txt_url(filing)
 
             if self.logger:
                 self.logger.debug(f"Attempting to download plain text version: {txt_url}")
@@ -315,7 +570,7 @@ class EdgarFetcher(BaseFetcher):
                 response = self._make_request(txt_url)
 
                 # Verify we got actual content (not an error page)
-                if response.status_code == 200 and len(response.content) > 10000:
+                if response.status_code == 200 and len(response.content) > MIN_TEXT_FILING_BYTES:
                     if self.logger:
                         self.logger.info(
                             f"Downloaded plain text filing: {len(response.content)} bytes",
@@ -334,34 +589,7 @@ class EdgarFetcher(BaseFetcher):
                     self.logger.debug(f"Plain text download failed: {txt_error}, trying HTML")
 
             # Fallback: Navigate to filing page and find HTML document
-            response = self._make_request(filing.document_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Find the link to the actual filing document (avoid iXBRL viewer)
-            doc_table = soup.find('table', {'class': 'tableFile'})
-            if not doc_table:
-                raise DownloadError("Could not find document table")
-
-            # Look for the main filing document (Type column = filing type)
-            # Prefer non-iXBRL files
-            doc_url = None
-            for row in doc_table.find_all('tr')[1:]:
-                cols = row.find_all('td')
-                if len(cols) < 4:
-                    continue
-
-                doc_type = cols[3].text.strip()
-                if doc_type in ['10-K', '10-Q']:
-                    doc_link = cols[2].find('a')
-                    if doc_link:
-                        doc_href = doc_link['href']
-                        # Skip iXBRL files (they're just viewers with JavaScript)
-                        if 'ixv' not in doc_href.lower() and 'viewer' not in doc_href.lower():
-                            doc_url = f"{self.base_url}{doc_href}"
-                            break
-
-            if not doc_url:
-                raise DownloadError("Could not find suitable filing document")
+            doc_url = self._find_document_url(filing)
 
             # Download the actual document
             response = self._make_request(doc_url)
@@ -380,19 +608,13 @@ class EdgarFetcher(BaseFetcher):
         except Exception as e:
             raise DownloadError(f"Failed to download filing: {e}")
 
-    def upload_to_s3(self, filing: FilingMetadata, content: bytes) -> str:
+    def _get_s3_location(self, filing: FilingMetadata) -> Tuple[str, str, Dict[str, Any]]:
         """
-        Upload filing to S3 bucket
-
-        Args:
-            filing: FilingMetadata
-            content: Raw filing content
+        Build S3 bucket, key and object attributes for a filing
 
         Returns:
-            S3 URL where filing was stored
-
-        Raises:
-            UploadError: If upload fails
+            Tuple of (bucket, s3_key, extra_args) where extra_args holds
+            ContentType and Metadata
         """
         # Determine file extension based on what was downloaded
         # filing.html_url is set in download_filing() to the actual URL used
@@ -407,7 +629,33 @@ class EdgarFetcher(BaseFetcher):
             f"{filing.accession_number}{file_ext}"
         )
 
-        bucket = self.config.aws.s3_filings_bucket
+        extra_args = {
+            'ContentType': content_type,
+            'Metadata': {
+                'ticker': filing.ticker,
+                'filing_type': filing.filing_type.value,
+                'filing_date': filing.filing_date.isoformat(),
+                'accession_number': filing.accession_number
+            }
+        }
+
+        return self.config.aws.s3_filings_bucket, s3_key, extra_args
+
+    def upload_to_s3(self, filing: FilingMetadata, content: bytes) -> str:
+        """
+        Upload filing to S3 bucket
+
+        Args:
+            filing: FilingMetadata
+            content: Raw filing content
+
+        Returns:
+            S3 URL where filing was stored
+
+        Raises:
+            UploadError: If upload fails
+        """
+        bucket, s3_key, extra_args = self._get_s3_location(filing)
 
         try:
             # Upload to S3
@@ -415,13 +663,7 @@ class EdgarFetcher(BaseFetcher):
                 Bucket=bucket,
                 Key=s3_key,
                 Body=content,
-                ContentType=content_type,
-                Metadata={
-                    'ticker': filing.ticker,
-                    'filing_type': filing.filing_type.value,
-                    'filing_date': filing.filing_date.isoformat(),
-                    'accession_number': filing.accession_number
-                }
+                **extra_args
             )
 
             s3_url = f"s3://{bucket}/{s3_key}"
@@ -437,6 +679,95 @@ class EdgarFetcher(BaseFetcher):
         except ClientError as e:
             raise UploadError(f"Failed to upload to S3: {e}")
 
+    def _upload_stream(self, filing: FilingMetadata, body: '_ResponseStream') -> str:
+        """
+        Pipe a streamed SEC response into S3
+
+        Large documents go up as a multipart upload with parts sent in
+        parallel while the rest of the response is still downloading.
+
+        Raises:
+            DownloadError: If the SEC connection fails mid-stream
+            UploadError: If upload fails
+        """
+        bucket, s3_key, extra_args = self._get_s3_location(filing)
+
+        try:
+            # BufferedReader turns chunk-sized reads into the full part-sized
+            # reads s3transfer expects from non-seekable streams
+            self.s3_client.upload_fileobj(
+                io.BufferedReader(body),
+                bucket,
+                s3_key,
+                ExtraArgs=extra_args,
+                Config=S3_TRANSFER_CONFIG
+            )
+        except requests.exceptions.RequestException as e:
+            raise DownloadError(f"Failed to download filing: {e}")
+        except (ClientError, S3UploadFailedError) as e:
+            raise UploadError(f"Failed to upload to S3: {e}")
+
+        s3_url = f"s3://{bucket}/{s3_key}"
+
+        if self.logger:
+            self.logger.info(
+                f"Streamed filing to S3",
+                extra={'s3_url': s3_url, 'size_bytes': body.bytes_read, 'url': filing.html_url}
+            )
+
+        return s3_url
+
+    def download_and_upload(self, filing: FilingMetadata) -> str:
+        """
+        Stream filing from SEC EDGAR straight into S3
+
+        Picks the same document as download_filing() (plain text first, HTML
+        fallback) but never holds the whole filing in memory.
+
+        Args:
+            filing: FilingMetadata with document_url
+
+        Returns:
+            S3 URL where filing was stored
+
+        Raises:
+            DownloadError: If download fails
+            UploadError: If upload fails
+        """
+        if self.logger:
+            self.logger.debug(f"Streaming filing {filing.accession_number} to S3")
+
+        # Try to stream complete submission text file first
+        txt_url = self._get_txt_url(filing)
+
+        try:
+            with self._make_request(txt_url, stream=True) as response:
+                body = _ResponseStream(response)
+
+                # Verify we got actual content (not an error page)
+                if len(body.peek(MIN_TEXT_FILING_BYTES + 1)) > MIN_TEXT_FILING_BYTES:
+                    filing.html_url = txt_url
+                    return self._upload_stream(filing, body)
+
+            if self.logger:
+                self.logger.debug(f"Plain text file too small or not found, trying HTML")
+
+        except (FetchError, requests.exceptions.RequestException) as txt_error:
+            if self.logger:
+                self.logger.debug(f"Plain text download failed: {txt_error}, trying HTML")
+
+        # Fallback: Navigate to filing page and find HTML document
+        doc_url = self._find_document_url(filing)
+
+        try:
+            response = self._make_request(doc_url, stream=True)
+        except FetchError as e:
+            raise DownloadError(f"Failed to download filing: {e}")
+
+        with response:
+            filing.html_url = doc_url
+            return self._upload_stream(filing, _ResponseStream(response))
+
     def save_to_database(
         self,
         filing: FilingMetadata,
@@ -473,10 +804,7 @@ class EdgarFetcher(BaseFetcher):
                 raise DatabaseError(f"Company {filing.ticker} not found in database")
             company_id = company_row[0]
 
-            # Convert fiscal_period to fiscal_quarter
-            fiscal_quarter = None
-            if filing.fiscal_period and filing.fiscal_period.startswith('Q'):
-                fiscal_quarter = int(filing.fiscal_period[1])  # Extract number from 'Q1', 'Q2', etc.
+            fiscal_quarter = self._fiscal_quarter(filing)
 
             # Insert filing record (matching actual schema)
             cursor.execute("""
@@ -520,3 +848,102 @@ class EdgarFetcher(BaseFetcher):
         except Exception as e:
             self.db_connection.rollback()
             raise DatabaseError(f"Failed to save filing to database: {e}")
+
+    def save_batch_to_database(
+        self,
+        filings: List[Tuple[FilingMetadata, str]]
+    ) -> List[str]:
+        """
+        Save several filings to database with a single multi-row INSERT
+
+        Rows that collide with an existing filing (same accession number or
+        same company/type/period) are skipped rather than failing the batch.
+
+        Args:
+            filings: List of (FilingMetadata, s3_url) pairs
+
+        Returns:
+            Database IDs of created filing records
+
+        Raises:
+            DatabaseError: If save fails
+        """
+        if not self.db_connection:
+            raise DatabaseError("No database connection available")
+
+        if not filings:
+            return []
+
+        try:
+            cursor = self.db_connection.cursor()
+
+            # Resolve company_ids for all tickers at once
+            tickers = list({filing.ticker for filing, _ in filings})
+            cursor.execute(
+                "SELECT ticker, id FROM companies WHERE ticker = ANY(%s)",
+                (tickers,)
+            )
+            company_ids = dict(cursor.fetchall())
+
+            rows = []
+            for filing, s3_url in filings:
+                company_id = company_ids.get(filing.ticker)
+                if not company_id:
+                    raise DatabaseError(f"Company {filing.ticker} not found in database")
+
+                rows.append((
+                    company_id,
+                    filing.filing_type.value,
+                    filing.filing_date,
+                    filing.fiscal_year,
+                    self._fiscal_quarter(filing),
+                    filing.accession_number,
+                    filing.document_url,  # EDGAR URL
+                    s3_url,  # S3 URL for raw document
+                    'pending'  # Initial status - ready for processing
+                ))
+
+            inserted = execute_values(
+                cursor,
+                """
+                INSERT INTO filings (
+                    company_id,
+                    filing_type,
+                    filing_date,
+                    fiscal_year,
+                    fiscal_quarter,
+                    accession_number,
+                    edgar_url,
+                    raw_document_url,
+                    status
+                )
+                VALUES %s
+                ON CONFLICT DO NOTHING
+                RETURNING id
+                """,
+                rows,
+                page_size=200,
+                fetch=True
+            )
+            filing_ids = [row[0] for row in inserted]
+
+            self.db_connection.commit()
+            cursor.close()
+
+            if self.logger:
+                self.logger.info(
+                    f"Saved {len(filing_ids)}/{len(rows)} filings to database",
+                    extra={'filing_ids': filing_ids}
+                )
+
+            return filing_ids
+
+        except Exception as e:
+            self.db_connection.rollback()
+            raise DatabaseError(f"Failed to save filings to database: {e}")
+
+    def _fiscal_quarter(self, filing: FilingMetadata) -> Optional[int]:
+        """Convert fiscal_period ('Q1'..'Q4', 'FY') to fiscal_quarter (1-4 or None)"""
+        if filing.fiscal_period and filing.fiscal_period.startswith('Q'):
+            return int(filing.fiscal_period[1])  # Extract number from 'Q1', 'Q2', etc.
+        return None
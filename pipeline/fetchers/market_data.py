@@ -46,11 +46,11 @@ class MarketDataFetcher:
 
     def _rate_limit(self):
         """Enforce Finnhub rate limit (60 requests/minute for free tier)"""
-        elapsed = time.time() - self.last_request_time
+        elapsed = time.monotonic() - self.last_request_time
         if elapsed < self.min_request_interval:
             sleep_time = self.min_request_interval - elapsed
             time.sleep(sleep_time)
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
 
     def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """
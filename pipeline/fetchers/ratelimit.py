@@ -0,0 +1,66 @@
+"""
+Rate limiting for SEC EDGAR requests
+
+Provides a thread-safe token bucket for keeping outbound request rates
+within third-party API policies (e.g. SEC EDGAR's 10 requests/second).
+"""
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter
+
+    Tokens refill continuously at `rate` per second up to `burst`. Each
+    request consumes one token; callers block until a token is available.
+
+    Usage:
+        bucket = TokenBucket(rate=9, burst=10)
+        bucket.acquire()
+        requests.get(...)
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Initialize token bucket
+
+        Args:
+            rate: Tokens added per second (sustained request rate)
+            burst: Maximum tokens held (largest instantaneous burst)
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Add tokens accrued since the last refill (caller holds the lock)"""
+        elapsed = now - self._last_refill
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._last_refill = now
+
+    def acquire(self, n: int = 1):
+        """
+        Block until n tokens are available, then consume them
+
+        Args:
+            n: Number of tokens to consume (must not exceed burst)
+        """
+        if n > self.burst:
+            raise ValueError(f"Cannot acquire {n} tokens from a bucket of {self.burst}")
+
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= n:
+                    self._tokens -= n
+                    return
+                wait_time = (n - self._tokens) / self.rate
+
+            # Sleep outside the lock so other threads can refill/check
+            time.sleep(wait_time)
@@ -95,7 +95,8 @@ class BaseGenerator(ABC):
         self,
         content_id: str,
         format: ContentFormat,
-        options: Optional[Dict[str, Any]] = None
+        options: Optional[Dict[str, Any]] = None,
+        content: Optional[Dict[str, Any]] = None
     ) -> GeneratedContent:
         """
         Generate content in specified format
@@ -104,6 +105,7 @@ class BaseGenerator(ABC):
             content_id: Database ID of content
             format: Output format to generate
             options: Format-specific options
+            content: Result of fetch_content(), if already fetched
 
         Returns:
             GeneratedContent with formatted output
@@ -167,7 +169,9 @@ class BaseGenerator(ABC):
         self,
         content_id: str,
         formats: List[ContentFormat],
-        options: Optional[Dict[str, Any]] = None
+        options: Optional[Dict[str, Any]] = None,
+        content: Optional[Dict[str, Any]] = None,
+        save: bool = True
     ) -> Dict[ContentFormat, GeneratedContent]:
         """
         Generate content in multiple formats
@@ -176,11 +180,15 @@ class BaseGenerator(ABC):
             content_id: Database ID of content
             formats: List of formats to generate
             options: Format-specific options
+            content: Result of fetch_content(), if already fetched
+            save: Save each format to the database; pass False to only
+                render and save the results in bulk yourself
 
         Returns:
             Dictionary mapping format to GeneratedContent
 
         This is a convenience method for generating multiple formats at once.
+        The content is fetched once and shared by every format.
         """
         if self.logger:
             self.logger.info(
@@ -190,10 +198,22 @@ class BaseGenerator(ABC):
 
         results = {}
 
+        if content is None:
+            try:
+                content = self.fetch_content(content_id)
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(
+                        f"Failed to fetch content",
+                        exception=e,
+                        extra={'content_id': content_id}
+                    )
+                return results
+
         for format in formats:
             try:
                 # Generate content
-                generated = self.generate(content_id, format, options)
+                generated = self.generate(content_id, format, options, content=content)
 
                 # Validate
                 if not self.validate_format(generated):
@@ -205,7 +225,8 @@ class BaseGenerator(ABC):
                     continue
 
                 # Save to database
-                self.save_to_database(content_id, generated)
+                if save:
+                    self.save_to_database(content_id, generated)
 
                 results[format] = generated
 
@@ -6,8 +6,11 @@ Transforms analyzed content into styled HTML blog posts.
 from typing import Dict, Any, Optional, List
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+from psycopg2.pool import ThreadedConnectionPool
+
 from .base import (
     BaseGenerator,
     GeneratedContent,
@@ -17,6 +20,41 @@ from .base import (
     DatabaseError
 )
 
+try:
+    from ..utils.db import create_connection_pool
+except ImportError:
+    # pipeline/main.py puts pipeline/ on sys.path and imports generators
+    # and utils as top-level packages
+    from utils.db import create_connection_pool
+
+
+# Columns fetch_content() reads, in the order content_from_row() expects.
+# Callers that stream pending content select these too, so workers get
+# their inputs with the listing instead of a query per item.
+CONTENT_COLUMNS = """
+    c.executive_summary,
+    c.key_takeaways,
+    c.deep_dive_opportunities,
+    c.deep_dive_risks,
+    c.deep_dive_strategy,
+    c.implications,
+    c.published_at,
+    co.ticker,
+    f.filing_type,
+    f.fiscal_year,
+    f.fiscal_quarter,
+    f.filing_date,
+    co.name as company_name
+"""
+
+# Content with its filing and company info
+CONTENT_QUERY = f"""
+    SELECT {CONTENT_COLUMNS}
+    FROM content c
+    JOIN filings f ON c.filing_id = f.id
+    JOIN companies co ON f.company_id = co.id
+"""
+
 
 class BlogGenerator(BaseGenerator):
     """
@@ -56,71 +94,65 @@ class BlogGenerator(BaseGenerator):
             cursor = self.db_connection.cursor()
 
             # Fetch content with filing and company info
-            cursor.execute("""
-                SELECT
-                    c.executive_summary,
-                    c.key_takeaways,
-                    c.deep_dive_opportunities,
-                    c.deep_dive_risks,
-                    c.deep_dive_strategy,
-                    c.implications,
-                    c.published_at,
-                    co.ticker,
-                    f.filing_type,
-                    f.fiscal_year,
-                    f.fiscal_quarter,
-                    f.filing_date,
-                    co.name as company_name
-                FROM content c
-                JOIN filings f ON c.filing_id = f.id
-                JOIN companies co ON f.company_id = co.id
-                WHERE c.id = %s
-            """, (content_id,))
-
+            cursor.execute(CONTENT_QUERY + " WHERE c.id = %s", (content_id,))
             row = cursor.fetchone()
             cursor.close()
 
             if not row:
                 raise FetchError(f"Content {content_id} not found")
 
-            # Extract data from JSONB key_takeaways
-            key_takeaways = row[1] if isinstance(row[1], dict) else {}
-
-            # Convert fiscal_quarter to fiscal_period format
-            fiscal_quarter = row[10]
-            fiscal_period = f'Q{fiscal_quarter}' if fiscal_quarter else 'FY'
-
-            return {
-                'executive_summary': row[0],
-                'tldr_headline': key_takeaways.get('headline', ''),
-                'tldr_summary': row[0][:500] if row[0] else '',  # First 500 chars
-                'tldr_key_points': key_takeaways.get('points', []),
-                'deep_headline': key_takeaways.get('headline', ''),
-                'deep_intro': row[0],  # executive_summary
-                'deep_sections': [],  # Parsed from deep_dive_strategy
-                'deep_conclusion': row[5],  # implications
-                'key_metrics': key_takeaways.get('metrics', {}),
-                'sentiment_score': key_takeaways.get('sentiment'),
-                'risk_factors': row[3].split('\n\n') if row[3] else [],
-                'opportunities': row[2].split('\n\n') if row[2] else [],
-                'deep_dive_strategy': row[4],
-                'published_at': row[6],
-                'ticker': row[7],
-                'filing_type': row[8],
-                'fiscal_year': row[9],
-                'fiscal_period': fiscal_period,
-                'filing_date': row[11],
-                'company_name': row[12]
-            }
+            return self.content_from_row(row)
 
         except Exception as e:
             raise FetchError(f"Failed to fetch content: {e}")
 
+    @staticmethod
+    def content_from_row(row: tuple) -> Dict[str, Any]:
+        """
+        Build the fetch_content() dictionary from a CONTENT_COLUMNS row
+
+        Args:
+            row: Row selecting CONTENT_COLUMNS, in order
+
+        Returns:
+            Dictionary with content fields
+        """
+        # Extract data from JSONB key_takeaways
+        key_takeaways = row[1] if isinstance(row[1], dict) else {}
+
+        # Convert fiscal_quarter to fiscal_period format
+        fiscal_quarter = row[10]
+        fiscal_period = f'Q{fiscal_quarter}' if fiscal_quarter else 'FY'
+
+        return {
+            'executive_summary': row[0],
+            'tldr_headline': key_takeaways.get('headline', ''),
+            'tldr_summary': row[0][:500] if row[0] else '',  # First 500 chars
+            'tldr_key_points': key_takeaways.get('points', []),
+            'deep_headline': key_takeaways.get('headline', ''),
+            'deep_intro': row[0],  # executive_summary
+            'deep_sections': [],  # Parsed from deep_dive_strategy
+            'deep_conclusion': row[5],  # implications
+            'key_metrics': key_takeaways.get('metrics', {}),
+            'sentiment_score': key_takeaways.get('sentiment'),
+            'risk_factors': row[3].split('\n\n') if row[3] else [],
+            'opportunities': row[2].split('\n\n') if row[2] else [],
+            'deep_dive_strategy': row[4],
+            'published_at': row[6],
+            'ticker': row[7],
+            'filing_type': row[8],
+            'fiscal_year': row[9],
+            'fiscal_period': fiscal_period,
+            'filing_date': row[11],
+            'company_name': row[12]
+        }
+
     def generate(
         self,
         content_id: str,
         format: ContentFormat,
-        options: Optional[Dict[str, Any]] = None
+        options: Optional[Dict[str, Any]] = None,
+        content: Optional[Dict[str, Any]] = None
     ) -> GeneratedContent:
         """
         Generate content in specified format
@@ -129,6 +161,7 @@ class BlogGenerator(BaseGenerator):
             content_id: Database ID of content
             format: Output format (BLOG_POST_HTML or EMAIL_HTML)
             options: Format options (include_toc, style)
+            content: Result of fetch_content(), if already fetched
 
         Returns:
             GeneratedContent with HTML
@@ -144,8 +177,9 @@ class BlogGenerator(BaseGenerator):
         style = options.get('style', 'default')
 
         try:
-            # Fetch content
-            content = self.fetch_content(content_id)
+            # Fetch content unless the caller already has it
+            if content is None:
+                content = self.fetch_content(content_id)
 
             # Generate appropriate HTML based on format
             if format == ContentFormat.BLOG_POST_HTML:
@@ -1160,14 +1194,42 @@ class BlogGenerator(BaseGenerator):
         except Exception as e:
             raise DatabaseError(f"Failed to get pending generations: {e}")
 
+    def _generate_item(
+        self,
+        pool: ThreadedConnectionPool,
+        item: Dict[str, Any],
+        formats: List[ContentFormat]
+    ):
+        """
+        Generate and save all formats for one pending item on a worker thread
+
+        Borrows its own connection so concurrent workers never share a
+        transaction.
+        """
+        conn = pool.getconn()
+        try:
+            worker = type(self)(self.config, conn, self.logger)
+            for fmt in formats:
+                generated_content = worker.generate(item['content_id'], format=fmt)
+                # Save the generated content to the database
+                worker.save_to_database(item['content_id'], generated_content)
+        finally:
+            pool.putconn(conn)
+
     def generate_batch(self, limit: Optional[int] = None, formats: List[str] = None, workers: int = 3) -> Dict[str, int]:
         """
         Generate content for a batch of pending items
 
+        Generation is I/O bound: rendering a filing takes well under a
+        millisecond of CPU, while fetching and saving it are several database
+        round trips. Items therefore run on a thread pool, each worker with
+        its own pooled connection; a process pool would only add pickling
+        and reconnect overhead.
+
         Args:
             limit: Maximum number of items to generate (None = all pending)
             formats: List of formats to generate ('blog', 'email', etc.)
-            workers: Number of parallel workers (currently not used, for future parallelization)
+            workers: Number of items generated concurrently
 
         Returns:
             Dictionary with keys 'generated' and 'failed'
@@ -1191,21 +1253,32 @@ class BlogGenerator(BaseGenerator):
         generated_count = 0
         failed_count = 0
 
-        for idx, item in enumerate(items, 1):
-            try:
-                # Generate each format for this content
-                for fmt in supported_formats:
-                    generated_content = self.generate(item['content_id'], format=fmt)
-                    # Save the generated content to the database
-                    self.save_to_database(item['content_id'], generated_content)
-
-                generated_count += 1
-                print(f"  [{idx}/{len(items)}] ✓ {item['ticker']} ({item['filing_type']}) generated successfully")
-            except Exception as e:
-                failed_count += 1
-                error_msg = str(e)[:200]  # Truncate long errors
-                print(f"  [{idx}/{len(items)}] ✗ {item['ticker']} ({item['filing_type']}) - {error_msg}")
-                if self.logger:
-                    self.logger.error(f"Failed to generate {item['ticker']}: {e}")
+        if not items:
+            return {'generated': generated_count, 'failed': failed_count}
+
+        workers = max(1, min(workers, len(items)))
+        pool = create_connection_pool(self.config, min_size=1, max_size=workers)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self._generate_item, pool, item, supported_formats): item
+                    for item in items
+                }
+
+                for idx, future in enumerate(as_completed(futures), 1):
+                    item = futures[future]
+                    try:
+                        future.result()
+                        generated_count += 1
+                        print(f"  [{idx}/{len(items)}] ✓ {item['ticker']} ({item['filing_type']}) generated successfully")
+                    except Exception as e:
+                        failed_count += 1
+                        error_msg = str(e)[:200]  # Truncate long errors
+                        print(f"  [{idx}/{len(items)}] ✗ {item['ticker']} ({item['filing_type']}) - {error_msg}")
+                        if self.logger:
+                            self.logger.error(f"Failed to generate {item['ticker']}: {e}")
+        finally:
+            pool.closeall()
 
         return {'generated': generated_count, 'failed': failed_count}
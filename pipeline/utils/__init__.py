@@ -2,7 +2,8 @@
 Utilities for 10KAY pipeline
 """
 from .config import get_config, PipelineConfig, AWSConfig, DatabaseConfig, SECConfig
-from .logging import PipelineLogger, setup_root_logger, LogLevel
+from .logging import PipelineLogger, setup_root_logger, queued_logger, LogLevel
+from .db import get_db_connection, create_connection_pool, pooled_connection, execute_prepared
 
 __all__ = [
     'get_config',
@@ -12,5 +13,10 @@ __all__ = [
     'SECConfig',
     'PipelineLogger',
     'setup_root_logger',
-    'LogLevel'
+    'queued_logger',
+    'LogLevel',
+    'get_db_connection',
+    'create_connection_pool',
+    'pooled_connection',
+    'execute_prepared'
 ]
@@ -5,6 +5,7 @@ Loads environment variables and provides typed configuration objects
 for different parts of the pipeline.
 """
 import os
+import threading
 from dataclasses import dataclass
 from typing import Optional
 from dotenv import load_dotenv
@@ -22,6 +23,8 @@ class AWSConfig:
     s3_filings_bucket: str
     s3_audio_bucket: str
     bedrock_model_id: str
+    bedrock_batch_bucket: str
+    bedrock_batch_role_arn: Optional[str]
 
     @classmethod
     def from_env(cls) -> 'AWSConfig':
@@ -32,7 +35,11 @@ class AWSConfig:
             secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
             s3_filings_bucket=os.getenv('S3_BUCKET_FILINGS', '10kay-filings'),
             s3_audio_bucket=os.getenv('S3_BUCKET_AUDIO', '10kay-audio'),
-            bedrock_model_id=os.getenv('AWS_BEDROCK_MODEL_ID', 'us.anthropic.claude-sonnet-4-5-20250929-v1:0')
+            bedrock_model_id=os.getenv('AWS_BEDROCK_MODEL_ID', 'us.anthropic.claude-sonnet-4-5-20250929-v1:0'),
+            # Batch inference reads prompts from and writes results to S3,
+            # as a role Bedrock assumes (needs access to this bucket)
+            bedrock_batch_bucket=os.getenv('BEDROCK_BATCH_BUCKET', os.getenv('S3_BUCKET_FILINGS', '10kay-filings')),
+            bedrock_batch_role_arn=os.getenv('BEDROCK_BATCH_ROLE_ARN')
         )
 
 
@@ -97,6 +104,8 @@ class PipelineConfig:
     dry_run: bool
     max_retries: int
     retry_delay: float  # seconds
+    cache_dir: Optional[str]  # local cache root; None disables it
+    cache_size_mb: int
 
     @classmethod
     def from_env(cls) -> 'PipelineConfig':
@@ -108,17 +117,27 @@ class PipelineConfig:
             finnhub=FinnhubConfig.from_env(),
             dry_run=os.getenv('DRY_RUN', 'false').lower() == 'true',
             max_retries=int(os.getenv('MAX_RETRIES', '3')),
-            retry_delay=float(os.getenv('RETRY_DELAY', '2.0'))
+            retry_delay=float(os.getenv('RETRY_DELAY', '2.0')),
+            cache_dir=os.getenv('PIPELINE_CACHE_DIR', os.path.expanduser('~/.cache/10kay')) or None,
+            cache_size_mb=int(os.getenv('PIPELINE_CACHE_SIZE_MB', '2048'))
         )
 
 
 # Global config instance
 _config: Optional[PipelineConfig] = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> PipelineConfig:
-    """Get global pipeline configuration (singleton)"""
+    """
+    Get global pipeline configuration (singleton)
+
+    Built once per process; orchestrate_parallel runs the analyze and
+    generate phases on concurrent threads, so construction is locked.
+    """
     global _config
     if _config is None:
-        _config = PipelineConfig.from_env()
+        with _config_lock:
+            if _config is None:
+                _config = PipelineConfig.from_env()
     return _config
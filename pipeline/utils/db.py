@@ -0,0 +1,122 @@
+"""
+Database connection helpers for 10KAY pipeline
+
+Provides a thread-safe connection pool so concurrent workers can reuse
+PostgreSQL connections instead of paying a TCP+TLS+auth handshake per task.
+"""
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Optional, Sequence
+
+import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
+
+from .config import get_config
+
+
+# libpq keepalive settings so idle pooled connections survive NAT/RDS timeouts
+KEEPALIVE_KWARGS = {
+    'keepalives': 1,
+    'keepalives_idle': 30,
+    'keepalives_interval': 10,
+    'keepalives_count': 5
+}
+
+# Statement names PREPAREd on each connection. Prepared statements last for
+# the session, so statements run on long-lived (pooled) connections are
+# parsed and planned once rather than on every execution.
+_prepared = weakref.WeakKeyDictionary()
+_prepared_lock = threading.Lock()
+
+
+def get_db_connection(config=None):
+    """
+    Open a single database connection
+
+    Args:
+        config: PipelineConfig instance (defaults to get_config())
+
+    Returns:
+        psycopg2 connection to config.database.url
+    """
+    config = config or get_config()
+    return psycopg2.connect(config.database.url, **KEEPALIVE_KWARGS)
+
+
+def create_connection_pool(config, min_size: int, max_size: int) -> ThreadedConnectionPool:
+    """
+    Create a thread-safe connection pool
+
+    Args:
+        config: PipelineConfig instance
+        min_size: Connections opened up front
+        max_size: Maximum connections the pool will hand out
+
+    Returns:
+        ThreadedConnectionPool connected to config.database.url
+    """
+    return ThreadedConnectionPool(
+        min_size,
+        max_size,
+        config.database.url,
+        **KEEPALIVE_KWARGS
+    )
+
+
+def execute_prepared(
+    cursor,
+    name: str,
+    sql: str,
+    params: Optional[Sequence] = None,
+    param_types: Sequence[str] = ()
+):
+    """
+    Execute sql as a named prepared statement, preparing it on first use
+
+    Args:
+        cursor: psycopg2 cursor
+        name: Statement name, unique per connection
+        sql: Statement text, with $1, $2, ... placeholders
+        params: Values for the placeholders
+        param_types: SQL type of each placeholder, e.g. 'uuid[]'
+
+    Usage:
+        execute_prepared(cursor, 'filing_by_id',
+                         "SELECT * FROM filings WHERE id = $1", (filing_id,), ('uuid',))
+    """
+    with _prepared_lock:
+        prepared = _prepared.setdefault(cursor.connection, set())
+        is_prepared = name in prepared
+
+    if not is_prepared:
+        signature = f"({', '.join(param_types)})" if param_types else ''
+        cursor.execute(f"PREPARE {name}{signature} AS {sql}")
+        with _prepared_lock:
+            prepared.add(name)
+
+    if param_types:
+        # Cast each value so psycopg2's literals (text, ARRAY[...]) bind to
+        # the declared parameter types
+        args = ', '.join(f"%s::{param_type}" for param_type in param_types)
+        cursor.execute(f"EXECUTE {name}({args})", params)
+    else:
+        cursor.execute(f"EXECUTE {name}")
+
+
+@contextmanager
+def pooled_connection(pool: ThreadedConnectionPool):
+    """
+    Borrow a connection from the pool for the duration of a with-block
+
+    Usage:
+        with pooled_connection(pool) as conn:
+            cursor = conn.cursor()
+            ...
+    """
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        # putconn() rolls back any transaction the caller left open
+        pool.putconn(conn)
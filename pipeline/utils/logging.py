@@ -4,7 +4,10 @@ Logging utilities for 10KAY pipeline
 Provides structured logging with context and integration with processing_logs table.
 """
 import logging
+import logging.handlers
+import queue
 import sys
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Optional, Dict, Any
 from enum import Enum
@@ -147,16 +150,60 @@ class PipelineLogger:
         self._log(LogLevel.CRITICAL, message, extra, exception)
 
 
+_root_logger_configured = False
+
+
 def setup_root_logger(level: str = 'INFO'):
     """
     Setup root logger for the entire pipeline
 
+    Only the first call takes effect; later calls (e.g. from scripts
+    imported by an orchestrator) are no-ops.
+
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
+    global _root_logger_configured
+    if _root_logger_configured:
+        return
+    _root_logger_configured = True
+
     logging.basicConfig(
         level=getattr(logging, level.upper()),
         format='%(asctime)s | %(name)s | %(levelname)s | %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S',
         handlers=[logging.StreamHandler(sys.stdout)]
     )
+
+
+@contextmanager
+def queued_logger(name: str, fmt: str = '%(message)s'):
+    """
+    Logger whose output is written to stdout by a background thread
+
+    Callers only enqueue records, so hot loops (e.g. progress lines from
+    completed workers) never block on terminal I/O. Pending records are
+    flushed when the with-block exits.
+
+    Usage:
+        with queued_logger('progress') as progress:
+            progress.info('[  1] done')
+    """
+    log_queue = queue.Queue(-1)
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter(fmt))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+    # Keep records out of the root logger's synchronous stdout handler
+    logger.propagate = False
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+
+    listener.start()
+    try:
+        yield logger
+    finally:
+        logger.removeHandler(queue_handler)
+        listener.stop()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Evict stale entries from the Bedrock response cache.
+
+bedrock_cache (migration 012) gains a row for every distinct analysis
+request and is never cleared by the pipeline itself. This removes entries
+that have not been used within --max-age-days, then, if --max-entries is
+set, the least recently used entries beyond that count. last_used_at comes
+from migration 015.
+
+Usage:
+    python3 scripts/prune_bedrock_cache.py                    # Drop entries unused for 90 days
+    python3 scripts/prune_bedrock_cache.py --max-entries 5000 # Also cap the table at 5000 rows
+    python3 scripts/prune_bedrock_cache.py --dry-run          # Report without deleting
+"""
+
+import sys
+import os
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+script_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(script_dir))
+os.chdir(script_dir)
+
+import psycopg2
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv('.env.local')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evict stale Bedrock cache entries")
+    parser.add_argument(
+        '--max-age-days',
+        type=int,
+        default=90,
+        help='Drop entries not used for this many days (default: 90)'
+    )
+    parser.add_argument(
+        '--max-entries',
+        type=int,
+        default=None,
+        help='Keep at most this many of the most recently used entries'
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Report what would be deleted without deleting'
+    )
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("Bedrock Cache Pruning")
+    print("=" * 80)
+    print()
+
+    DATABASE_URL = os.getenv('DATABASE_URL')
+    if not DATABASE_URL:
+        print("ERROR: DATABASE_URL not found in environment")
+        sys.exit(1)
+
+    conn = psycopg2.connect(DATABASE_URL)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("SELECT COUNT(*) FROM bedrock_cache")
+        total = cursor.fetchone()[0]
+        print(f"Cached responses: {total}")
+
+        cursor.execute("""
+            DELETE FROM bedrock_cache
+            WHERE last_used_at < NOW() - make_interval(days => %s)
+        """, (args.max_age_days,))
+        expired = cursor.rowcount
+        print(f"Unused for {args.max_age_days}+ days: {expired}")
+
+        evicted = 0
+        if args.max_entries is not None:
+            cursor.execute("""
+                DELETE FROM bedrock_cache
+                WHERE prompt_sha IN (
+                    SELECT prompt_sha FROM bedrock_cache
+                    ORDER BY last_used_at DESC
+                    OFFSET %s
+                )
+            """, (args.max_entries,))
+            evicted = cursor.rowcount
+            print(f"Least recently used beyond {args.max_entries}: {evicted}")
+
+        if args.dry_run:
+            conn.rollback()
+            print(f"\nDRY-RUN: would delete {expired + evicted} entries")
+        else:
+            conn.commit()
+            print(f"\n✓ Deleted {expired + evicted} entries, {total - expired - evicted} remain")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"\n✗ Pruning failed: {e}")
+        sys.exit(1)
+    finally:
+        cursor.close()
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()